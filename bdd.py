@@ -0,0 +1,299 @@
+"""
+Diagramas de decisión binarios reducidos y ordenados (ROBDD)
+============================================================
+
+Representación canónica de las proposiciones:
+- Tabla única de nodos: dos fórmulas equivalentes construidas en el mismo
+  diagrama son el mismo nodo, así que compararlas cuesta O(1)
+- Operación ITE memoizada para combinar diagramas
+- Orden de variables configurable
+- Conteo de modelos y tablas de verdad sin enumerar las filas
+"""
+
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple  # Importa tipos para anotaciones
+from formula import Formula, Atom, Not, postorder, variable_column  # Importa los nodos del árbol de fórmulas y las columnas de bits
+
+# Nodos terminales
+FALSE = 0
+TRUE = 1
+
+# Resultado de cada conector para (p, q) = (V, V), (V, F), (F, V), (F, F), por símbolo
+SYMBOL_TABLES = {
+    "∧": (True, False, False, False),
+    "∨": (True, True, True, False),
+    "→": (True, False, True, True),
+    "↔": (True, False, False, True)
+}
+
+
+class BDD:
+    """
+    Administrador de diagramas de decisión binarios reducidos y ordenados.
+
+    Todos los diagramas creados con el mismo administrador comparten nodos.
+    Un nodo es un entero: 0 y 1 son los terminales y el resto son índices en
+    la tabla de nodos (nivel, hijo_falso, hijo_verdadero).
+
+    Attributes:
+        variables (List[str]): Proposiciones atómicas en el orden del diagrama
+    """
+
+    def __init__(self, order: Optional[Sequence[str]] = None,
+                 evaluate: Optional[Callable[[Tuple[bool, bool], str, List[bool]], bool]] = None):
+        """
+        Inicializa un administrador vacío.
+
+        Args:
+            order (Optional[Sequence[str]]): Orden inicial de las variables; las
+                proposiciones nuevas se agregan al final en orden de aparición
+            evaluate (Optional[Callable]): Semántica de los conectores, con la
+                firma de InterpreteLógico.evaluate_expression; si es None se usa
+                el símbolo lógico de cada conector
+        """
+        self.variables = []  # Nombre de la variable de cada nivel
+        self._levels = {}  # Nivel de cada variable
+        self._nodes = [(None, None, None), (None, None, None)]  # Terminales en las posiciones 0 y 1
+        self._unique = {}  # (nivel, bajo, alto) -> nodo
+        self._ite_cache = {}  # (f, g, h) -> nodo
+        self._evaluate = evaluate  # Semántica de los conectores
+        self._operations = {}  # Tabla de cada tipo de conector
+        for name in order or ():
+            self.var(name)
+
+    def __len__(self) -> int:
+        """Número de nodos internos del administrador."""
+        return len(self._nodes) - 2
+
+    def _level(self, node: int) -> int:
+        """Nivel de un nodo; los terminales van después de todas las variables."""
+        return self._nodes[node][0] if node > TRUE else len(self.variables)
+
+    def _make(self, level: int, low: int, high: int) -> int:
+        """
+        Devuelve el nodo (nivel, bajo, alto) aplicando las reglas de reducción.
+
+        Args:
+            level (int): Nivel de la variable
+            low (int): Hijo para el valor falso
+            high (int): Hijo para el valor verdadero
+
+        Returns:
+            int: Nodo único
+        """
+        if low == high:  # La variable no influye
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:  # Nodo nuevo
+            node = len(self._nodes)
+            self._nodes.append(key)
+            self._unique[key] = node
+        return node
+
+    def var(self, name: str) -> int:
+        """
+        Devuelve el diagrama de una proposición atómica.
+
+        Args:
+            name (str): Texto de la proposición
+
+        Returns:
+            int: Nodo de la variable
+        """
+        level = self._levels.get(name)
+        if level is None:  # Variable nueva al final del orden
+            level = len(self.variables)
+            self.variables.append(name)
+            self._levels[name] = level
+        return self._make(level, FALSE, TRUE)
+
+    def _cofactors(self, node: int, level: int) -> Tuple[int, int]:
+        """Hijos de un nodo respecto de la variable del nivel dado."""
+        if node > TRUE and self._nodes[node][0] == level:
+            return self._nodes[node][1], self._nodes[node][2]
+        return node, node
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """
+        Calcula "si f entonces g si no h" con memoización.
+
+        Args:
+            f (int): Condición
+            g (int): Resultado cuando f es verdadera
+            h (int): Resultado cuando f es falsa
+
+        Returns:
+            int: Nodo del resultado
+        """
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+        key = (f, g, h)
+        result = self._ite_cache.get(key)
+        if result is not None:
+            return result
+        level = min(self._level(f), self._level(g), self._level(h))  # Variable superior
+        f0, f1 = self._cofactors(f, level)
+        g0, g1 = self._cofactors(g, level)
+        h0, h1 = self._cofactors(h, level)
+        result = self._make(level, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+        self._ite_cache[key] = result
+        return result
+
+    def negate(self, f: int) -> int:
+        """Diagrama de ¬f."""
+        return self.ite(f, FALSE, TRUE)
+
+    def apply(self, table: Tuple[bool, bool, bool, bool], f: int, g: int) -> int:
+        """
+        Combina dos diagramas con un conector dado por su tabla de verdad.
+
+        Args:
+            table (Tuple[bool, bool, bool, bool]): Resultado para (V, V), (V, F), (F, V), (F, F)
+            f (int): Operando izquierdo
+            g (int): Operando derecho
+
+        Returns:
+            int: Nodo del resultado
+        """
+        when_true = self._select(g, table[0], table[1])  # Resultado si f es verdadera
+        when_false = self._select(g, table[2], table[3])  # Resultado si f es falsa
+        return self.ite(f, when_true, when_false)
+
+    def _select(self, g: int, if_true: bool, if_false: bool) -> int:
+        """Diagrama que vale if_true cuando g es verdadera e if_false si no."""
+        if if_true == if_false:
+            return TRUE if if_true else FALSE
+        return g if if_true else self.negate(g)
+
+    def _operation(self, connector_type: str, symbol: str) -> Tuple[bool, bool, bool, bool]:
+        """
+        Tabla de verdad de un conector según la semántica configurada.
+
+        Args:
+            connector_type (str): Tipo de conector
+            symbol (str): Símbolo lógico (se usa si no hay semántica configurada)
+
+        Returns:
+            Tuple[bool, bool, bool, bool]: Resultado para (V, V), (V, F), (F, V), (F, F)
+        """
+        key = connector_type or symbol  # Los nodos sin tipo se identifican por su símbolo
+        table = self._operations.get(key)
+        if table is None:
+            if self._evaluate is not None and connector_type:
+                table = tuple(bool(self._evaluate((p, q), connector_type, [False, False]))
+                              for p, q in ((True, True), (True, False), (False, True), (False, False)))
+            else:
+                table = SYMBOL_TABLES[symbol]
+            self._operations[key] = table
+        return table
+
+    def from_formula(self, node: Formula) -> int:
+        """
+        Construye el diagrama de una fórmula, sin recursión sobre el árbol.
+
+        Args:
+            node (Formula): Raíz de la fórmula
+
+        Returns:
+            int: Nodo del diagrama
+        """
+        values = []  # Diagramas de los subárboles pendientes
+        for current, _ in postorder(node, chains=False):  # Cada conector con su propia semántica
+            if isinstance(current, Atom):
+                values.append(self.var(current.name))
+            elif isinstance(current, Not):
+                values.append(self.negate(values.pop()))
+            else:
+                right = values.pop()
+                left = values.pop()
+                values.append(self.apply(self._operation(current.connector_type, current.symbol), left, right))
+        return values[0]
+
+    def support(self, node: int) -> List[str]:
+        """
+        Variables de las que depende realmente un diagrama.
+
+        Args:
+            node (int): Nodo del diagrama
+
+        Returns:
+            List[str]: Nombres en el orden del diagrama
+        """
+        levels = set()
+        stack, seen = [node], set()
+        while stack:
+            current = stack.pop()
+            if current <= TRUE or current in seen:
+                continue
+            seen.add(current)
+            level, low, high = self._nodes[current]
+            levels.add(level)
+            stack += [low, high]
+        return [self.variables[level] for level in sorted(levels)]
+
+    def sat_count(self, node: int, variables: Optional[Iterable[str]] = None) -> int:
+        """
+        Cuenta las asignaciones que hacen verdadero el diagrama sin enumerarlas.
+
+        Args:
+            node (int): Nodo del diagrama
+            variables (Optional[Iterable[str]]): Variables sobre las que se
+                cuenta (deben incluir las del soporte); por defecto, todas las
+                del administrador
+
+        Returns:
+            int: Número de modelos
+        """
+        total = len(self.variables)
+        counts = {FALSE: 0, TRUE: 1}  # Modelos desde el nivel del nodo hasta el final
+
+        def count(current: int) -> int:
+            if current in counts:
+                return counts[current]
+            level, low, high = self._nodes[current]
+            result = (count(low) << (self._level(low) - level - 1)) + \
+                     (count(high) << (self._level(high) - level - 1))
+            counts[current] = result
+            return result
+
+        models = count(node) << self._level(node)  # Variables por encima de la raíz
+        if variables is None:
+            return models
+        variables = set(variables)
+        known = len(variables & self._levels.keys())  # Variables pedidas que existen en el diagrama
+        return (models >> (total - known)) << (len(variables) - known)  # Ajusta a las variables pedidas
+
+    def truth_column(self, node: int, variables: Sequence[str]) -> int:
+        """
+        Genera la columna de resultados de la tabla de verdad desde el diagrama.
+
+        Args:
+            node (int): Nodo del diagrama
+            variables (Sequence[str]): Variables de la tabla en orden de columnas
+                (deben incluir las del soporte)
+
+        Returns:
+            int: Columna de 2**len(variables) bits (ver formula.variable_column)
+        """
+        count = len(variables)
+        mask = (1 << (1 << count)) - 1  # Todas las filas
+        columns = {self._levels[name]: variable_column(i, count)
+                   for i, name in enumerate(variables) if name in self._levels}
+        results = {FALSE: 0, TRUE: mask}
+
+        def column(current: int) -> int:
+            if current in results:
+                return results[current]
+            level, low, high = self._nodes[current]
+            selector = columns[level]
+            result = (selector & column(high)) | ((selector ^ mask) & column(low))
+            results[current] = result
+            return result
+
+        return column(node)
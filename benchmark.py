@@ -0,0 +1,276 @@
+"""
+Pruebas de rendimiento del intérprete
+=====================================
+
+Mide cada etapa del análisis sobre un corpus sintético reproducible:
+- Generador de proposiciones en español con semilla que usa todas las
+  palabras de KEY_WORDS y NEGATIONS, con longitud, número de átomos y
+  anidamiento variables
+- Rendimiento (operaciones por segundo), percentiles de latencia y memoria
+  máxima de cada etapa, en formato JSON
+- Comparación con una medición guardada que señala las regresiones
+
+Uso:
+    python benchmark.py -n 2000 -o base.json
+    python benchmark.py -n 2000 --baseline base.json
+"""
+
+import argparse  # Importa el analizador de argumentos de la línea de comandos
+import json  # Importa la serialización a JSON
+import platform  # Importa los datos de la plataforma para el informe
+import random  # Importa el generador pseudoaleatorio con semilla
+import sys  # Importa la salida estándar
+import time  # Importa el reloj de alta resolución
+import tracemalloc  # Importa la medición de memoria
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple  # Importa tipos de datos para anotaciones
+from interpreter import InterpreteLógico, KEY_WORDS, NEGATIONS  # Importa el intérprete y sus tablas de palabras
+
+# Proposiciones atómicas del corpus (sin palabras clave ni negaciones dentro)
+ATOMS = (
+    "llueve", "hace frío", "hace sol", "el suelo está seco", "me mojo",
+    "estudia", "aprueba el examen", "duerme mucho", "está cansado",
+    "vamos al parque", "come temprano", "la luz está encendida",
+    "el tren llega tarde", "leemos un libro", "salimos de casa",
+    "el perro ladra", "la puerta está abierta", "suena la alarma",
+    "el café está caliente", "gana el partido", "compra pan",
+    "el río crece", "trabaja en casa", "la tienda abre"
+)
+
+# Conectores que van delante de la primera proposición ("si A, B")
+PREFIX_CONNECTORS = frozenset({"si", "aunque", "ya sea", "o bien"})
+
+# Valores por defecto de la medición
+DEFAULT_SIZE = 2000
+DEFAULT_SEED = 1611
+DEFAULT_MAX_ATOMS = 8
+DEFAULT_THRESHOLD = 0.10  # Pérdida relativa que se considera regresión
+
+def generate_proposition(rng: random.Random, connector: str, negation: str,
+                         max_atoms: int, max_depth: int) -> str:
+    """
+    Genera una proposición con el conector y la negación dados en la raíz.
+
+    Args:
+        rng (random.Random): Generador con semilla
+        connector (str): Palabra clave del conector principal
+        negation (str): Palabra de negación del primer átomo
+        max_atoms (int): Proposiciones atómicas como máximo
+        max_depth (int): Niveles de anidamiento como máximo
+
+    Returns:
+        str: Proposición en español
+    """
+    connectors = list(KEY_WORDS)
+    budget = [rng.randint(2, max(2, max_atoms))]  # Átomos que quedan por usar
+
+    def atom(negated: Optional[str] = None) -> str:
+        budget[0] -= 1
+        text = rng.choice(ATOMS)
+        if negated is None and rng.random() < 0.3:  # Negación aleatoria
+            negated = rng.choice(NEGATIONS)
+        return f"{negated} {text}" if negated else text
+
+    def part(depth: int, root: Optional[str] = None, negated: Optional[str] = None) -> str:
+        if budget[0] <= 1 or (root is None and (depth >= max_depth or rng.random() < 0.5)):
+            return atom(negated)
+        word = root or rng.choice(connectors)
+        left = part(depth + 1, negated=negated)
+        right = part(depth + 1)
+        if word in PREFIX_CONNECTORS:  # "si A, entonces B", "aunque A, B", ...
+            middle = " entonces " if word == "si" and rng.random() < 0.5 else " "
+            return f"{word} {left},{middle}{right}"
+        return f"{left} {word} {right}"
+
+    return part(0, connector, negation)
+
+def generate_corpus(size: int, seed: int = DEFAULT_SEED, max_atoms: int = DEFAULT_MAX_ATOMS,
+                    max_depth: int = 3) -> List[str]:
+    """
+    Genera un corpus reproducible de proposiciones.
+
+    Los conectores principales y las negaciones del primer átomo recorren
+    KEY_WORDS y NEGATIONS en orden, así que con al menos len(KEY_WORDS)
+    proposiciones se usan todas las palabras.
+
+    Args:
+        size (int): Número de proposiciones
+        seed (int): Semilla del generador
+        max_atoms (int): Proposiciones atómicas como máximo por proposición
+        max_depth (int): Niveles de anidamiento como máximo
+
+    Returns:
+        List[str]: Proposiciones generadas
+    """
+    rng = random.Random(seed)
+    connectors = list(KEY_WORDS)
+    return [generate_proposition(rng, connectors[i % len(connectors)], NEGATIONS[i % len(NEGATIONS)],
+                                 max_atoms, max_depth)
+            for i in range(size)]
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """
+    Percentil por rango más cercano de una lista ordenada.
+
+    Args:
+        values (Sequence[float]): Valores ordenados
+        fraction (float): Percentil entre 0 y 1
+
+    Returns:
+        float: Valor del percentil (0 si la lista está vacía)
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))]
+
+def measure(function: Callable[[Any], Any], inputs: Sequence[Any], repeat: int = 1) -> Dict[str, float]:
+    """
+    Mide una etapa sobre todas las entradas.
+
+    El tiempo y la memoria se miden en pasadas separadas para que tracemalloc
+    no altere las latencias.
+
+    Args:
+        function (Callable[[Any], Any]): Etapa a medir
+        inputs (Sequence[Any]): Argumento de cada llamada
+        repeat (int): Pasadas cronometradas; el rendimiento es el de la mejor
+
+    Returns:
+        Dict[str, float]: Llamadas, tiempo, operaciones por segundo,
+            percentiles de latencia en microsegundos y memoria máxima en KiB
+    """
+    clock = time.perf_counter_ns
+    latencies = []  # Latencia de cada llamada en nanosegundos
+    best = None  # Duración de la mejor pasada
+    for _ in range(repeat):
+        start_pass = clock()
+        for value in inputs:
+            start = clock()
+            function(value)
+            latencies.append(clock() - start)
+        elapsed = clock() - start_pass
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()  # Pasada aparte para la memoria
+    for value in inputs:
+        function(value)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    seconds = best / 1e9
+    return {
+        'calls': len(inputs),
+        'total_s': round(seconds, 6),
+        'ops_per_s': round(len(inputs) / seconds, 1) if seconds else 0.0,
+        'p50_us': round(percentile(latencies, 0.50) / 1e3, 2),
+        'p90_us': round(percentile(latencies, 0.90) / 1e3, 2),
+        'p99_us': round(percentile(latencies, 0.99) / 1e3, 2),
+        'peak_kib': round(peak / 1024, 1)
+    }
+
+def run_benchmark(size: int = DEFAULT_SIZE, seed: int = DEFAULT_SEED, max_atoms: int = DEFAULT_MAX_ATOMS,
+                  repeat: int = 3, cache_size: int = 0) -> Dict[str, Any]:
+    """
+    Mide todas las etapas del análisis sobre un corpus sintético.
+
+    Args:
+        size (int): Proposiciones del corpus
+        seed (int): Semilla del generador
+        max_atoms (int): Proposiciones atómicas como máximo por proposición
+        repeat (int): Pasadas cronometradas por etapa
+        cache_size (int): Tamaño de la caché LRU del intérprete (0 la desactiva)
+
+    Returns:
+        Dict[str, Any]: Datos de la ejecución y resultados por etapa
+    """
+    corpus = generate_corpus(size, seed, max_atoms)
+    interpreter = InterpreteLógico(cache_size=cache_size)
+    parsed = [interpreter.parse_proposition(text) for text in corpus]  # Entradas de las etapas siguientes
+    tables = [interpreter.generate_truth_table(p) for p in parsed]
+    tables = [table for table in tables if not isinstance(table, str)]  # Solo tablas válidas
+
+    stages = {
+        'find_connector': (interpreter.find_connector, corpus),
+        'check_negation': (interpreter.check_negation, corpus),
+        'parse_proposition': (interpreter.parse_proposition, corpus),
+        'generate_truth_table': (interpreter.generate_truth_table, parsed),
+        'format_truth_table': (interpreter.format_truth_table, tables)
+    }
+    return {
+        'meta': {
+            'size': size, 'seed': seed, 'max_atoms': max_atoms, 'repeat': repeat,
+            'cache_size': cache_size, 'python': platform.python_version(),
+            'platform': platform.platform()
+        },
+        'stages': {name: measure(function, inputs, repeat) for name, (function, inputs) in stages.items()}
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, str, float, float]]:
+    """
+    Compara una medición con otra guardada.
+
+    Una etapa empeora si su rendimiento baja o su latencia p99 sube más que
+    el umbral relativo.
+
+    Args:
+        current (Dict[str, Any]): Medición actual
+        baseline (Dict[str, Any]): Medición de referencia
+        threshold (float): Cambio relativo permitido (0.10 = 10 %)
+
+    Returns:
+        List[Tuple[str, str, float, float]]: (etapa, métrica, referencia, actual)
+            de cada regresión
+    """
+    regressions = []
+    for name, stage in current['stages'].items():
+        reference = baseline.get('stages', {}).get(name)
+        if reference is None:  # Etapa nueva sin referencia
+            continue
+        if stage['ops_per_s'] < reference['ops_per_s'] * (1 - threshold):
+            regressions.append((name, 'ops_per_s', reference['ops_per_s'], stage['ops_per_s']))
+        if stage['p99_us'] > reference['p99_us'] * (1 + threshold):
+            regressions.append((name, 'p99_us', reference['p99_us'], stage['p99_us']))
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de las pruebas de rendimiento.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos de la línea de comandos
+
+    Returns:
+        int: 0 si no hay regresiones, 1 si alguna etapa empeoró
+    """
+    parser = argparse.ArgumentParser(description="Pruebas de rendimiento del intérprete lógico")
+    parser.add_argument("-n", "--size", type=int, default=DEFAULT_SIZE, help="proposiciones del corpus")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="semilla del generador")
+    parser.add_argument("--max-atoms", type=int, default=DEFAULT_MAX_ATOMS, help="proposiciones atómicas por proposición")
+    parser.add_argument("--repeat", type=int, default=3, help="pasadas cronometradas por etapa")
+    parser.add_argument("--cache-size", type=int, default=0, help="entradas de la caché LRU (0 la desactiva)")
+    parser.add_argument("-o", "--output", help="archivo donde guardar el resultado en JSON")
+    parser.add_argument("--baseline", help="resultado guardado con el que comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="cambio relativo que se considera regresión")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.size, args.seed, args.max_atoms, args.repeat, args.cache_size)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as source:
+            regressions = compare(result, json.load(source), args.threshold)
+        result['regressions'] = [
+            {'stage': name, 'metric': metric, 'baseline': before, 'current': after}
+            for name, metric, before, after in regressions
+        ]
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    print(text)
+    for item in result.get('regressions', ()):  # Resumen legible de las regresiones
+        print(f"REGRESIÓN {item['stage']} {item['metric']}: {item['baseline']} -> {item['current']}", file=sys.stderr)
+    return 1 if result.get('regressions') else 0
+
+# Punto de entrada de las pruebas de rendimiento
+if __name__ == "__main__":  # Verifica si el script se está ejecutando directamente
+    sys.exit(main())
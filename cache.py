@@ -0,0 +1,106 @@
+"""
+Caché LRU acotada
+=================
+
+Caché de tamaño fijo con expulsión del elemento usado hace más tiempo y
+estadísticas de aciertos, fallos y expulsiones. Es segura para usarse desde
+varios hilos.
+"""
+
+from collections import OrderedDict  # Importa el diccionario ordenado que mantiene el orden de uso
+from _thread import allocate_lock as Lock  # Importa el candado para el acceso concurrente
+from typing import Any, Dict, Hashable  # Importa tipos de datos para anotaciones
+
+# Valor centinela para distinguir "no está" de un valor None guardado
+_MISSING = object()
+
+class LRUCache:
+    """
+    Caché acotada con política LRU (se expulsa el menos usado recientemente).
+    
+    Attributes:
+        maxsize (int): Número máximo de entradas
+        hits (int): Búsquedas que encontraron el valor
+        misses (int): Búsquedas que no lo encontraron
+        evictions (int): Entradas expulsadas por falta de espacio
+    """
+    
+    def __init__(self, maxsize: int):
+        """
+        Inicializa una caché vacía.
+        
+        Args:
+            maxsize (int): Número máximo de entradas (mayor que cero)
+        """
+        if maxsize <= 0:
+            raise ValueError("El tamaño de la caché debe ser mayor que cero")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()  # Entradas de la menos a la más usada
+        self._lock = Lock()  # Protege los datos y los contadores
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Busca un valor y lo marca como usado recientemente.
+        
+        Args:
+            key (Hashable): Clave a buscar
+            default (Any): Valor devuelto si la clave no está
+            
+        Returns:
+            Any: El valor guardado o default
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:  # Fallo de caché
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)  # Pasa a ser la entrada más reciente
+            self.hits += 1
+            return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Guarda un valor expulsando la entrada menos usada si no hay espacio.
+        
+        Args:
+            key (Hashable): Clave
+            value (Any): Valor a guardar (debe ser inmutable)
+        """
+        with self._lock:
+            if key in self._data:  # Actualiza una entrada existente
+                self._data.move_to_end(key)
+            self._data[key] = value
+            if len(self._data) > self.maxsize:  # Expulsa la entrada más antigua
+                self._data.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Vacía la caché y reinicia las estadísticas."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+    
+    def __len__(self) -> int:
+        """Número de entradas guardadas."""
+        return len(self._data)
+    
+    def info(self) -> Dict[str, Any]:
+        """
+        Devuelve las estadísticas de uso de la caché.
+        
+        Returns:
+            Dict[str, Any]: hits, misses, evictions, size, maxsize y hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses  # Búsquedas totales
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
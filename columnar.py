@@ -0,0 +1,221 @@
+"""
+Evaluación por columnas sobre conjuntos de datos
+================================================
+
+Evalúa una proposición sobre millones de asignaciones reales de sus átomos,
+por ejemplo un CSV con una columna booleana por átomo:
+- El archivo se lee como un flujo, por bloques de filas, así que la memoria
+  no depende de su tamaño (también .gz y la entrada estándar)
+- Cada columna del bloque se empaqueta en un entero (bit k = fila k del bloque)
+- La proposición se compila una sola vez y se aplica con operaciones bit a
+  bit a todas las filas del bloque, sin despachar por el texto del conector
+- Devuelve las columnas de resultados por bloque o solo los conteos
+
+Valores admitidos (sin distinguir mayúsculas): 1/0, v/f, verdadero/falso,
+true/false, t/f, sí/si/no, yes/no.
+"""
+
+import argparse  # Importa el analizador de argumentos de la línea de comandos
+import csv  # Importa la lectura de CSV por flujo
+import gzip  # Importa la lectura de archivos comprimidos
+import json  # Importa la serialización a JSON
+import sys  # Importa la entrada y salida estándar
+from itertools import islice  # Importa islice para leer por bloques
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple  # Importa tipos para anotaciones
+from interpreter import InterpreteLógico, column_to_cells, get_interpreter  # Importa el intérprete
+from symbols import normalize_atom  # Importa la normalización de los nombres de los átomos
+
+# Filas por bloque
+DEFAULT_CHUNK_ROWS = 65536
+
+# Texto de cada valor booleano -> dígito binario
+_BITS = {
+    **dict.fromkeys(("1", "v", "verdadero", "true", "t", "sí", "si", "yes"), "1"),
+    **dict.fromkeys(("0", "f", "falso", "false", "no", "n"), "0")
+}
+
+
+def pack_column(cells: Sequence[str]) -> int:
+    """
+    Empaqueta una columna de valores booleanos en un entero.
+
+    Args:
+        cells (Sequence[str]): Valores de la columna, en orden de fila
+
+    Returns:
+        int: Columna de bits (bit k = fila k)
+
+    Raises:
+        ValueError: Si algún valor no es booleano
+    """
+    try:
+        digits = "".join([_BITS[cell.strip().lower()] for cell in reversed(cells)])  # La fila 0 es el bit menos significativo
+    except KeyError as error:
+        raise ValueError(f"Valor no booleano: {error.args[0]!r}") from None
+    return int(digits, 2) if digits else 0
+
+
+def _open(path: str) -> TextIO:
+    """Abre un archivo de datos ("-" es la entrada estándar, .gz se descomprime)."""
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def _column_indices(header: Sequence[str], variables: Sequence[str],
+                    mapping: Optional[Dict[str, str]]) -> List[int]:
+    """
+    Busca la columna del archivo de cada variable.
+
+    Args:
+        header (Sequence[str]): Encabezados del archivo
+        variables (Sequence[str]): Variables de la proposición
+        mapping (Optional[Dict[str, str]]): Nombre de columna de cada variable,
+            si no coincide con el texto del átomo
+
+    Returns:
+        List[int]: Índice de la columna de cada variable
+
+    Raises:
+        ValueError: Si falta alguna columna
+    """
+    positions = {normalize_atom(name): i for i, name in enumerate(header)}
+    columns = {normalize_atom(atom): column for atom, column in (mapping or {}).items()}
+    indices = []
+    for variable in variables:
+        name = normalize_atom(columns.get(variable, variable))
+        if name not in positions:
+            raise ValueError(f"Falta la columna de la proposición '{variable}'")
+        indices.append(positions[name])
+    return indices
+
+
+def evaluate_rows(rows: Iterable[Sequence[str]], parsed_prop: Dict,
+                  interpreter: Optional[InterpreteLógico] = None,
+                  mapping: Optional[Dict[str, str]] = None,
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Tuple[int, int]]:
+    """
+    Evalúa una proposición sobre filas con encabezado, por bloques.
+
+    Args:
+        rows (Iterable[Sequence[str]]): Filas; la primera son los encabezados
+        parsed_prop (Dict): Proposición analizada
+        interpreter (Optional[InterpreteLógico]): Intérprete; por defecto el compartido
+        mapping (Optional[Dict[str, str]]): Nombre de columna de cada variable
+        chunk_rows (int): Filas por bloque
+
+    Yields:
+        Tuple[int, int]: (columna de resultados del bloque, filas del bloque)
+    """
+    interpreter = interpreter or get_interpreter()
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:  # Archivo vacío
+        return
+    indices = _column_indices(header, interpreter.variables(parsed_prop), mapping)
+    evaluate = interpreter.compile(parsed_prop, bitwise=True)  # Se compila una sola vez
+    while True:
+        chunk = list(islice(rows, chunk_rows))
+        if not chunk:
+            return
+        size = len(chunk)
+        try:
+            columns = [pack_column([row[index] for row in chunk]) for index in indices]
+        except IndexError:
+            raise ValueError("Hay filas con menos columnas que el encabezado") from None
+        mask = (1 << size) - 1
+        yield evaluate(columns, mask) & mask, size
+
+
+def evaluate_file(path: str, parsed_prop: Dict, interpreter: Optional[InterpreteLógico] = None,
+                  mapping: Optional[Dict[str, str]] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                  delimiter: str = ",") -> Iterator[Tuple[int, int]]:
+    """
+    Evalúa una proposición sobre un archivo CSV, por bloques.
+
+    Args:
+        path (str): Archivo CSV con encabezado ("-" para la entrada estándar, .gz admitido)
+        parsed_prop (Dict): Proposición analizada
+        interpreter (Optional[InterpreteLógico]): Intérprete; por defecto el compartido
+        mapping (Optional[Dict[str, str]]): Nombre de columna de cada variable
+        chunk_rows (int): Filas por bloque
+        delimiter (str): Separador de columnas
+
+    Yields:
+        Tuple[int, int]: (columna de resultados del bloque, filas del bloque)
+    """
+    stream = _open(path)
+    try:
+        yield from evaluate_rows(csv.reader(stream, delimiter=delimiter), parsed_prop,
+                                 interpreter, mapping, chunk_rows)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def count_results(chunks: Iterable[Tuple[int, int]]) -> Dict[str, int]:
+    """
+    Cuenta las filas verdaderas y falsas de una evaluación por bloques.
+
+    Args:
+        chunks (Iterable[Tuple[int, int]]): Bloques de evaluate_rows o evaluate_file
+
+    Returns:
+        Dict[str, int]: 'rows', 'true' y 'false'
+    """
+    rows = true = 0
+    for result, size in chunks:
+        rows += size
+        true += result.bit_count()
+    return {'rows': rows, 'true': true, 'false': rows - true}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada: evalúa una proposición sobre un CSV.
+
+    Sin --count escribe un resultado (V/F) por fila; con --count escribe los
+    conteos en JSON.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos de la línea de comandos
+
+    Returns:
+        int: Código de salida
+    """
+    parser = argparse.ArgumentParser(description="Evalúa una proposición sobre un archivo de datos")
+    parser.add_argument("proposition", help="proposición a evaluar")
+    parser.add_argument("data", help="CSV con una columna booleana por proposición atómica (.gz admitido, '-' para stdin)")
+    parser.add_argument("--count", action="store_true", help="escribe solo los conteos en JSON")
+    parser.add_argument("--column", action="append", default=[], metavar="ÁTOMO=COLUMNA",
+                        help="columna del archivo para un átomo con otro nombre")
+    parser.add_argument("--delimiter", default=",", help="separador de columnas")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="filas por bloque")
+    parser.add_argument("-o", "--output", help="archivo de salida (por defecto la salida estándar)")
+    args = parser.parse_args(argv)
+
+    interpreter = get_interpreter()
+    parsed = interpreter.parse_proposition(args.proposition)
+    mapping = dict(item.partition("=")[::2] for item in args.column)
+    chunks = evaluate_file(args.data, parsed, interpreter, mapping, args.chunk_rows, args.delimiter)
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.count:
+            output.write(json.dumps(count_results(chunks)) + "\n")
+        else:
+            for result, size in chunks:  # Una escritura por bloque
+                output.write("\n".join(column_to_cells(result, size)) + "\n")
+    except ValueError as error:  # Columna ausente o valor no booleano
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+# Punto de entrada de la evaluación por columnas
+if __name__ == "__main__":  # Verifica si el script se está ejecutando directamente
+    sys.exit(main())
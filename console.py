@@ -12,9 +12,20 @@ Este módulo implementa un intérprete de lógica proposicional que puede:
 - Evaluar expresiones lógicas
 """
 
-from typing import Dict, List  # Importa tipos de datos para anotaciones
-from termcolor import colored  # Importa la función para colorear texto en la consola
-from interpreter import InterpreteLógico  # Importa la clase que maneja el análisis lógico
+import argparse  # Importa el analizador de argumentos de la línea de comandos
+import gzip  # Importa la lectura de archivos comprimidos
+import json  # Importa la serialización a JSON
+import os  # Importa os para conocer el número de núcleos
+import sys  # Importa la entrada y salida estándar
+from itertools import islice  # Importa islice para agrupar la salida en bloques
+from typing import Dict, List, Iterable, Iterator, Optional, TextIO  # Importa tipos de datos para anotaciones
+from interpreter import InterpreteLógico, get_interpreter  # Importa el intérprete lógico y su instancia compartida
+
+# Número de registros que se escriben de una sola vez en modo por lotes
+OUTPUT_CHUNK_SIZE = 1024
+
+# Proposiciones atómicas como máximo por línea en modo por lotes (0 = sin límite)
+DEFAULT_MAX_ATOMS = 16
 
 def analyze_proposition(text: str) -> str:
     """
@@ -26,7 +37,9 @@ def analyze_proposition(text: str) -> str:
     Returns:
         str: Resultado del análisis incluyendo la tabla de verdad
     """
-    interpreter = InterpreteLógico()  # Crea una instancia del intérprete lógico
+    from termcolor import colored  # Importa el coloreado solo cuando se muestra un resultado
+    
+    interpreter = get_interpreter()  # Reutiliza la instancia compartida del intérprete lógico
     parsed = interpreter.parse_proposition(text)  # Analiza la proposición dada
     
     print("\nRESULTADO DEL ANÁLISIS:")  # Imprime el encabezado del resultado
@@ -48,8 +61,182 @@ def analyze_proposition(text: str) -> str:
     else:
         return "No se encontró ningún conector lógico en la proposición."  # Mensaje si no se encuentra un conector
 
-# Ejemplos de uso con negaciones
-if __name__ == "__main__":  # Verifica si el script se está ejecutando directamente
+def read_propositions(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Lee proposiciones, una por línea, desde archivos o la entrada estándar.
+    
+    Args:
+        paths (Iterable[str]): Rutas a leer; "-" es la entrada estándar y los
+            archivos terminados en ".gz" se descomprimen al vuelo
+        
+    Yields:
+        str: Cada línea no vacía sin espacios ni salto de línea
+    """
+    for path in paths:  # Recorre los archivos en orden
+        if path == "-":  # La entrada estándar no se cierra al terminar
+            stream = sys.stdin
+        elif path.endswith(".gz"):  # Archivo comprimido con gzip
+            stream = gzip.open(path, "rt", encoding="utf-8")
+        else:
+            stream = open(path, encoding="utf-8")
+        try:
+            for line in stream:  # Lee una línea a la vez, sin cargar el archivo completo
+                line = line.strip()
+                if line:
+                    yield line
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+def error_record(text: str, error: BaseException) -> Dict:
+    """
+    Registro de una proposición que no se pudo analizar.
+    
+    Args:
+        text (str): Proposición original
+        error (BaseException): Error producido
+        
+    Returns:
+        Dict: Proposición y mensaje de error
+    """
+    return {'proposition': text, 'error': str(error) or type(error).__name__}
+
+def analysis_record(interpreter: InterpreteLógico, text: str, max_atoms: int = 0) -> Dict:
+    """
+    Analiza una proposición y devuelve un registro serializable a JSON.
+    
+    Args:
+        interpreter (InterpreteLógico): Intérprete a utilizar
+        text (str): Proposición a analizar
+        max_atoms (int): Proposiciones atómicas permitidas (0 = sin límite);
+            la tabla de verdad crece como 2**N, así que una sola línea larga
+            podría agotar la memoria
+        
+    Returns:
+        Dict: Conector, tipo, símbolo, átomos, negaciones y tabla de verdad, o
+        el registro de error_record si la proposición no se pudo analizar o
+        supera max_atoms
+    """
+    try:
+        parsed = interpreter.parse_proposition(text)  # Analiza la proposición
+        if max_atoms and len(interpreter.variables(parsed)) > max_atoms:  # Antes de generar la tabla
+            raise ValueError(f"La proposición tiene más de {max_atoms} proposiciones atómicas")
+        table = interpreter.generate_truth_table(parsed)  # Genera la tabla de verdad
+    except Exception as error:  # Una proposición inválida no detiene el lote
+        return error_record(text, error)
+    return {
+        'proposition': text,  # Proposición original
+        'connector': parsed['connector'],  # Conector identificado
+        'connector_type': parsed['connector_type'],  # Tipo de conector
+        'symbol': parsed['symbol'],  # Símbolo lógico
+        'atoms': list(parsed['propositions']),  # Proposiciones atómicas
+        'negations': list(parsed['negations']),  # Negación de cada átomo
+        'truth_table': [list(row) for row in table] if not isinstance(table, str) else None  # Tabla o None
+    }
+
+def analyze_lines(lines: Iterable[str], interpreter: Optional[InterpreteLógico] = None,
+                  max_atoms: int = 0) -> Iterator[Dict]:
+    """
+    Analiza un flujo de proposiciones de forma perezosa.
+    
+    Args:
+        lines (Iterable[str]): Proposiciones a analizar
+        interpreter (Optional[InterpreteLógico]): Intérprete a utilizar; por
+            defecto la instancia compartida
+        max_atoms (int): Proposiciones atómicas permitidas (0 = sin límite)
+        
+    Yields:
+        Dict: Un registro por proposición, en el mismo orden de entrada
+    """
+    interpreter = interpreter or get_interpreter()  # Reutiliza una sola instancia
+    for line in lines:
+        yield analysis_record(interpreter, line, max_atoms)
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode  # Codificador reutilizable
+
+def encode_record(record: Dict) -> str:
+    """
+    Serializa un registro como una línea JSON.
+    
+    Args:
+        record (Dict): Registro a serializar
+        
+    Returns:
+        str: JSON compacto sin salto de línea
+    """
+    return _encode(record)
+
+def write_lines(lines: Iterable[str], output: TextIO, chunk_size: int = OUTPUT_CHUNK_SIZE) -> int:
+    """
+    Escribe líneas ya serializadas agrupando la escritura en bloques.
+    
+    Args:
+        lines (Iterable[str]): Líneas sin salto de línea
+        output (TextIO): Flujo de salida
+        chunk_size (int): Líneas por escritura
+        
+    Returns:
+        int: Número de líneas escritas
+    """
+    lines = iter(lines)
+    total = 0  # Líneas escritas
+    while True:
+        chunk = list(islice(lines, chunk_size))  # Toma un bloque de líneas
+        if not chunk:
+            break
+        output.write("\n".join(chunk) + "\n")  # Una sola escritura por bloque
+        total += len(chunk)
+    output.flush()
+    return total
+
+def write_jsonl(records: Iterable[Dict], output: TextIO, chunk_size: int = OUTPUT_CHUNK_SIZE) -> int:
+    """
+    Escribe registros como JSON Lines agrupando la escritura en bloques.
+    
+    Args:
+        records (Iterable[Dict]): Registros a escribir
+        output (TextIO): Flujo de salida
+        chunk_size (int): Registros por escritura
+        
+    Returns:
+        int: Número de registros escritos
+    """
+    return write_lines(map(encode_record, records), output, chunk_size)
+
+def run_batch(paths: List[str], output: TextIO, chunk_size: int = OUTPUT_CHUNK_SIZE,
+              jobs: int = 1, shard_size: Optional[int] = None, cache_size: int = 0,
+              max_atoms: int = DEFAULT_MAX_ATOMS) -> int:
+    """
+    Ejecuta el modo por lotes: lee, analiza y escribe en un flujo continuo.
+    
+    La memoria usada no depende del tamaño de la entrada porque cada etapa es
+    un generador que procesa una proposición a la vez.
+    
+    Args:
+        paths (List[str]): Archivos de entrada ("-" para la entrada estándar)
+        output (TextIO): Flujo de salida
+        chunk_size (int): Registros por escritura
+        jobs (int): Procesos de análisis; con más de uno se usa parallel.py
+        shard_size (Optional[int]): Proposiciones por tarea en modo paralelo
+        cache_size (int): Tamaño de la caché LRU del intérprete (0 la desactiva)
+        max_atoms (int): Proposiciones atómicas permitidas por línea (0 = sin
+            límite); las líneas que lo superan producen un registro de error
+        
+    Returns:
+        int: Número de proposiciones analizadas
+    """
+    lines = read_propositions(paths)  # Flujo de proposiciones de entrada
+    if jobs > 1:  # Reparte el análisis entre varios procesos
+        from parallel import analyze_parallel, DEFAULT_CHUNK_SIZE
+        encoded = analyze_parallel(lines, workers=jobs, chunk_size=shard_size or DEFAULT_CHUNK_SIZE,
+                                   serializer=encode_record,
+                                   cache_size=cache_size, max_atoms=max_atoms)  # Los procesos devuelven JSON ya serializado
+        return write_lines(encoded, output, chunk_size)
+    interpreter = InterpreteLógico(cache_size=cache_size) if cache_size else None  # Caché opcional
+    return write_jsonl(analyze_lines(lines, interpreter, max_atoms), output, chunk_size)
+
+def run_examples() -> None:
+    """Analiza y muestra con colores las proposiciones de ejemplo."""
     proposiciones_ejemplo = [  # Lista de proposiciones de ejemplo
         "Si no llueve, entonces el suelo está seco",
         "No hace sol y hace frío",
@@ -64,4 +251,46 @@ if __name__ == "__main__":  # Verifica si el script se está ejecutando directam
     for prop in proposiciones_ejemplo:  # Itera sobre cada proposición de ejemplo
         print("\n" + "="*50)  # Imprime una línea separadora
         result = analyze_proposition(prop)  # Llama a la función de análisis para cada proposición
-        print(result)  # Imprime el resultado del análisis
\ No newline at end of file
+        print(result)  # Imprime el resultado del análisis
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la consola.
+    
+    Sin argumentos muestra las proposiciones de ejemplo; con --batch o con
+    archivos de entrada analiza una proposición por línea y escribe JSON Lines.
+    
+    Args:
+        argv (Optional[List[str]]): Argumentos de la línea de comandos
+        
+    Returns:
+        int: Código de salida
+    """
+    parser = argparse.ArgumentParser(description="Intérprete de lógica proposicional")
+    parser.add_argument("files", nargs="*", help="archivos con una proposición por línea (.gz admitido, '-' para stdin)")
+    parser.add_argument("--batch", action="store_true", help="analiza la entrada y escribe JSON Lines")
+    parser.add_argument("-o", "--output", help="archivo de salida (por defecto la salida estándar)")
+    parser.add_argument("--chunk-size", type=int, default=OUTPUT_CHUNK_SIZE, help="registros por escritura")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="procesos de análisis (0 = uno por núcleo)")
+    parser.add_argument("--shard-size", type=int, help="proposiciones por tarea en modo paralelo")
+    parser.add_argument("--cache-size", type=int, default=0, help="entradas de la caché LRU de análisis (0 la desactiva)")
+    parser.add_argument("--max-atoms", type=int, default=DEFAULT_MAX_ATOMS,
+                        help="proposiciones atómicas máximas por línea (0 = sin límite)")
+    args = parser.parse_args(argv)
+
+    if not args.batch and not args.files:  # Modo de demostración
+        run_examples()
+        return 0
+
+    paths = args.files or ["-"]  # Sin archivos se lee la entrada estándar
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)  # 0 usa todos los núcleos
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            run_batch(paths, output, args.chunk_size, jobs, args.shard_size, args.cache_size, args.max_atoms)
+    else:
+        run_batch(paths, sys.stdout, args.chunk_size, jobs, args.shard_size, args.cache_size, args.max_atoms)
+    return 0
+
+# Punto de entrada de la consola
+if __name__ == "__main__":  # Verifica si el script se está ejecutando directamente
+    sys.exit(main())
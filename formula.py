@@ -0,0 +1,741 @@
+"""
+Fórmulas de lógica proposicional
+================================
+
+Este módulo define el árbol sintáctico (AST) de las proposiciones:
+- Nodos compactos e inmutables (Atom, Not, Binary) con __slots__
+- Dentro de una proposición, los átomos con el mismo texto son una sola
+  variable (un solo objeto Atom)
+- Un analizador sintáctico con precedencia de conectores
+- Compilación del árbol a funciones de Python sin despacho por cadenas
+- Columnas de bits de las variables de una tabla de verdad (un bit por fila)
+
+Los recorridos no usan recursión y las cadenas de un mismo conector
+(p ∧ q ∧ r ∧ ...) se tratan como un solo nodo de varios operandos, así que
+una proposición con miles de operandos no agota la pila ni el compilador.
+"""
+
+from functools import lru_cache  # Importa la caché para reutilizar las funciones compiladas
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union  # Importa tipos para anotaciones
+from symbols import normalize_atom  # Importa la normalización del texto de los átomos
+
+# Precedencia de los símbolos lógicos (mayor número = se agrupa antes)
+PRECEDENCE = {"↔": 0, "→": 1, "∨": 2, "∧": 3}
+
+# Símbolos que se agrupan por la derecha: p → q → r es p → (q → r)
+RIGHT_ASSOCIATIVE_SYMBOLS = frozenset({"→"})
+
+# Operandos que se escriben seguidos en el código generado; las cadenas más
+# largas se agrupan entre paréntesis para no superar los límites del compilador
+_CHAIN_GROUP = 64
+
+
+def _chain(operands: List[str], operator: str) -> str:
+    """
+    Escribe una cadena de operandos unidos por un operador de Python.
+
+    Args:
+        operands (List[str]): Código de cada operando
+        operator (str): Operador con sus espacios, por ejemplo " & "
+
+    Returns:
+        str: Expresión entre paréntesis, agrupada por bloques si es muy larga
+    """
+    while len(operands) > _CHAIN_GROUP:
+        operands = [f"({operator.join(operands[i:i + _CHAIN_GROUP])})"
+                    for i in range(0, len(operands), _CHAIN_GROUP)]
+    return f"({operator.join(operands)})"
+
+
+# Plantillas de código para evaluar valores individuales (True/False). Cada
+# plantilla recibe el código de los operandos de una cadena: p → q → r es
+# ¬p ∨ ¬q ∨ r y una cadena de ↔ es verdadera según la paridad de sus operandos
+_SCALAR_TEMPLATES = {
+    "¬": lambda ops: f"(not {ops[0]})",
+    "∧": lambda ops: _chain(ops, " and "),
+    "∨": lambda ops: _chain(ops, " or "),
+    "→": lambda ops: _chain([f"(not {op})" for op in ops[:-1]] + ops[-1:], " or "),
+    "↔": lambda ops: f"({_chain(ops, ' ^ ')} == {len(ops) % 2})"
+}
+
+# Plantillas de código para evaluar columnas de bits (todas las filas a la vez)
+_BITWISE_TEMPLATES = {
+    "¬": lambda ops: f"({ops[0]} ^ m)",
+    "∧": lambda ops: _chain(ops, " & "),
+    "∨": lambda ops: _chain(ops, " | "),
+    "→": lambda ops: _chain([f"({op} ^ m)" for op in ops[:-1]] + ops[-1:], " | "),
+    "↔": lambda ops: _chain(ops + ["m"] if len(ops) % 2 == 0 else ops, " ^ ")
+}
+
+# Nombres de las variables de la tabla de verdad (p, q, r, ...)
+ATOM_NAMES = "pqrstuvw"
+
+# Tipos de elemento que recibe el analizador sintáctico
+ITEM_TEXT = "TEXTO"  # ("TEXTO", texto, negado)
+ITEM_OPERATOR = "OPERADOR"  # ("OPERADOR", palabra, tipo, símbolo)
+ITEM_COMMA = "COMA"  # ("COMA",)
+
+
+def atom_names(count: int) -> List[str]:
+    """
+    Genera los nombres de las variables de una tabla de verdad.
+
+    Args:
+        count (int): Número de variables
+
+    Returns:
+        List[str]: p, q, r, ... o p1, p2, ... si no alcanzan las letras
+    """
+    if count <= len(ATOM_NAMES):  # Si alcanzan las letras se usan directamente
+        return list(ATOM_NAMES[:count])
+    return [f"p{i}" for i in range(1, count + 1)]  # Si no, se numeran las variables
+
+
+def variable_column(index: int, count: int) -> int:
+    """
+    Construye la columna empaquetada de una variable de la tabla de verdad.
+
+    El bit r del entero es el valor de la variable en la fila r (1 = V). El
+    orden de las filas es el de itertools.product([True, False], repeat=count).
+
+    Args:
+        index (int): Posición de la variable (0 es la columna de la izquierda)
+        count (int): Número total de variables
+
+    Returns:
+        int: Columna de 2**count bits
+    """
+    block = 1 << (count - 1 - index)  # Filas seguidas con el mismo valor
+    column = (1 << block) - 1  # Un bloque de V seguido de un bloque de F
+    width = block << 1  # Longitud del patrón que se repite
+    total = 1 << count  # Número total de filas
+    while width < total:  # Duplica el patrón hasta cubrir todas las filas
+        column |= column << width
+        width <<= 1
+    return column
+
+
+# Filas de cada bloque de result_column, como potencia de dos (65536 filas)
+RESULT_BLOCK_BITS = 16
+
+
+def result_blocks(evaluate: Callable, count: int) -> Iterator[bytes]:
+    """
+    Evalúa la columna de resultados de una tabla de verdad por bloques, sin
+    construir las columnas completas de las variables.
+
+    En un bloque alineado de 2**b filas, las b variables de la derecha repiten
+    el patrón de una tabla de b variables y las demás son constantes, así que
+    solo se guarda un bloque a la vez.
+
+    Args:
+        evaluate (Callable): Función de compile_formula(..., bitwise=True)
+        count (int): Número de variables
+
+    Yields:
+        bytes: Resultados de cada bloque en orden de fila (bit r % 8 del byte
+        r // 8 = fila r); unidos forman la columna en little endian
+    """
+    bits = min(count, RESULT_BLOCK_BITS)  # Variables que cambian dentro de un bloque
+    rows = 1 << bits  # Filas por bloque
+    mask = (1 << rows) - 1
+    inner = [variable_column(i, bits) for i in range(bits)]
+    outer = count - bits  # Variables constantes en cada bloque
+    size = (rows + 7) >> 3  # Bytes por bloque
+    for block in range(1 << outer):
+        constants = [0 if (block >> (outer - 1 - i)) & 1 else mask for i in range(outer)]  # V en la primera mitad
+        yield (evaluate(constants + inner, mask) & mask).to_bytes(size, "little")
+
+
+def result_column(evaluate: Callable, count: int,
+                  cancelled: Optional[Callable[[], bool]] = None) -> Optional[int]:
+    """
+    Evalúa la columna de resultados de una tabla de verdad con result_blocks.
+
+    Args:
+        evaluate (Callable): Función de compile_formula(..., bitwise=True)
+        count (int): Número de variables
+        cancelled (Optional[Callable[[], bool]]): Se consulta después de cada
+            bloque; si devuelve True se abandona el cálculo
+
+    Returns:
+        Optional[int]: Columna de 2**count bits (bit r = resultado de la fila
+        r), o None si se canceló
+    """
+    if count <= RESULT_BLOCK_BITS:  # Un solo bloque
+        mask = (1 << (1 << count)) - 1
+        return evaluate([variable_column(i, count) for i in range(count)], mask) & mask
+    blocks = bytearray()  # Resultados de los bloques, en orden de fila
+    for data in result_blocks(evaluate, count):
+        if cancelled is not None and cancelled():
+            return None
+        blocks += data
+    return int.from_bytes(blocks, "little")
+
+
+class Formula:
+    """Nodo base del árbol de una proposición. Los nodos no se pueden modificar."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        """Impide modificar los nodos una vez creados."""
+        raise AttributeError("Los nodos de una fórmula son inmutables")
+
+    def __repr__(self) -> str:
+        """Representación legible del nodo."""
+        return f"{type(self).__name__}({render(self, None)})"
+
+
+class Atom(Formula):
+    """
+    Proposición atómica.
+
+    Attributes:
+        name (str): Texto normalizado de la proposición
+        index (int): Posición de la variable en la tabla de verdad
+    """
+
+    __slots__ = ("name", "index")
+
+    def __init__(self, name: str, index: int):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "index", index)
+
+
+class Not(Formula):
+    """
+    Negación de una fórmula.
+
+    Attributes:
+        operand (Formula): Fórmula negada
+    """
+
+    __slots__ = ("operand",)
+
+    def __init__(self, operand: Formula):
+        object.__setattr__(self, "operand", operand)
+
+
+class Binary(Formula):
+    """
+    Conector lógico entre dos fórmulas.
+
+    Attributes:
+        connector (str): Palabra del texto que originó el conector
+        connector_type (str): Tipo de conector (CONDICIONAL, CONJUNCIÓN, ...)
+        symbol (str): Símbolo lógico (→, ∧, ∨, ↔)
+        left (Formula): Operando izquierdo
+        right (Formula): Operando derecho
+    """
+
+    __slots__ = ("connector", "connector_type", "symbol", "left", "right")
+
+    def __init__(self, connector: str, connector_type: str, symbol: str, left: Formula, right: Formula):
+        object.__setattr__(self, "connector", connector)
+        object.__setattr__(self, "connector_type", connector_type)
+        object.__setattr__(self, "symbol", symbol)
+        object.__setattr__(self, "left", left)
+        object.__setattr__(self, "right", right)
+
+
+def negate(node: Formula) -> Formula:
+    """
+    Niega una fórmula. Una negación repetida en español es enfática ("no vino
+    nunca"), así que negar una negación la deja igual.
+
+    Args:
+        node (Formula): Fórmula a negar
+
+    Returns:
+        Formula: La fórmula negada
+    """
+    return node if isinstance(node, Not) else Not(node)
+
+
+def leaves(node: Formula) -> List[Tuple[Atom, bool]]:
+    """
+    Recorre las hojas de la fórmula de izquierda a derecha.
+
+    Args:
+        node (Formula): Raíz de la fórmula
+
+    Returns:
+        List[Tuple[Atom, bool]]: Cada átomo y si está negado directamente
+    """
+    result = []  # Hojas encontradas
+    stack = [(node, False)]  # Pila de nodos pendientes (sin recursión)
+    while stack:
+        current, negated = stack.pop()
+        if isinstance(current, Atom):
+            result.append((current, negated))
+        elif isinstance(current, Not):
+            if isinstance(current.operand, Atom):  # Negación directa de un átomo
+                result.append((current.operand, True))
+            else:
+                stack.append((current.operand, False))
+        else:
+            stack.append((current.right, False))  # El derecho se apila primero para salir después
+            stack.append((current.left, False))
+    return result
+
+
+def chain_operands(node: Binary) -> List[Formula]:
+    """
+    Devuelve los operandos de la cadena de un mismo conector que empieza en el
+    nodo, siguiendo su asociatividad: p ∧ q ∧ r es ((p ∧ q) ∧ r) y p → q → r
+    es p → (q → r); en los dos casos los operandos son [p, q, r].
+
+    Args:
+        node (Binary): Primer conector de la cadena
+
+    Returns:
+        List[Formula]: Operandos de izquierda a derecha
+    """
+    symbol = node.symbol
+    operands = []
+    current = node
+    if symbol in RIGHT_ASSOCIATIVE_SYMBOLS:  # La cadena sigue por la derecha
+        while isinstance(current, Binary) and current.symbol == symbol:
+            operands.append(current.left)
+            current = current.right
+        operands.append(current)
+        return operands
+    while isinstance(current, Binary) and current.symbol == symbol:  # La cadena sigue por la izquierda
+        operands.append(current.right)
+        current = current.left
+    operands.append(current)
+    operands.reverse()
+    return operands
+
+
+def _flat_operands(node: Formula) -> Optional[List[Formula]]:
+    """
+    Devuelve los operandos de una proposición plana: una sola cadena de un
+    mismo conector entre átomos o átomos negados, la forma de casi todas las
+    oraciones. Devuelve None si hay conectores anidados.
+    """
+    if not isinstance(node, Binary):
+        return None
+    operands = chain_operands(node)
+    for operand in operands:
+        if not isinstance(operand, Atom) and not (isinstance(operand, Not) and isinstance(operand.operand, Atom)):
+            return None
+    return operands
+
+
+def postorder(node: Formula, chains: bool = True) -> Iterator[Tuple[Formula, Sequence[Formula]]]:
+    """
+    Recorre la fórmula sin recursión, cada nodo después de sus operandos.
+
+    Quien recorre guarda el valor de cada nodo en una pila: al llegar a un
+    nodo, sus operandos son los últimos len(operandos) valores.
+
+    Args:
+        node (Formula): Raíz de la fórmula
+        chains (bool): Si es True una cadena de un mismo conector es un solo
+            nodo con todos sus operandos (ver chain_operands); si es False cada
+            conector tiene sus dos operandos
+
+    Yields:
+        Tuple[Formula, Sequence[Formula]]: Nodo y sus operandos (vacío en los átomos)
+    """
+    stack = [(node, None)]  # (nodo, operandos); None si aún no se apilaron sus operandos
+    while stack:
+        current, operands = stack.pop()
+        if operands is not None:
+            yield current, operands
+        elif isinstance(current, Atom):
+            yield current, ()
+        else:
+            if isinstance(current, Not):
+                operands = (current.operand,)
+            elif chains:
+                operands = chain_operands(current)
+            else:
+                operands = (current.left, current.right)
+            stack.append((current, operands))
+            stack.extend((operand, None) for operand in reversed(operands))
+
+
+def signature(node: Formula) -> Union[int, Tuple]:
+    """
+    Calcula la forma lógica de la fórmula sin el texto de los átomos.
+
+    Dos proposiciones con la misma firma tienen la misma tabla de verdad, así
+    que la firma sirve como clave de caché y para reutilizar funciones compiladas.
+
+    Args:
+        node (Formula): Raíz de la fórmula
+
+    Returns:
+        Union[int, Tuple]: Índice del átomo o tupla (símbolo, operandos...); una
+        cadena de un mismo conector es una sola tupla con todos sus operandos
+    """
+    if isinstance(node, Atom):
+        return node.index
+    flat = _flat_operands(node)
+    if flat is not None:  # Sin anidamiento no hace falta recorrer el árbol
+        return (node.symbol, *[operand.index if isinstance(operand, Atom) else ("¬", operand.operand.index)
+                               for operand in flat])
+
+    values = []  # Firmas de los subárboles pendientes
+    for current, operands in postorder(node):
+        if isinstance(current, Atom):
+            values.append(current.index)
+            continue
+        count = len(operands)
+        shape = ("¬" if isinstance(current, Not) else current.symbol, *values[-count:])
+        del values[-count:]
+        values.append(shape)
+    return values[0]
+
+
+def variables_of(node: Formula) -> List[str]:
+    """
+    Devuelve el texto de los átomos distintos en el orden de sus índices.
+
+    Args:
+        node (Formula): Raíz de la fórmula
+
+    Returns:
+        List[str]: Nombre de cada variable (la posición es el índice del átomo)
+    """
+    names = {}  # Índice -> texto
+    for atom, _ in leaves(node):
+        names.setdefault(atom.index, atom.name)
+    return [names[index] for index in sorted(names)]
+
+
+def render(node: Formula, names: Optional[Sequence[str]] = None) -> str:
+    """
+    Escribe la fórmula con símbolos lógicos. Solo se omiten los paréntesis en
+    cadenas de un mismo conector (p ∧ q ∧ r, p → q → r).
+
+    Args:
+        node (Formula): Raíz de la fórmula
+        names (Optional[Sequence[str]]): Nombre de cada variable por índice; si
+            es None se usa el texto de los átomos
+
+    Returns:
+        str: Fórmula escrita, por ejemplo "(p ∧ q) → ¬r"
+    """
+    flat = _flat_operands(node)
+    if flat is not None:  # Sin anidamiento no hace falta recorrer el árbol ni poner paréntesis
+        if names is None:
+            parts = [operand.name if isinstance(operand, Atom) else "¬" + operand.operand.name for operand in flat]
+        else:
+            parts = [names[operand.index] if isinstance(operand, Atom) else "¬" + names[operand.operand.index]
+                     for operand in flat]
+        return f" {node.symbol} ".join(parts)
+
+    values = []  # Texto de los subárboles pendientes
+    for current, operands in postorder(node):
+        if isinstance(current, Atom):
+            values.append(names[current.index] if names is not None else current.name)
+            continue
+        count = len(operands)
+        # Un operando que es otro conector va entre paréntesis: los de la misma
+        # cadena ya están separados, así que solo quedan otros conectores o el
+        # mismo conector del lado contrario a su asociatividad
+        parts = [f"({text})" if isinstance(operand, Binary) else text
+                 for operand, text in zip(operands, values[-count:])]
+        del values[-count:]
+        if isinstance(current, Not):
+            values.append("¬" + parts[0])
+        else:
+            values.append(f" {current.symbol} ".join(parts))
+    return values[0]
+
+
+def from_flat(connector: str, connector_type: str, symbol: str,
+              negations: Sequence[bool], names: Sequence[str]) -> Formula:
+    """
+    Construye una fórmula a partir de la forma plana de parse_proposition (un
+    solo conector entre varias proposiciones).
+
+    Args:
+        connector (str): Palabra del conector
+        connector_type (str): Tipo de conector
+        symbol (str): Símbolo lógico
+        negations (Sequence[bool]): Negación de cada proposición
+        names (Sequence[str]): Texto de cada proposición; los textos repetidos
+            son la misma variable
+
+    Returns:
+        Formula: Fórmula equivalente
+    """
+    atoms = {}  # Texto normalizado -> átomo
+    operands = []  # Hojas en orden
+    count = 0  # Variables distintas creadas
+    for name, negated in zip(names, negations):
+        key = normalize_atom(name)
+        atom = atoms.get(key) if key else None  # Los textos vacíos nunca se comparten
+        if atom is None:
+            atom = Atom(key, count)
+            count += 1
+            if key:
+                atoms[key] = atom
+        operands.append(Not(atom) if negated else atom)
+    if symbol in RIGHT_ASSOCIATIVE_SYMBOLS:  # p → q → r se agrupa como p → (q → r)
+        node = operands[-1]
+        for operand in reversed(operands[:-1]):
+            node = Binary(connector, connector_type, symbol, operand, node)
+    else:  # El resto se agrupa por la izquierda
+        node = operands[0]
+        for operand in operands[1:]:
+            node = Binary(connector, connector_type, symbol, node, operand)
+    return node
+
+
+def _source(shape: Union[int, Tuple], templates: Dict[str, str]) -> str:
+    """
+    Genera el código de Python de una firma de fórmula.
+
+    Args:
+        shape (Union[int, Tuple]): Firma de la fórmula (ver signature)
+        templates (Dict[str, Callable]): Plantilla de cada símbolo
+
+    Returns:
+        str: Expresión de Python que usa v[i] para cada variable
+    """
+    values = []  # Código de los subárboles pendientes
+    stack = [(shape, False)]  # (firma, operandos ya generados)
+    while stack:
+        current, ready = stack.pop()
+        if isinstance(current, int):
+            values.append(f"v[{current}]")
+        elif ready:
+            count = len(current) - 1
+            operands = values[-count:]
+            del values[-count:]
+            values.append(templates[current[0]](operands))
+        else:
+            stack.append((current, True))
+            stack.extend((operand, False) for operand in reversed(current[1:]))
+    return values[0]
+
+
+@lru_cache(maxsize=1024)
+def compile_shape(shape: Union[int, Tuple], bitwise: bool = False) -> Callable:
+    """
+    Compila una firma de fórmula a una función de Python.
+
+    Args:
+        shape (Union[int, Tuple]): Firma de la fórmula (ver signature)
+        bitwise (bool): Si es True la función trabaja con columnas de bits
+
+    Returns:
+        Callable: f(v) -> bool, o f(v, m) -> int si bitwise es True, donde v
+        tiene un valor (o una columna) por variable y m es la máscara de filas
+    """
+    if bitwise:
+        return eval(f"lambda v, m: {_source(shape, _BITWISE_TEMPLATES)}", {})
+    return eval(f"lambda v: {_source(shape, _SCALAR_TEMPLATES)}", {})
+
+
+def compile_formula(node: Formula, bitwise: bool = False) -> Callable:
+    """
+    Compila una fórmula a una función de Python.
+
+    Args:
+        node (Formula): Raíz de la fórmula
+        bitwise (bool): Si es True la función trabaja con columnas de bits
+
+    Returns:
+        Callable: Ver compile_shape
+    """
+    return compile_shape(signature(node), bitwise)
+
+
+class FormulaParser:
+    """
+    Analizador sintáctico descendente con precedencia de conectores.
+
+    Recibe los elementos que produce InterpreteLógico a partir de los tokens
+    (fragmentos de texto, conectores y comas) y construye el árbol. Orden de
+    precedencia, de menor a mayor: ↔, → (por la derecha), ∨, ∧ y la negación.
+    Un conector al principio de una cláusula ("si", "aunque", "ya sea") se
+    empareja con el siguiente conector del mismo símbolo o con una coma.
+    """
+
+    def __init__(self, items: List[Tuple]):
+        """
+        Inicializa el analizador.
+
+        Args:
+            items (List[Tuple]): Elementos en orden de aparición
+        """
+        self.items = items  # Elementos a analizar
+        self.position = 0  # Elemento actual
+        self.atoms = []  # Átomos distintos, en orden de aparición (su índice es su posición)
+        self._by_name = {}  # Texto normalizado -> átomo
+        self.prefix_depth = 0  # Mayor que cero mientras se analiza la cláusula de un conector inicial
+
+    def parse(self) -> Formula:
+        """
+        Analiza todos los elementos.
+
+        Returns:
+            Formula: Raíz de la fórmula
+        """
+        items = self.items
+        kinds = tuple(item[0] for item in items) if len(items) <= 3 else None
+        if kinds == (ITEM_TEXT,):  # Proposición sin conectores
+            self.position = 1
+            return self._new_atom(items[0][1], items[0][2])
+        if kinds == (ITEM_TEXT, ITEM_OPERATOR, ITEM_TEXT):  # "A conector B": no hace falta recorrer los niveles
+            _, word, connector_type, symbol = items[1]
+            left = self._new_atom(items[0][1], items[0][2])
+            right = self._new_atom(items[2][1], items[2][2])
+            if word == "ni":  # "A ni B" significa A ∧ ¬B
+                right = negate(right)
+            self.position = 3
+            return Binary(word, connector_type, symbol, left, right)
+        return self._parse_level(0)
+
+    def _peek(self, offset: int = 0) -> Optional[Tuple]:
+        """Devuelve un elemento sin consumirlo."""
+        index = self.position + offset
+        return self.items[index] if index < len(self.items) else None
+
+    def _skip_commas(self) -> int:
+        """Devuelve cuántas comas hay a partir de la posición actual, sin consumirlas."""
+        offset = 0
+        while (item := self._peek(offset)) is not None and item[0] == ITEM_COMMA:
+            offset += 1
+        return offset
+
+    def _new_atom(self, text: str, negated: bool) -> Formula:
+        """
+        Devuelve el átomo de un texto y lo niega si hace falta. Los textos que
+        ya aparecieron reutilizan su átomo; los operandos vacíos siempre son
+        átomos nuevos.
+        """
+        key = normalize_atom(text)
+        atom = self._by_name.get(key) if key else None
+        if atom is None:
+            atom = Atom(key, len(self.atoms))
+            self.atoms.append(atom)
+            if key:
+                self._by_name[key] = atom
+        return Not(atom) if negated else atom
+
+    def _parse_level(self, level: int) -> Formula:
+        """
+        Analiza una expresión cuyos conectores tienen al menos la precedencia dada.
+        Los conectores se leen en un solo bucle; solo se baja de nivel para el
+        operando derecho, que se queda con los conectores más fuertes.
+
+        Args:
+            level (int): Precedencia mínima
+
+        Returns:
+            Formula: Subárbol analizado
+        """
+        node = self._parse_unary()
+        items = self.items
+        links = []  # Conectores y operandos de una cadena que se agrupa por la derecha
+        while True:
+            index = self.position
+            while index < len(items) and items[index][0] == ITEM_COMMA:  # Las comas antes de un conector no cambian nada
+                index += 1
+            if index == len(items) or items[index][0] != ITEM_OPERATOR:
+                break
+            _, word, connector_type, symbol = items[index]
+            precedence = PRECEDENCE[symbol]
+            if precedence < level:
+                break
+            if links and precedence < PRECEDENCE[links[0][2]]:  # Termina la cadena antes de un conector más débil
+                node = self._fold(node, links)
+                links = []
+            self.position = index + 1  # Consume las comas y el conector
+            right = self._parse_level(precedence + 1)
+            if word == "ni":  # "A ni B" significa A ∧ ¬B
+                right = negate(right)
+            if symbol in RIGHT_ASSOCIATIVE_SYMBOLS:  # Se agrupa al terminar la cadena
+                links.append((word, connector_type, symbol, right))
+            else:
+                node = Binary(word, connector_type, symbol, node, right)
+        return self._fold(node, links) if links else node
+
+    @staticmethod
+    def _fold(node: Formula, links: List[Tuple]) -> Formula:
+        """Une una cadena por la derecha: p → q → r es p → (q → r)."""
+        operands = [node] + [link[3] for link in links]
+        node = operands[-1]
+        for index in range(len(links) - 1, -1, -1):
+            word, connector_type, symbol, _ = links[index]
+            node = Binary(word, connector_type, symbol, operands[index], node)
+        return node
+
+    def _parse_unary(self) -> Formula:
+        """
+        Analiza un operando: un fragmento de texto o un conector en posición inicial.
+        Fuera de la cláusula de un conector inicial, los fragmentos separados por
+        comas sin conector se unen en una sola proposición.
+
+        Returns:
+            Formula: Subárbol analizado
+        """
+        items = self.items
+        position = self.position
+        while position < len(items) and items[position][0] == ITEM_COMMA:  # Comas donde se espera un operando
+            position += 1
+        if position == len(items):  # Falta el operando (por ejemplo, "llueve y")
+            self.position = position
+            return self._new_atom("", False)
+        item = items[position]
+        self.position = position + 1
+
+        if item[0] == ITEM_OPERATOR:  # Conector al principio de una cláusula
+            _, word, connector_type, symbol = item
+            if word == "ni":  # "ni A" es la negación de A
+                return negate(self._parse_unary())
+            return self._parse_prefixed(word, connector_type, symbol)
+
+        _, text, negated = item
+        # "A, B" sin conector es una sola proposición
+        while not self.prefix_depth and self.position < len(items) and items[self.position][0] == ITEM_COMMA:
+            commas = self._skip_commas()
+            following = self._peek(commas)
+            if following is None or following[0] != ITEM_TEXT:
+                break
+            self.position += commas + 1
+            text = f"{text}, {following[1]}"
+            negated = negated or following[2]
+        return self._new_atom(text, negated)
+
+    def _parse_prefixed(self, word: str, connector_type: str, symbol: str) -> Formula:
+        """
+        Analiza un conector en posición inicial: "si A entonces B", "si A, B",
+        "aunque A, B", "ya sea A o B".
+
+        Args:
+            word (str): Palabra del conector inicial
+            connector_type (str): Tipo del conector
+            symbol (str): Símbolo lógico
+
+        Returns:
+            Formula: Subárbol analizado
+        """
+        level = PRECEDENCE[symbol]
+        self.prefix_depth += 1  # La coma separa la cláusula del resto
+        left = self._parse_level(level + 1)
+        self.prefix_depth -= 1
+
+        commas = self._skip_commas()
+        item = self._peek(commas)
+        if item is not None and item[0] == ITEM_OPERATOR and item[3] == symbol:  # "si A entonces B"
+            self.position += commas + 1
+            word, connector_type = item[1], item[2]
+        elif commas and item is not None and item[0] == ITEM_TEXT:  # "si A, B"
+            self.position += commas
+        else:  # El conector inicial no tiene pareja: solo marca la cláusula
+            return left
+
+        next_level = level if symbol in RIGHT_ASSOCIATIVE_SYMBOLS else level + 1
+        right = self._parse_level(next_level)
+        if word == "ni":  # "ni A ni B": la segunda negación va con su conector
+            right = negate(right)
+        return Binary(word, connector_type, symbol, left, right)
@@ -1,80 +1,456 @@
-from itertools import product  # Importa la función product para generar combinaciones de valores
-from typing import Tuple, Union, Dict, List  # Importa tipos para anotaciones de funciones
+from __future__ import annotations  # Las anotaciones no se evalúan al importar
+from functools import lru_cache  # Importa la caché para compilar el analizador una sola vez
+from _thread import allocate_lock as Lock  # Importa el candado para la instancia compartida (es threading.Lock sin cargar threading)
+from types import MappingProxyType  # Importa la vista de solo lectura para los diccionarios
+from typing import Callable, Iterator, Tuple, Union, Dict, List, Sequence, NamedTuple, Hashable  # Importa tipos para anotaciones de funciones
+from metrics import Metrics, metered  # Importa la instrumentación opcional por etapas
+from symbols import SymbolTable  # Importa la tabla de símbolos de los átomos
+# cache, sat, bdd y minimize se importan dentro de los métodos que los usan, así que
+# importar el intérprete solo carga lo necesario para analizar y generar tablas
+from formula import (  # Importa el árbol de fórmulas y su analizador sintáctico
+    Formula, Binary, FormulaParser, ITEM_TEXT, ITEM_OPERATOR, ITEM_COMMA, ATOM_NAMES,
+    atom_names, compile_formula, from_flat, leaves, render, result_column, signature, variable_column, variables_of
+)
+
+# Tipos de token que produce el analizador léxico
+TOKEN_CONNECTOR = "CONECTOR"
+TOKEN_NEGATION = "NEGACIÓN"
+
+# Palabras que indican negación (tablas inmutables construidas una sola vez al importar el módulo)
+NEGATIONS = (
+    "no", "nunca", "jamás", "tampoco", "ni", "ningún", "ninguno",
+    "nadie", "nada", "sin", "ni siquiera"
+)
+
+# Diccionario de palabras clave y sus tipos
+KEY_WORDS = MappingProxyType({
+    # Conectores condicionales
+    "si": "CONDICIONAL",
+    "entonces": "CONDICIONAL",
+    "siempre que": "CONDICIONAL",
+    "a condición de que": "CONDICIONAL",
+
+    # Conectores de conjunción
+    "y": "CONJUNCIÓN",
+    "además": "CONJUNCIÓN",
+    "también": "CONJUNCIÓN",
+    "ni": "CONJUNCIÓN",
+
+    # Conectores de disyunción
+    "o": "DISYUNCIÓN",
+    "o bien": "DISYUNCIÓN",
+    "ya sea": "DISYUNCIÓN",
+
+    # Conectores adversativos
+    "pero": "ADVERSATIVO",
+    "sin embargo": "ADVERSATIVO",
+    "no obstante": "ADVERSATIVO",
+    "aunque": "ADVERSATIVO",
+
+    # Conectores causales
+    "porque": "CAUSAL",
+    "puesto que": "CAUSAL",
+    "ya que": "CAUSAL",
+    "dado que": "CAUSAL",
+
+    # Conectores consecutivos
+    "por lo tanto": "CONSECUTIVO",
+    "en consecuencia": "CONSECUTIVO",
+    "por consiguiente": "CONSECUTIVO",
+    "así que": "CONSECUTIVO",
+
+    # Otros conectores
+    "es decir": "EXPLICATIVO",
+    "o sea": "EXPLICATIVO",
+    "por ejemplo": "EJEMPLIFICATIVO"
+})
+
+# Mapeo de conectores a símbolos lógicos
+LOGICAL_OPERATIONS = MappingProxyType({
+    "CONDICIONAL": "→",
+    "CONJUNCIÓN": "∧",
+    "DISYUNCIÓN": "∨",
+    "ADVERSATIVO": "∧",
+    "CAUSAL": "→",
+    "CONSECUTIVO": "→",
+    "EXPLICATIVO": "↔",
+    "EJEMPLIFICATIVO": "→"
+})
+
+# Filas que se calculan o formatean de una sola vez en las tablas perezosas
+TABLE_PAGE_SIZE = 1024
+
+# Operaciones bit a bit por tipo de conector: cada bit de la columna es una fila de la tabla
+BITWISE_OPERATIONS = MappingProxyType({
+    "CONDICIONAL": lambda p, q, mask: (p ^ mask) | q,  # p → q  ≡  ¬p ∨ q
+    "CONJUNCIÓN": lambda p, q, mask: p & q,  # p ∧ q
+    "DISYUNCIÓN": lambda p, q, mask: p | q,  # p ∨ q
+    "ADVERSATIVO": lambda p, q, mask: p & q,  # p ∧ q
+    "CAUSAL": lambda p, q, mask: (p ^ mask) | q,  # p → q
+    "CONSECUTIVO": lambda p, q, mask: (p ^ mask) | q,  # p → q
+    "EXPLICATIVO": lambda p, q, mask: (p ^ q) ^ mask,  # p ↔ q
+    "EJEMPLIFICATIVO": lambda p, q, mask: (p ^ mask) | q  # p → q
+})
+
+# Conectores que se agrupan por la derecha cuando hay más de dos proposiciones
+RIGHT_ASSOCIATIVE = frozenset({"CONDICIONAL", "CAUSAL", "CONSECUTIVO", "EJEMPLIFICATIVO"})
+
+
+def column_to_cells(column: int, rows: int) -> str:
+    """
+    Convierte una columna empaquetada en una cadena de "V" y "F".
+    
+    Args:
+        column (int): Columna de bits
+        rows (int): Número de filas
+        
+    Returns:
+        str: Un carácter por fila, en orden
+    """
+    bits = format(column, f"0{rows}b")[::-1]  # El bit 0 es la primera fila
+    return bits.translate(_CELL_TRANSLATION)
+
+
+_CELL_TRANSLATION = str.maketrans("10", "VF")  # Tabla de traducción de bits a celdas
+
+# Columnas de las variables de las tablas de 1 a 3 átomos (casi todas las
+# oraciones), calculadas una sola vez
+_SMALL_COLUMNS = {count: tuple(variable_column(i, count) for i in range(count)) for count in range(1, 4)}
+
+# Celdas de las variables de cada fila de esas mismas tablas
+_SMALL_ROWS = {count: tuple(zip(*(column_to_cells(column, 1 << count) for column in columns)))
+               for count, columns in _SMALL_COLUMNS.items()}
+
+
+def variable_cells(index: int, count: int, start: int, stop: int) -> str:
+    """
+    Celdas "V"/"F" de una variable en un rango de filas, sin construir la columna completa.
+    
+    Args:
+        index (int): Posición de la variable
+        count (int): Número total de variables
+        start (int): Primera fila
+        stop (int): Fila siguiente a la última
+        
+    Returns:
+        str: Un carácter por fila del rango
+    """
+    shift = count - 1 - index  # La variable cambia cada 2**shift filas
+    pieces = []  # Tramos de filas con el mismo valor
+    row = start
+    while row < stop:
+        block = row >> shift  # Bloque de filas al que pertenece la fila
+        end = min(stop, (block + 1) << shift)  # Fin del bloque dentro del rango
+        pieces.append(("F" if block & 1 else "V") * (end - row))
+        row = end
+    return "".join(pieces)
+
+
+class TruthTableView:
+    """
+    Tabla de verdad perezosa con acceso directo a cualquier fila.
+    
+    Se comporta como la lista de generate_truth_table (la posición 0 son los
+    encabezados y las posiciones 1..2**N son las filas), pero solo guarda la
+    columna de resultados empaquetada y calcula las celdas al pedirlas.
+    
+    Attributes:
+        headers (List[str]): Encabezados de las columnas
+        result (int): Columna de resultados (bit r = fila r)
+        count (int): Número de variables
+        size (int): Número de filas
+    """
+    
+    def __init__(self, headers: List[str], result: int, count: int):
+        """
+        Inicializa la vista.
+        
+        Args:
+            headers (List[str]): Encabezados de las columnas
+            result (int): Columna de resultados empaquetada
+            count (int): Número de variables
+        """
+        self.headers = headers
+        self.result = result
+        self.count = count
+        self.size = 1 << count
+    
+    def __len__(self) -> int:
+        """Número de filas más la fila de encabezados."""
+        return self.size + 1
+    
+    def row(self, k: int) -> List[str]:
+        """
+        Calcula la fila k (desde 0, sin contar los encabezados).
+        
+        Args:
+            k (int): Número de fila
+            
+        Returns:
+            List[str]: Celdas de la fila
+        """
+        if not 0 <= k < self.size:
+            raise IndexError("Fila fuera de la tabla de verdad")
+        cells = ["F" if (k >> (self.count - 1 - i)) & 1 else "V" for i in range(self.count)]  # Valores de las variables
+        cells.append("V" if (self.result >> k) & 1 else "F")  # Resultado
+        return cells
+    
+    def rows(self, start: int, stop: int) -> List[List[str]]:
+        """
+        Calcula un rango de filas (desde 0, sin contar los encabezados).
+        
+        Args:
+            start (int): Primera fila
+            stop (int): Fila siguiente a la última
+            
+        Returns:
+            List[List[str]]: Filas del rango
+        """
+        start, stop = max(start, 0), min(stop, self.size)
+        if start >= stop:
+            return []
+        length = stop - start
+        columns = [variable_cells(i, self.count, start, stop) for i in range(self.count)]  # Variables del rango
+        columns.append(column_to_cells((self.result >> start) & ((1 << length) - 1), length))  # Resultados del rango
+        return [list(row) for row in zip(*columns)]
+    
+    def __getitem__(self, index):
+        """Acceso como lista: 0 son los encabezados; admite rebanadas contiguas."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            head = [list(self.headers)] if start == 0 < stop else []
+            return head + self.rows(max(start, 1) - 1, stop - 1)
+        if index < 0:
+            index += len(self)
+        if index == 0:
+            return list(self.headers)
+        return self.row(index - 1)
+    
+    def __iter__(self):
+        """Recorre los encabezados y las filas por páginas."""
+        yield list(self.headers)
+        for start in range(0, self.size, TABLE_PAGE_SIZE):
+            yield from self.rows(start, start + TABLE_PAGE_SIZE)
+
+
+def normalize_proposition(text: str) -> str:
+    """
+    Normaliza una proposición: minúsculas, espacios simples y sin punto final.
+    
+    Args:
+        text (str): Proposición original
+        
+    Returns:
+        str: Proposición normalizada (clave de la caché)
+    """
+    return " ".join(text.lower().split()).strip('. ')
+
+
+def freeze_parsed(parsed_prop: Dict) -> MappingProxyType:
+    """
+    Convierte una proposición analizada en una estructura de solo lectura.
+    
+    Args:
+        parsed_prop (Dict): Proposición analizada
+        
+    Returns:
+        MappingProxyType: Vista inmutable con listas convertidas en tuplas
+    """
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in parsed_prop.items()
+    })
+
+
+class Token(NamedTuple):
+    """Palabra clave encontrada por el analizador léxico."""
+    kind: str  # TOKEN_CONNECTOR o TOKEN_NEGATION
+    word: str  # Palabra clave en minúsculas con espacios simples
+    start: int  # Posición inicial en el texto
+    end: int  # Posición final en el texto
+
+
+def _prefix_tree_pattern(words: List[str]) -> str:
+    """
+    Escribe una alternativa de palabras como un árbol de prefijos: "o", "o bien"
+    y "o sea" quedan como o(?:\\s+(?:bien|sea))?. Así cada posición del texto se
+    descarta en cuanto falla su primera letra, en lugar de probar cada palabra.
+
+    Args:
+        words (List[str]): Palabras en minúsculas con espacios simples
+
+    Returns:
+        str: Expresión regular equivalente a la alternativa de las palabras
+    """
+    import re  # Importa expresiones regulares solo al compilar el analizador
+    root = {}  # Letra -> subárbol; "" marca el final de una palabra
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def branches(node: Dict) -> str:
+        options = [(r"\s+" if char == " " else re.escape(char)) + branches(child)
+                   for char, child in sorted(node.items()) if char]
+        if not options:
+            return ""
+        body = options[0] if len(options) == 1 else f"(?:{'|'.join(options)})"
+        if "" in node:  # La palabra puede terminar aquí: la continuación es opcional (y se prueba primero)
+            body = f"(?:{body})?" if len(options) == 1 else f"{body}?"
+        return body
+
+    return branches(root)
+
+
+@lru_cache(maxsize=None)
+def compile_lexer(connectors: Tuple[str, ...], negations: Tuple[str, ...],
+                  ignore_case: bool = False) -> "re.Pattern":
+    """
+    Compila una única expresión regular que reconoce conectores y negaciones.
+    
+    Las palabras forman un árbol de prefijos en el que la continuación más larga
+    se prueba primero, para que "o bien" gane a "o" y "ni siquiera" a "ni", y se
+    exigen límites de palabra para que "o" no se encuentre dentro de "todo" ni
+    "y" dentro de "ayer". Se compila en el primer tokenize, no al importar.
+    
+    Args:
+        connectors (Tuple[str, ...]): Palabras clave de conectores
+        negations (Tuple[str, ...]): Palabras de negación
+        ignore_case (bool): Si es True, la expresión ignora mayúsculas; por
+            defecto se aplica al texto ya en minúsculas, que se compila en la
+            mitad de tiempo
+        
+    Returns:
+        re.Pattern: Expresión compilada (se reutiliza entre instancias)
+    """
+    import re  # Importa expresiones regulares solo al analizar el primer texto
+    words = sorted(set(connectors) | set(negations))
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile(rf"(?<!\w)(?:{_prefix_tree_pattern(words)})(?!\w)", flags)
 
 class InterpreteLógico:
     """
     Clase principal para el análisis y evaluación de proposiciones lógicas.
     
+    Las tablas de palabras clave son inmutables y compartidas por todas las
+    instancias, así que crear un intérprete no cuesta nada y una misma instancia
+    puede usarse desde varios hilos.
+    
     Attributes:
-        KEY_WORDS (dict): Diccionario de palabras clave y sus tipos de conectores
-        LOGICAL_OPERATIONS (dict): Mapeo de tipos de conectores a símbolos lógicos
-        NEGATIONS (list): Lista de palabras que indican negación
+        KEY_WORDS (MappingProxyType): Diccionario de palabras clave y sus tipos de conectores
+        LOGICAL_OPERATIONS (MappingProxyType): Mapeo de tipos de conectores a símbolos lógicos
+        NEGATIONS (tuple): Palabras que indican negación
     """
     
-    def __init__(self):
-        """Inicializa el intérprete con sus diccionarios y listas de palabras clave."""
-        
-        # Palabras que indican negación
-        self.NEGATIONS = [
-            "no", "nunca", "jamás", "tampoco", "ni", "ningún", "ninguno",
-            "nadie", "nada", "sin", "ni siquiera"
-        ]
-        
-        # Diccionario de palabras clave y sus tipos
-        self.KEY_WORDS = {
-            # Conectores condicionales
-            "si": "CONDICIONAL",
-            "entonces": "CONDICIONAL",
-            "siempre que": "CONDICIONAL",
-            "a condición de que": "CONDICIONAL",
-            
-            # Conectores de conjunción
-            "y": "CONJUNCIÓN",
-            "además": "CONJUNCIÓN",
-            "también": "CONJUNCIÓN",
-            "ni": "CONJUNCIÓN",
-            
-            # Conectores de disyunción
-            "o": "DISYUNCIÓN",
-            "o bien": "DISYUNCIÓN",
-            "ya sea": "DISYUNCIÓN",
-            
-            # Conectores adversativos
-            "pero": "ADVERSATIVO",
-            "sin embargo": "ADVERSATIVO",
-            "no obstante": "ADVERSATIVO",
-            "aunque": "ADVERSATIVO",
-            
-            # Conectores causales
-            "porque": "CAUSAL",
-            "puesto que": "CAUSAL",
-            "ya que": "CAUSAL",
-            "dado que": "CAUSAL",
-            
-            # Conectores consecutivos
-            "por lo tanto": "CONSECUTIVO",
-            "en consecuencia": "CONSECUTIVO",
-            "por consiguiente": "CONSECUTIVO",
-            "así que": "CONSECUTIVO",
-            
-            # Otros conectores
-            "es decir": "EXPLICATIVO",
-            "o sea": "EXPLICATIVO",
-            "por ejemplo": "EJEMPLIFICATIVO"
-        }
+    KEY_WORDS = KEY_WORDS
+    LOGICAL_OPERATIONS = LOGICAL_OPERATIONS
+    NEGATIONS = NEGATIONS
+    
+    # Palabras clave del analizador léxico
+    _lexer_words = (tuple(KEY_WORDS), NEGATIONS)
+    _negation_words = frozenset(NEGATIONS)
+    # Palabra clave ya normalizada -> tipo de token (evita normalizar cada coincidencia)
+    _token_kinds = MappingProxyType({**dict.fromkeys(NEGATIONS, TOKEN_NEGATION),
+                                     **dict.fromkeys(KEY_WORDS, TOKEN_CONNECTOR)})
+    # Palabra de cada conector -> elemento de FormulaParser
+    _operator_items = MappingProxyType({
+        word: (ITEM_OPERATOR, word, connector_type, LOGICAL_OPERATIONS[connector_type])
+        for word, connector_type in KEY_WORDS.items()
+    })
+    
+    def __init__(self, cache_size: int = 0, metrics: Union[Metrics, None] = None,
+                 symbols: Union[SymbolTable, None] = None):
+        """
+        Inicializa el intérprete.
         
-        # Mapeo de conectores a símbolos lógicos
-        self.LOGICAL_OPERATIONS = {
-            "CONDICIONAL": "→",
-            "CONJUNCIÓN": "∧",
-            "DISYUNCIÓN": "∨",
-            "ADVERSATIVO": "∧",
-            "CAUSAL": "→",
-            "CONSECUTIVO": "→",
-            "EXPLICATIVO": "↔",
-            "EJEMPLIFICATIVO": "→"
-        }
+        Args:
+            cache_size (int): Entradas de la caché LRU de análisis y de tablas de
+                verdad; con 0 (por defecto) no se guarda nada. Con la caché activa
+                los resultados son de solo lectura (MappingProxyType y tuplas).
+            metrics (Union[Metrics, None]): Registro donde se miden las etapas
+                "tokenize", "negation", "parse", "table" y "format"; con None
+                (por defecto) no se mide nada
+            symbols (Union[SymbolTable, None]): Tabla donde se internan los
+                átomos con intern_atom y variable_ids; con None (por defecto)
+                no se interna nada. Puede compartirse entre intérpretes para
+                que un corpus use los mismos identificadores
+        """
+        self._parse_cache = self._table_cache = None
+        if cache_size > 0:
+            from cache import LRUCache  # Importa la caché solo cuando se pide
+            self._parse_cache = LRUCache(cache_size)  # Análisis por texto normalizado
+            self._table_cache = LRUCache(cache_size)  # Tablas por estructura lógica
+        self._metrics = metrics  # Instrumentación opcional
+        self.symbols = symbols  # Identificadores de los átomos (opcional)
     
+    def cache_info(self) -> Dict[str, Dict]:
+        """
+        Devuelve las estadísticas de las cachés del intérprete.
+        
+        Returns:
+            Dict[str, Dict]: Estadísticas de 'parse' y 'table' (vacío si la caché está desactivada)
+        """
+        if self._parse_cache is None:
+            return {}
+        return {'parse': self._parse_cache.info(), 'table': self._table_cache.info()}
+    
+    @metered("tokenize")
+    def tokenize(self, text: str) -> List[Token]:
+        """
+        Encuentra todos los conectores y negaciones del texto en una sola pasada.
+        
+        Args:
+            text (str): El texto a analizar
+            
+        Returns:
+            List[Token]: Tokens en orden de aparición con sus posiciones
+        """
+        lowered = text.lower()
+        if len(lowered) == len(text):  # Las posiciones del texto en minúsculas son las del original
+            lexer = compile_lexer(*self._lexer_words)  # Se compila en el primer uso y luego se reutiliza
+        else:  # Alguna letra cambia de longitud al pasar a minúsculas
+            lowered = text
+            lexer = compile_lexer(*self._lexer_words, True)
+        kinds = self._token_kinds
+        tokens = []  # Lista de tokens encontrados
+        for match in lexer.finditer(lowered):  # Recorre el texto una sola vez
+            word = match.group()
+            kind = kinds.get(word)  # Clasifica el token
+            if kind is None:  # Varios espacios o mayúsculas: se normaliza antes de clasificar
+                word = " ".join(word.lower().split())
+                kind = TOKEN_CONNECTOR if word in self.KEY_WORDS else TOKEN_NEGATION
+            tokens.append(Token(kind, word, match.start(), match.end()))
+        return tokens  # Devuelve los tokens
+
+    @metered("negation")
+    def _strip_negations(self, text: str, tokens: List[Token], start: int, end: int) -> Tuple[bool, str]:
+        """
+        Elimina las negaciones de un tramo del texto usando sus tokens.
+        
+        Args:
+            text (str): Texto completo
+            tokens (List[Token]): Tokens del texto completo
+            start (int): Inicio del tramo
+            end (int): Fin del tramo
+            
+        Returns:
+            Tuple[bool, str]: (tiene_negación, tramo_sin_negación)
+        """
+        is_negated = False  # Inicializa la variable de negación
+        pieces = []  # Fragmentos del tramo que no son negaciones
+        cursor = start  # Posición desde la que se copia el texto
+        for token in tokens:  # Recorre los tokens del tramo
+            if token.start < start or token.end > end or token.word not in self._negation_words:
+                continue  # Ignora los tokens que no son negaciones del tramo
+            is_negated = True  # Marca que hay negación
+            pieces.append(text[cursor:token.start])  # Copia el texto anterior a la negación
+            cursor = token.end  # Salta la palabra de negación
+        pieces.append(text[cursor:end])  # Copia el resto del tramo
+        return is_negated, " ".join(" ".join(pieces).split())  # Devuelve la negación y el tramo limpio
+
     def check_negation(self, proposition: str) -> Tuple[bool, str]:
         """
         Verifica si una proposición contiene una negación y la procesa.
@@ -86,21 +462,49 @@ class InterpreteLógico:
             Tuple[bool, str]: (tiene_negación, proposición_sin_negación)
         """
         proposition = proposition.lower().strip()  # Convierte la proposición a minúsculas y elimina espacios
-        is_negated = False  # Inicializa la variable de negación
+        tokens = self.tokenize(proposition)  # Encuentra las negaciones en una sola pasada
+        return self._strip_negations(proposition, tokens, 0, len(proposition))  # Devuelve si hay negación y la proposición limpia
+
+    def intern_atom(self, proposition: str) -> Tuple[int, bool]:
+        """
+        Obtiene el identificador de una proposición atómica sin sus negaciones.
         
-        for neg in self.NEGATIONS:  # Itera sobre las palabras de negación
-            if proposition.startswith(neg + " "):  # Verifica si la proposición comienza con una negación
-                is_negated = True  # Marca que hay negación
-                proposition = proposition[len(neg):].strip()  # Elimina la negación de la proposición
-            elif f" {neg} " in proposition:  # Verifica si hay una negación en medio de la proposición
-                is_negated = True  # Marca que hay negación
-                proposition = proposition.replace(f" {neg} ", " ").strip()  # Elimina la negación de la proposición
+        Args:
+            proposition (str): Proposición atómica, por ejemplo "No llueve"
+            
+        Returns:
+            Tuple[int, bool]: (identificador en la tabla de símbolos, tiene_negación)
+            
+        Raises:
+            ValueError: Si el intérprete no tiene tabla de símbolos
+        """
+        is_negated, clean = self.check_negation(proposition)  # Quita las negaciones
+        return self._symbol_table().intern(clean), is_negated
+
+    def variable_ids(self, parsed_prop: Dict) -> List[int]:
+        """
+        Obtiene los identificadores de las variables de una proposición.
         
-        return is_negated, proposition  # Devuelve si hay negación y la proposición limpia
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            List[int]: Identificador de cada variable, en el orden de 'variables'
+            
+        Raises:
+            ValueError: Si el intérprete no tiene tabla de símbolos
+        """
+        return self._symbol_table().intern_all(self.variables(parsed_prop))
+
+    def _symbol_table(self) -> SymbolTable:
+        """Devuelve la tabla de símbolos o avisa de que no se configuró."""
+        if self.symbols is None:
+            raise ValueError("El intérprete no tiene tabla de símbolos: use InterpreteLógico(symbols=SymbolTable())")
+        return self.symbols
 
     def find_connector(self, text: str) -> Union[str, None]:
         """
-        Encuentra el primer conector lógico en el texto.
+        Encuentra el conector lógico principal del texto (el de menor precedencia).
         
         Args:
             text (str): El texto a analizar
@@ -108,14 +512,9 @@ class InterpreteLógico:
         Returns:
             Union[str, None]: El conector encontrado o None
         """
-        text = text.lower()  # Convierte el texto a minúsculas
-        sorted_connectors = sorted(self.KEY_WORDS.keys(), key=len, reverse=True)  # Ordena los conectores por longitud
-        
-        for connector in sorted_connectors:  # Itera sobre los conectores ordenados
-            if connector in text:  # Verifica si el conector está en el texto
-                return connector  # Devuelve el conector encontrado
-        return None  # Devuelve None si no se encuentra ningún conector
+        return self.parse_proposition(text)['connector']  # Conector de la raíz del árbol
 
+    @metered("parse", lambda args, parsed: parsed['connector_type'])
     def parse_proposition(self, text: str) -> Dict:
         """
         Analiza una proposición y extrae sus componentes.
@@ -126,75 +525,487 @@ class InterpreteLógico:
         Returns:
             Dict: Diccionario con los componentes de la proposición
         """
-        text = text.lower().strip('.')  # Convierte el texto a minúsculas y elimina el punto final
-        connector = self.find_connector(text)  # Busca el conector en el texto
+        text = normalize_proposition(text)  # Convierte el texto a minúsculas y elimina el punto final
+        if self._parse_cache is None:  # Sin caché se analiza siempre
+            return self._parse(text)
         
-        if not connector:  # Si no se encuentra un conector
-            is_negated, clean_text = self.check_negation(text)  # Verifica la negación
-            return {
-                'connector': None,  # No hay conector
-                'connector_type': None,  # No hay tipo de conector
-                'propositions': [text],  # La proposición limpia
-                'symbol': None,  # No hay símbolo
-                'negations': [is_negated]  # Lista de negaciones
-            }
-        
-        connector_type = self.KEY_WORDS[connector]  # Obtiene el tipo de conector
-        logical_symbol = self.LOGICAL_OPERATIONS[connector_type]  # Obtiene el símbolo lógico
-        
-        parts = text.split(connector)  # Divide el texto en partes usando el conector
-        propositions = []  # Lista para almacenar las proposiciones
-        negations = []  # Lista para almacenar las negaciones
+        parsed = self._parse_cache.get(text)  # Busca el análisis de la misma proposición normalizada
+        if parsed is None:
+            parsed = freeze_parsed(self._parse(text))  # Se guarda inmutable para que nadie lo modifique
+            self._parse_cache.put(text, parsed)
+        return parsed
+
+    def _parse(self, text: str) -> Dict:
+        """
+        Analiza una proposición ya normalizada.
         
-        for part in parts:  # Itera sobre las partes
-            is_negated, clean_prop = self.check_negation(part.strip())  # Verifica la negación de cada parte
-            propositions.append(clean_prop)  # Agrega la proposición limpia a la lista
-            negations.append(is_negated)  # Agrega la negación a la lista
+        Args:
+            text (str): La proposición normalizada
+            
+        Returns:
+            Dict: Diccionario con los componentes de la proposición
+        """
+        parser = FormulaParser(self._formula_items(text))
+        formula = parser.parse()  # Construye el árbol de la proposición
+        atoms = leaves(formula)  # Proposiciones atómicas en orden de aparición
+        root = formula if isinstance(formula, Binary) else None  # Conector principal, si lo hay
+        variables = [atom.name for atom in parser.atoms]  # Átomos distintos (variables de la tabla)
         
         return {
-            'connector': connector,  # Devuelve el conector encontrado
-            'connector_type': connector_type,  # Devuelve el tipo de conector
-            'propositions': propositions,  # Devuelve las proposiciones
-            'symbol': logical_symbol,  # Devuelve el símbolo lógico
-            'negations': negations  # Devuelve la lista de negaciones
+            'connector': root.connector if root else None,  # Devuelve el conector principal
+            'connector_type': root.connector_type if root else None,  # Devuelve el tipo de conector
+            'propositions': [atom.name for atom, _ in atoms],  # Devuelve las proposiciones
+            'symbol': root.symbol if root else None,  # Devuelve el símbolo lógico
+            'negations': [negated for _, negated in atoms],  # Devuelve la lista de negaciones
+            'variables': variables,  # Devuelve los átomos distintos
+            'formula': formula  # Devuelve el árbol completo
         }
+
+    def parse_formula(self, text: str) -> Formula:
+        """
+        Construye el árbol de una proposición con varios conectores anidados.
+        
+        Args:
+            text (str): La proposición a analizar
+            
+        Returns:
+            Formula: Raíz del árbol
+        """
+        return self._parse_formula(normalize_proposition(text))
+
+    def _parse_formula(self, text: str) -> Formula:
+        """
+        Construye el árbol de una proposición ya normalizada.
+        
+        Args:
+            text (str): La proposición normalizada
+            
+        Returns:
+            Formula: Raíz del árbol
+        """
+        return FormulaParser(self._formula_items(text)).parse()
+
+    def _formula_items(self, text: str) -> List[Tuple]:
+        """
+        Divide una proposición ya normalizada en fragmentos de texto, conectores y comas.
+        
+        Args:
+            text (str): La proposición normalizada
+            
+        Returns:
+            List[Tuple]: Elementos para FormulaParser, en orden de aparición
+        """
+        tokens = self.tokenize(text)  # Encuentra conectores y negaciones en una sola pasada
+        items = []  # Fragmentos de texto, conectores y comas en orden
+        start = 0  # Inicio del fragmento actual
+        negations = []  # Negaciones del fragmento actual (cada fragmento solo revisa las suyas)
+        for token in tokens + [None]:  # El None cierra el último fragmento
+            if token is not None and token.kind == TOKEN_NEGATION:
+                negations.append(token)
+                continue
+            end = token.start if token else len(text)
+            self._segment_items(text, negations, start, end, items)  # Texto anterior al conector
+            negations = []
+            if token is not None:
+                items.append(self._operator_items[token.word])  # Conector con su tipo y su símbolo
+                start = token.end
+        return items
+
+    def _segment_items(self, text: str, tokens: List[Token], start: int, end: int, items: List[Tuple]) -> None:
+        """
+        Divide el texto entre dos conectores en proposiciones separadas por comas.
+        
+        Args:
+            text (str): Texto completo
+            tokens (List[Token]): Tokens del fragmento (al menos sus negaciones)
+            start (int): Inicio del fragmento
+            end (int): Fin del fragmento
+            items (List[Tuple]): Lista a la que se agregan los elementos
+        """
+        while True:
+            comma = text.find(",", start, end)  # Siguiente coma del fragmento
+            stop = comma if comma != -1 else end
+            if tokens:
+                is_negated, clean = self._strip_negations(text, tokens, start, stop)  # Quita las negaciones
+            else:  # Fragmento sin negaciones
+                is_negated, clean = False, " ".join(text[start:stop].split())
+            if clean:
+                items.append((ITEM_TEXT, clean, is_negated))
+            if comma == -1:
+                return
+            items.append((ITEM_COMMA,))
+            start = comma + 1
     
-    def evaluate_expression(self, values: Tuple[bool, bool], 
+    def evaluate_expression(self, values: Sequence[bool], 
                           connector_type: str, 
                           negations: List[bool]) -> bool:
         """
         Evalúa una expresión lógica considerando negaciones.
         
         Args:
-            values (Tuple[bool, bool]): Valores de verdad de las proposiciones
+            values (Sequence[bool]): Valores de verdad de las proposiciones
             connector_type (str): Tipo de conector lógico
             negations (List[bool]): Lista de negaciones para cada proposición
             
         Returns:
             bool: Resultado de la evaluación
         """
-        p, q = values  # Asigna los valores de verdad a p y q
+        if connector_type not in BITWISE_OPERATIONS:  # Verifica que el conector sea conocido
+            return None  # Devuelve None si no se puede evaluar
+        
+        bits = [int(value) ^ int(negated) for value, negated in zip(values, negations)]  # Aplica las negaciones
+        bits.extend(int(value) for value in values[len(bits):])  # Valores sin negación indicada
+        return bool(self._combine(bits, connector_type, 1))  # Evalúa la expresión con columnas de un bit
+
+    def _combine(self, columns: List[int], connector_type: str, mask: int) -> int:
+        """
+        Aplica un conector a varias columnas empaquetadas.
+        
+        Args:
+            columns (List[int]): Columnas de bits ya negadas
+            connector_type (str): Tipo de conector lógico
+            mask (int): Máscara con un bit por fila
+            
+        Returns:
+            int: Columna de resultados
+        """
+        operation = BITWISE_OPERATIONS[connector_type]  # Operación bit a bit del conector
+        if connector_type in RIGHT_ASSOCIATIVE:  # p → q → r se agrupa como p → (q → r)
+            result = columns[-1]
+            for column in reversed(columns[:-1]):
+                result = operation(column, result, mask)
+        else:  # El resto se agrupa por la izquierda
+            result = columns[0]
+            for column in columns[1:]:
+                result = operation(result, column, mask)
+        return result
+
+    def truth_columns(self, parsed_prop: Dict) -> Union[Dict, None]:
+        """
+        Calcula todas las filas de la tabla de verdad a la vez como columnas de bits.
+        
+        Cada columna es un entero de 2**N bits y cada conector se aplica con una
+        sola operación bit a bit sobre la columna completa. N es el número de
+        átomos distintos: "no llueve o llueve" tiene una sola variable.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            Union[Dict, None]: Diccionario con 'headers', 'columns' y 'rows', o
+            None si la proposición no tiene al menos dos componentes
+        """
+        if not parsed_prop['connector_type'] or len(parsed_prop['propositions']) < 2:
+            return None  # No se puede generar la tabla
+        
+        formula = self._formula_of(parsed_prop)  # Árbol de la proposición
+        count = len(self.variables(parsed_prop))  # Número de variables (átomos distintos)
+        rows = 1 << count  # Número de filas de la tabla
+        mask = (1 << rows) - 1  # Máscara con todas las filas
+        headers = self._table_headers(formula, count)  # Encabezados con negaciones y del resultado
+        
+        if count in _SMALL_COLUMNS:  # Tablas pequeñas: columnas ya calculadas
+            columns = list(_SMALL_COLUMNS[count])
+        else:
+            columns = [variable_column(i, count) for i in range(count)]  # Columnas de cada variable
+        result = compile_formula(formula, bitwise=True)(columns, mask)  # Evalúa todas las filas a la vez
+        columns.append(result)  # Agrega la columna del resultado
+        return {'headers': headers, 'columns': columns, 'rows': rows}
+
+    def table_headers(self, parsed_prop: Dict) -> List[str]:
+        """
+        Encabezados de la tabla de verdad de una proposición, sin calcularla.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            List[str]: Los mismos encabezados que truth_columns
+        """
+        return self._table_headers(self._formula_of(parsed_prop), len(self.variables(parsed_prop)))
+
+    def _table_headers(self, formula: Formula, count: int) -> List[str]:
+        """
+        Encabezados de una tabla de verdad: una variable que solo aparece negada
+        se escribe con ¬ y la última columna es la fórmula completa.
+        
+        Args:
+            formula (Formula): Árbol de la proposición
+            count (int): Número de variables
+            
+        Returns:
+            List[str]: Encabezado de cada variable y del resultado
+        """
+        names = atom_names(count)  # Nombre de cada variable por índice
+        negated = [True] * count  # Variables que solo aparecen negadas
+        for atom, is_negated in leaves(formula):
+            negated[atom.index] = negated[atom.index] and is_negated
+        headers = ["¬" + name if is_negated else name for name, is_negated in zip(names, negated)]
+        headers.append(render(formula, names))
+        return headers
+
+    def _formula_of(self, parsed_prop: Dict) -> Formula:
+        """
+        Devuelve el árbol de una proposición analizada.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada (si no trae 'formula' se
+                construye a partir de su forma plana)
+            
+        Returns:
+            Formula: Raíz del árbol
+        """
+        formula = parsed_prop.get('formula')
+        if formula is None:  # Diccionarios construidos a mano con un solo conector
+            formula = from_flat(parsed_prop['connector'], parsed_prop['connector_type'], parsed_prop['symbol'],
+                                parsed_prop['negations'], parsed_prop['propositions'])
+        return formula
+
+    def variables(self, parsed_prop: Dict) -> List[str]:
+        """
+        Devuelve las proposiciones atómicas distintas, en el orden de las
+        variables de la tabla de verdad.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            List[str]: Texto normalizado de cada variable
+        """
+        variables = parsed_prop.get('variables')
+        if variables is None:  # Diccionarios construidos a mano
+            variables = variables_of(self._formula_of(parsed_prop))
+        return list(variables)
+
+    def compile(self, parsed_prop: Dict, bitwise: bool = False) -> Callable:
+        """
+        Compila una proposición analizada a una función de evaluación.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            bitwise (bool): Si es True la función evalúa columnas de bits
+                (muchas filas a la vez) en lugar de valores individuales
+            
+        Returns:
+            Callable: f(valores) -> bool, con un valor por variable en el orden
+            de 'variables'; con bitwise, f(columnas, máscara) -> columna
+        """
+        return compile_formula(self._formula_of(parsed_prop), bitwise)
+
+    def find_model(self, parsed_prop: Dict) -> Union[Dict[str, bool], None]:
+        """
+        Busca valores de las proposiciones atómicas que hagan verdadera la proposición.
+        
+        Usa una codificación de Tseitin y un resolvedor CDCL, así que no recorre
+        la tabla de verdad. Las proposiciones atómicas se identifican por su texto.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            Union[Dict[str, bool], None]: Valor de cada proposición atómica o
+            None si la proposición es insatisfacible
+        """
+        import sat  # Importa el resolvedor solo cuando se usa
+        return sat.find_model((self._formula_of(parsed_prop), True))
+
+    def is_satisfiable(self, parsed_prop: Dict) -> bool:
+        """
+        Indica si la proposición es verdadera en al menos una fila.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            bool: True si es satisfacible
+        """
+        return self.find_model(parsed_prop) is not None
+
+    def is_contradiction(self, parsed_prop: Dict) -> bool:
+        """
+        Indica si la proposición es falsa en todas las filas.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            bool: True si es una contradicción
+        """
+        return not self.is_satisfiable(parsed_prop)
+
+    def is_tautology(self, parsed_prop: Dict) -> bool:
+        """
+        Indica si la proposición es verdadera en todas las filas (su negación
+        es insatisfacible).
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            bool: True si es una tautología
+        """
+        import sat  # Importa el resolvedor solo cuando se usa
+        return sat.find_model((self._formula_of(parsed_prop), False)) is None
+
+    def are_equivalent(self, first: Dict, second: Dict) -> bool:
+        """
+        Indica si dos proposiciones tienen el mismo valor para cualquier
+        asignación de sus proposiciones atómicas (identificadas por su texto).
+        
+        Args:
+            first (Dict): Primera proposición analizada
+            second (Dict): Segunda proposición analizada
+            
+        Returns:
+            bool: True si son equivalentes
+        """
+        import sat  # Importa el resolvedor solo cuando se usa
+        return sat.find_difference(self._formula_of(first), self._formula_of(second)) is None
+
+    def build_bdd(self, parsed_prop: Dict, manager: Union["BDD", None] = None) -> Tuple["BDD", int]:
+        """
+        Construye el diagrama de decisión binario (ROBDD) de una proposición.
         
-        # Aplicar negaciones si existen
-        if negations[0]:  # Si hay negación para p
-            p = not p  # Invierte el valor de p
-        if len(negations) > 1 and negations[1]:  # Si hay negación para q
-            q = not q  # Invierte el valor de q
+        Los conectores se combinan con la semántica de evaluate_expression.
+        Dos proposiciones construidas con el mismo administrador son
+        equivalentes si y solo si devuelven el mismo nodo.
         
-        # Evalúa la expresión según el tipo de conector
-        if connector_type in ["CONDICIONAL", "CAUSAL", "CONSECUTIVO"]:
-            return not p or q  # Evalúa la expresión condicional
-        elif connector_type in ["CONJUNCIÓN", "ADVERSATIVO"]:
-            return p and q  # Evalúa la expresión de conjunción
-        elif connector_type == "DISYUNCIÓN":
-            return p or q  # Evalúa la expresión de disyunción
-        elif connector_type == "EXPLICATIVO":
-            return p == q  # Evalúa la expresión explicativa
-        elif connector_type == "EJEMPLIFICATIVO":
-            return not p or q  # Evalúa la expresión ejemplificativa
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            manager (Union[BDD, None]): Administrador a reutilizar; por defecto uno nuevo
+            
+        Returns:
+            Tuple[BDD, int]: Administrador y nodo raíz
+        """
+        if manager is None:
+            from bdd import BDD  # Importa los diagramas solo cuando se usan
+            manager = BDD(evaluate=self.evaluate_expression)
+        return manager, manager.from_formula(self._formula_of(parsed_prop))
+
+    def model_count(self, parsed_prop: Dict) -> int:
+        """
+        Cuenta las filas verdaderas de la tabla de verdad sin enumerarlas.
         
-        return None  # Devuelve None si no se puede evaluar
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            int: Número de modelos sobre las proposiciones atómicas distintas
+        """
+        manager, node = self.build_bdd(parsed_prop)
+        return manager.sat_count(node, self.variables(parsed_prop))
 
+    def bdd_truth_columns(self, parsed_prop: Dict) -> Union[Dict, None]:
+        """
+        Genera la tabla de verdad desde el diagrama de decisión binario.
+        
+        Las columnas son las proposiciones atómicas distintas (por su texto),
+        con el mismo formato que truth_columns.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            Union[Dict, None]: Diccionario con 'headers', 'columns' y 'rows', o
+            None si la proposición no tiene conector
+        """
+        if not parsed_prop['connector_type']:
+            return None
+        manager, node = self.build_bdd(parsed_prop)
+        formula = self._formula_of(parsed_prop)
+        unique = self.variables(parsed_prop)  # Átomos distintos en orden de aparición
+        count = len(unique)
+        
+        columns = [variable_column(i, count) for i in range(count)]  # Columnas de cada variable
+        columns.append(manager.truth_column(node, unique))  # Resultado leído del diagrama
+        return {'headers': self._table_headers(formula, count), 'columns': columns, 'rows': 1 << count}
+
+    def group_equivalent(self, parsed_props: Sequence[Dict], order: Union[Sequence[str], None] = None) -> List[List[int]]:
+        """
+        Agrupa proposiciones lógicamente equivalentes usando un solo diagrama.
+        
+        Args:
+            parsed_props (Sequence[Dict]): Proposiciones analizadas
+            order (Union[Sequence[str], None]): Orden inicial de las variables
+            
+        Returns:
+            List[List[int]]: Índices de cada grupo, en orden de primera aparición
+        """
+        from bdd import BDD  # Importa los diagramas solo cuando se usan
+        manager = BDD(order, evaluate=self.evaluate_expression)  # Administrador compartido
+        groups = {}  # Nodo raíz -> índices de las proposiciones
+        for index, parsed_prop in enumerate(parsed_props):
+            _, node = self.build_bdd(parsed_prop, manager)
+            groups.setdefault(node, []).append(index)  # Mismo nodo = misma función lógica
+        return list(groups.values())
+
+    def minimize(self, source: Union[Dict, List[List[str]], TruthTableView]) -> Formula:
+        """
+        Obtiene una fórmula equivalente mínima en suma de productos.
+        
+        Hasta minimize.EXACT_LIMIT variables el resultado es exacto
+        (Quine-McCluskey); con más es heurístico: implicantes primos con una
+        cobertura voraz hasta minimize.PRIME_LIMIT variables y
+        después una heurística al estilo de Espresso.
+        
+        Args:
+            source (Union[Dict, List[List[str]], TruthTableView]): Proposición
+                analizada o tabla de generate_truth_table / lazy_truth_table
+            
+        Returns:
+            Formula: Fórmula mínima; con una proposición analizada usa el texto
+            de sus variables (y devuelve la original si ya tiene menos
+            operadores) y con una tabla, los nombres p, q, r, ...
+            
+        Raises:
+            ValueError: Si source es el mensaje de error de generate_truth_table
+        """
+        if isinstance(source, str):  # Mensaje de error en lugar de tabla
+            raise ValueError(source)
+        from minimize import column_from_table, minimize_column, operator_count  # Importa la minimización solo cuando se usa
+        if isinstance(source, TruthTableView):
+            return minimize_column(source.result, source.count)
+        if not isinstance(source, dict) and not hasattr(source, 'keys'):  # Tabla de verdad
+            return minimize_column(*column_from_table(source))
+        packed = self.truth_columns(source)
+        original = self._formula_of(source)
+        if packed is None:  # Sin conector no hay nada que simplificar
+            return original
+        minimized = minimize_column(packed['columns'][-1], len(packed['columns']) - 1, self.variables(source))
+        return minimized if operator_count(minimized) < operator_count(original) else original  # Nunca empeora
+
+    def format_minimized(self, source: Union[Dict, List[List[str]], TruthTableView]) -> str:
+        """
+        Formatea la fórmula mínima de una proposición o de una tabla de verdad.
+        
+        Args:
+            source (Union[Dict, List[List[str]], TruthTableView]): Ver minimize
+            
+        Returns:
+            str: Fórmula original (si se conoce), fórmula mínima, número de
+            operadores y si el resultado es mínimo o heurístico
+        """
+        if isinstance(source, str):  # Mensaje de error en lugar de tabla
+            return source
+        from minimize import is_exact, operator_count  # Importa la minimización solo cuando se usa
+        minimized = self.minimize(source)
+        lines = []
+        if isinstance(source, dict) or hasattr(source, 'keys'):  # Proposición analizada
+            count = len(self.variables(source))
+            names = atom_names(count)
+            original = self._formula_of(source)
+            lines.append(f"Fórmula original: {render(original, names)}")
+            lines.append(f"Fórmula mínima:   {render(minimized, names)}")
+            lines.append(f"Operadores: {operator_count(original)} -> {operator_count(minimized)}")
+        else:
+            count = source.count if isinstance(source, TruthTableView) else len(source[0]) - 1
+            lines.append(f"Fórmula mínima: {render(minimized)}")
+            lines.append(f"Operadores: {operator_count(minimized)}")
+        if not is_exact(count):
+            lines.append("Resultado heurístico: puede no ser el mínimo")
+        return "\n".join(lines)
+
+    @metered("table", lambda args, table: args[0]['connector_type'])
     def generate_truth_table(self, parsed_prop: Dict) -> List[List[str]]:
         """
         Genera una tabla de verdad para la proposición.
@@ -203,57 +1014,154 @@ class InterpreteLógico:
             parsed_prop (Dict): Proposición analizada
             
         Returns:
-            List[List[str]]: Tabla de verdad formateada
+            List[List[str]]: Tabla de verdad formateada (tupla de tuplas si la
+            caché está activa)
         """
-        if not parsed_prop['connector_type'] or len(parsed_prop['propositions']) != 2:
-            return "No se pudo generar la tabla de verdad"  # Mensaje de error si no se puede generar la tabla
+        if self._table_cache is None:  # Sin caché se genera siempre
+            return self._generate_table(parsed_prop)
         
-        combinations = list(product([True, False], repeat=2))  # Genera combinaciones de valores de verdad
+        key = self._table_key(parsed_prop)  # La tabla solo depende de la estructura lógica
+        table = self._table_cache.get(key)
+        if table is None:
+            table = self._generate_table(parsed_prop)
+            if not isinstance(table, str):
+                table = tuple(tuple(row) for row in table)  # Se guarda inmutable
+            self._table_cache.put(key, table)
+        return table
+
+    def lazy_truth_table(self, parsed_prop: Dict,
+                         cancelled: Union[Callable[[], bool], None] = None) -> Union[TruthTableView, str, None]:
+        """
+        Genera una tabla de verdad perezosa: las filas se calculan al pedirlas.
+        
+        Solo se calcula la columna de resultados, por bloques de filas (ver
+        formula.result_column); las celdas de las variables salen del número
+        de fila, así que nunca se construyen las columnas de las variables.
+        
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            cancelled (Union[Callable[[], bool], None]): Se consulta entre
+                bloques de filas; si devuelve True se abandona el cálculo (por
+                ejemplo, porque el texto cambió en la interfaz)
+            
+        Returns:
+            Union[TruthTableView, str, None]: Vista de la tabla, el mensaje de
+            error de generate_truth_table o None si se canceló
+        """
+        if not parsed_prop['connector_type'] or len(parsed_prop['propositions']) < 2:
+            return "No se pudo generar la tabla de verdad"
+        formula = self._formula_of(parsed_prop)
+        count = len(self.variables(parsed_prop))
+        result = result_column(compile_formula(formula, bitwise=True), count, cancelled)  # Solo la columna de resultados
+        if result is None:
+            return None
+        return TruthTableView(self._table_headers(formula, count), result, count)
+
+    def _table_key(self, parsed_prop: Dict) -> Hashable:
+        """
+        Calcula la clave de caché de la tabla de verdad de una proposición.
         
-        # Crear encabezados con negaciones si existen
-        p_header = "¬p" if parsed_prop['negations'][0] else "p"  # Encabezado para p
-        q_header = "¬q" if parsed_prop['negations'][1] else "q"  # Encabezado para q
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            Hashable: Forma lógica de la proposición (ver formula.signature)
+        """
+        return signature(self._formula_of(parsed_prop))
+
+    def _generate_table(self, parsed_prop: Dict) -> List[List[str]]:
+        """
+        Genera la tabla de verdad sin pasar por la caché.
         
-        table = []  # Inicializa la tabla
-        headers = [p_header, q_header, f"{p_header} {parsed_prop['symbol']} {q_header}"]  # Encabezados de la tabla
-        table.append(headers)  # Agrega los encabezados a la tabla
+        Args:
+            parsed_prop (Dict): Proposición analizada
+            
+        Returns:
+            List[List[str]]: Tabla de verdad formateada
+        """
+        packed = self.truth_columns(parsed_prop)  # Calcula las columnas de bits
+        if packed is None:
+            return "No se pudo generar la tabla de verdad"  # Mensaje de error si no se puede generar la tabla
         
-        for values in combinations:  # Itera sobre las combinaciones de valores
-            result = self.evaluate_expression(
-                values, 
-                parsed_prop['connector_type'],
-                parsed_prop['negations']
-            )  # Evalúa la expresión lógica
-            row = ["V" if v else "F" for v in [values[0], values[1], result]]  # Crea una fila con los resultados
-            table.append(row)  # Agrega la fila a la tabla
+        count = len(packed['columns']) - 1  # Número de variables
+        table = [packed['headers']]  # Inicializa la tabla con los encabezados
+        if count in _SMALL_ROWS:  # Tablas pequeñas: las celdas de las variables ya están escritas
+            results = column_to_cells(packed['columns'][-1], packed['rows'])
+            table.extend([*cells, result] for cells, result in zip(_SMALL_ROWS[count], results))
+        else:
+            cells = [column_to_cells(column, packed['rows']) for column in packed['columns']]  # Convierte cada columna
+            table.extend(list(row) for row in zip(*cells))  # Agrega las filas de la tabla
             
         return table  # Devuelve la tabla de verdad
 
+    @metered("format")
     def format_truth_table(self, table: List[List[str]]) -> str:
         """
         Formatea la tabla de verdad para su visualización.
         
         Args:
-            table (List[List[str]]): Tabla de verdad sin formato
+            table (List[List[str]]): Tabla de verdad sin formato (lista o TruthTableView)
             
         Returns:
             str: Tabla de verdad formateada
         """
-        if not isinstance(table, list):  # Verifica si la tabla es una lista
+        if not isinstance(table, (list, tuple, TruthTableView)):  # Verifica si la tabla es una lista
             return table  # Devuelve la tabla si no es una lista
+        return "".join(self.iter_format_truth_table(table))  # Une los bloques formateados
+
+    def iter_format_truth_table(self, table: List[List[str]], chunk_rows: int = TABLE_PAGE_SIZE) -> Iterator[str]:
+        """
+        Formatea la tabla de verdad por bloques de filas.
+        
+        Unir los bloques da exactamente el texto de format_truth_table, pero
+        nunca se tiene en memoria más de un bloque, así que sirve para escribir
+        tablas enormes en un archivo o en la consola.
+        
+        Args:
+            table (List[List[str]]): Tabla de verdad sin formato (lista o TruthTableView)
+            chunk_rows (int): Filas por bloque
             
-        widths = [max(len(str(row[i])) for row in table) for i in range(len(table[0]))]  # Calcula el ancho de cada columna
-        lines = []  # Inicializa las líneas de la tabla
+        Yields:
+            str: Fragmentos consecutivos del texto formateado
+        """
+        if not isinstance(table, (list, tuple, TruthTableView)):  # Mensaje de error en lugar de tabla
+            yield table
+            return
         
-        header = "| " + " | ".join(str(cell).center(widths[i]) 
-                                  for i, cell in enumerate(table[0])) + " |"  # Crea la línea del encabezado
-        lines.append("=" * len(header))  # Agrega una línea de separación
-        lines.append(header)  # Agrega el encabezado
-        lines.append("=" * len(header))  # Agrega otra línea de separación
+        if isinstance(table, TruthTableView):  # Las celdas de las filas miden un carácter
+            widths = [max(len(header), 1) for header in table.headers]
+        else:
+            widths = [max(map(len, map(str, column))) for column in zip(*table)]  # Calcula el ancho de cada columna
         
-        for row in table[1:]:  # Itera sobre las filas de la tabla
-            lines.append("| " + " | ".join(str(cell).center(widths[i]) 
-                                         for i, cell in enumerate(row)) + " |")  # Formatea cada fila
-        lines.append("=" * len(header))  # Agrega una línea de separación al final
+        header = "| " + " | ".join(map(str.center, map(str, table[0]), widths)) + " |"  # Crea la línea del encabezado
+        separator = "=" * len(header)  # Línea de separación
+        yield "\n".join((separator, header, separator))  # Encabezado entre separaciones
         
-        return "\n".join(lines)  # Devuelve la tabla formateada como una cadena
\ No newline at end of file
+        for start in range(1, len(table), chunk_rows):  # Itera sobre las filas por bloques
+            lines = ["| " + " | ".join(map(str.center, map(str, row), widths)) + " |"
+                     for row in table[start:start + chunk_rows]]  # Formatea cada fila del bloque
+            yield "\n" + "\n".join(lines)
+        yield "\n" + separator  # Agrega una línea de separación al final
+
+
+_default_interpreter = None  # Instancia compartida, se crea en el primer uso
+_default_lock = Lock()  # Protege la creación de la instancia compartida
+
+
+def get_interpreter() -> InterpreteLógico:
+    """
+    Devuelve la instancia compartida del intérprete.
+    
+    La instancia compartida no tiene caché ni tabla de símbolos, así que no
+    acumula datos entre llamadas (solo las funciones compiladas, en una caché
+    acotada) y puede reutilizarse en todos los análisis y desde varios hilos.
+    
+    Returns:
+        InterpreteLógico: Instancia por defecto del intérprete
+    """
+    global _default_interpreter
+    if _default_interpreter is None:  # Evita tomar el candado en cada llamada
+        with _default_lock:
+            if _default_interpreter is None:
+                _default_interpreter = InterpreteLógico()
+    return _default_interpreter
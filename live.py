@@ -0,0 +1,70 @@
+"""
+Análisis en vivo
+================
+
+Hilo de análisis de la interfaz (ui.py), separado de Tk:
+- La interfaz deja peticiones (generación, proposición, interactiva) en
+  requests_queue y recoge (generación, proposición, análisis, tabla,
+  interactiva) de results_queue
+- Si llegan varias peticiones seguidas solo se analiza la más reciente, y las
+  de una generación anterior (el texto cambió mientras esperaban) se descartan
+- Si la estructura lógica no cambia se reutiliza la última tabla de verdad, y
+  una tabla que se está calculando se abandona en cuanto cambia generation
+
+La interfaz aumenta generation en cada pulsación; una petición None termina
+el hilo.
+"""
+
+import queue  # Importa las colas para comunicarse con la interfaz
+from formula import signature  # Importa la forma lógica de las proposiciones
+from interpreter import InterpreteLógico  # Importa el intérprete
+
+MAX_LIVE_ATOMS = 16  # Proposiciones atómicas distintas como máximo mientras se escribe
+MAX_ATOMS = 24  # Proposiciones atómicas distintas como máximo con el botón Analizar
+
+live_interpreter = InterpreteLógico(cache_size=256)  # Intérprete del hilo de análisis (con caché para lo que se reescribe)
+generation = 0  # Número de la última petición; las respuestas de peticiones anteriores se descartan
+requests_queue = queue.Queue()  # Peticiones para el hilo de análisis
+results_queue = queue.Queue()  # Resultados para el hilo de la interfaz
+
+
+def analysis_worker():
+    """Hilo de análisis: analiza fuera del bucle de Tk y deja los resultados en una cola."""
+    last_key, last_table = None, None  # Estructura lógica y tabla del último análisis
+    while True:
+        request = requests_queue.get()  # Espera una petición
+        try:
+            while request is not None:  # Se queda solo con la petición más reciente
+                request = requests_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if request is None:  # Fin del hilo
+            return
+        request_generation, proposition, interactive = request
+        if request_generation != generation:  # El texto cambió mientras esperaba
+            continue
+        try:
+            parsed = live_interpreter.parse_proposition(proposition)  # Analizar la proposición
+            truth_table = None
+            limit = MAX_ATOMS if interactive else MAX_LIVE_ATOMS
+            if parsed['connector'] and len(parsed['variables']) > limit:  # La tabla sería demasiado grande
+                truth_table = too_many_atoms(len(parsed['variables']), interactive)
+            elif parsed['connector']:
+                key = signature(parsed['formula'])  # Forma lógica sin el texto de los átomos
+                if key != last_key:  # La estructura cambió: se genera la tabla otra vez
+                    # Una nueva pulsación cambia generation y abandona la tabla entre dos bloques de filas
+                    new_table = live_interpreter.lazy_truth_table(parsed, lambda: request_generation != generation)
+                    if new_table is None:  # Evitar terminar una tabla que ya no se mostrará
+                        continue
+                    last_key, last_table = key, new_table
+                truth_table = last_table  # Misma estructura: se reutiliza la tabla anterior
+        except Exception as error:  # Un error no debe detener el hilo de análisis
+            parsed, truth_table = None, f"Error: {error}"
+        results_queue.put((request_generation, proposition, parsed, truth_table, interactive))
+
+
+def too_many_atoms(count, interactive):
+    """Mensaje que sustituye a una tabla de verdad con demasiadas filas."""
+    if interactive:
+        return f"Hay {count} proposiciones atómicas distintas: la tabla tendría {2 ** count} filas (máximo {MAX_ATOMS} proposiciones)"
+    return f"Hay {count} proposiciones atómicas distintas: mientras se escribe solo se calculan tablas de hasta {MAX_LIVE_ATOMS}; presione 'Analizar'"
@@ -0,0 +1,220 @@
+"""
+Métricas del intérprete
+=======================
+
+Instrumentación opcional de InterpreteLógico:
+- Contadores e histogramas de latencia por etapa: "tokenize" (conectores y
+  negaciones), "negation", "parse", "table" y "format"
+- Desglose por tipo de conector (CONDICIONAL, CAUSAL, ...) en las etapas que
+  lo conocen
+- Gancho para perfiladores por muestreo, llamado al entrar y salir de cada etapa
+- Exportación en el formato de texto de Prometheus
+
+Las etapas se anidan ("parse" incluye "tokenize" y "negation"), así que sus
+tiempos no se suman. Si el intérprete no recibe un objeto Metrics, el único
+coste es comprobar que el atributo es None.
+"""
+
+from functools import wraps  # Importa wraps para conservar el nombre y la documentación de los métodos medidos
+from _thread import allocate_lock as Lock  # Importa el candado para registrar desde varios hilos
+from time import perf_counter_ns  # Importa el reloj de alta resolución
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple  # Importa tipos para anotaciones
+
+# Límites superiores de los intervalos de latencia, en segundos
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+# Prefijo de los nombres de las métricas exportadas
+METRIC_PREFIX = "interprete"
+
+# Firma del gancho: (etapa, "start" o "stop", tipo de conector, nanosegundos transcurridos)
+ProfilerHook = Callable[[str, str, Optional[str], int], None]
+
+
+def metered(stage: str, connector: Optional[Callable[[tuple, Any], Optional[str]]] = None) -> Callable:
+    """
+    Decorador que mide un método como una etapa del registro self._metrics.
+
+    Si el objeto no tiene registro (self._metrics es None) el método se llama
+    directamente, sin medir nada. Si el método lanza una excepción, la llamada
+    se registra igualmente como error, sin tipo de conector, y la excepción se
+    propaga.
+
+    Args:
+        stage (str): Nombre de la etapa
+        connector (Optional[Callable[[tuple, Any], Optional[str]]]): Obtiene el
+            tipo de conector a partir de los argumentos y del resultado
+
+    Returns:
+        Callable: Decorador del método
+    """
+    def decorate(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = self._metrics
+            if metrics is None:  # Sin instrumentación no se mide nada
+                return method(self, *args, **kwargs)
+            start = metrics.start(stage)
+            connector_type, error = None, True
+            try:
+                result = method(self, *args, **kwargs)
+                if connector is not None:
+                    connector_type = connector(args, result)
+                error = False
+                return result
+            finally:  # Las llamadas que fallan también cuentan
+                metrics.stop(stage, start, connector_type, error)
+        return wrapper
+    return decorate
+
+
+class Histogram:
+    """
+    Histograma acumulado de latencias.
+
+    Attributes:
+        bounds (Tuple[int, ...]): Límites superiores de los intervalos en nanosegundos
+        counts (list): Observaciones por intervalo (la última posición es +Inf)
+        count (int): Número total de observaciones
+        total (int): Suma de las latencias en nanosegundos
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: Tuple[int, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+
+    def observe(self, elapsed: int) -> None:
+        """Registra una latencia en nanosegundos."""
+        from bisect import bisect_left  # Importa la búsqueda binaria al medir (_bisect es una biblioteca compartida)
+        self.counts[bisect_left(self.bounds, elapsed)] += 1
+        self.count += 1
+        self.total += elapsed
+
+
+class Metrics:
+    """
+    Registro de métricas por etapa y tipo de conector.
+
+    Uso dentro del intérprete:
+        start = metrics.start("table")
+        ...
+        metrics.stop("table", start, connector_type)
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, hook: Optional[ProfilerHook] = None):
+        """
+        Inicializa un registro vacío.
+
+        Args:
+            buckets (Sequence[float]): Límites superiores de los intervalos en segundos
+            hook (Optional[ProfilerHook]): Función llamada al entrar ("start") y
+                salir ("stop") de cada etapa, por ejemplo para etiquetar las
+                muestras de un perfilador
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.hook = hook
+        self._bounds = tuple(int(bound * 1e9) for bound in self.buckets)  # Límites en nanosegundos
+        self._histograms = {}  # (etapa, tipo de conector) -> Histogram
+        self._errors = {}  # Etapa -> llamadas que terminaron con una excepción
+        self._lock = Lock()
+
+    def start(self, stage: str) -> int:
+        """
+        Marca el inicio de una etapa.
+
+        Args:
+            stage (str): Nombre de la etapa
+
+        Returns:
+            int: Instante de inicio en nanosegundos
+        """
+        if self.hook is not None:
+            self.hook(stage, "start", None, 0)
+        return perf_counter_ns()
+
+    def stop(self, stage: str, start: int, connector_type: Optional[str] = None, error: bool = False) -> None:
+        """
+        Registra el final de una etapa.
+
+        Args:
+            stage (str): Nombre de la etapa
+            start (int): Valor devuelto por start
+            connector_type (Optional[str]): Tipo del conector principal, si se conoce
+            error (bool): Si es True, la etapa terminó con una excepción; su
+                latencia se registra igualmente y se cuenta como error
+        """
+        elapsed = perf_counter_ns() - start
+        key = (stage, connector_type or "")
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self._bounds)
+            histogram.observe(elapsed)
+            if error:
+                self._errors[stage] = self._errors.get(stage, 0) + 1
+        if self.hook is not None:
+            self.hook(stage, "stop", connector_type, elapsed)
+
+    def reset(self) -> None:
+        """Borra todas las observaciones."""
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Devuelve un resumen de las métricas.
+
+        Returns:
+            Dict[str, Dict]: Por etapa: llamadas (también las que fallaron),
+            errores, segundos totales y desglose {tipo de conector: {'count',
+            'seconds'}} ("" si no se conoce)
+        """
+        with self._lock:
+            items = [(key, histogram.count, histogram.total) for key, histogram in self._histograms.items()]
+            errors = dict(self._errors)
+        stages = {}
+        for (stage, connector_type), count, total in sorted(items):
+            summary = stages.setdefault(stage, {'count': 0, 'errors': errors.get(stage, 0), 'seconds': 0.0,
+                                                'by_connector': {}})
+            summary['count'] += count
+            summary['seconds'] += total / 1e9
+            summary['by_connector'][connector_type] = {'count': count, 'seconds': total / 1e9}
+        return stages
+
+    def to_prometheus(self) -> str:
+        """
+        Exporta las métricas en el formato de texto de Prometheus.
+
+        Returns:
+            str: Contadores de llamadas y de errores por etapa e histograma de
+            latencias por etapa y tipo de conector
+        """
+        with self._lock:
+            items = sorted((key, list(h.counts), h.count, h.total) for key, h in self._histograms.items())
+            errors = dict(self._errors)
+        name = f"{METRIC_PREFIX}_stage_seconds"
+        lines = [f"# HELP {METRIC_PREFIX}_stage_calls_total Llamadas a cada etapa del análisis",
+                 f"# TYPE {METRIC_PREFIX}_stage_calls_total counter"]
+        totals = {}
+        for (stage, _), _, count, _ in items:
+            totals[stage] = totals.get(stage, 0) + count
+        lines += [f'{METRIC_PREFIX}_stage_calls_total{{stage="{stage}"}} {count}' for stage, count in totals.items()]
+        lines += [f"# HELP {METRIC_PREFIX}_stage_errors_total Llamadas a cada etapa que terminaron con una excepción",
+                  f"# TYPE {METRIC_PREFIX}_stage_errors_total counter"]
+        lines += [f'{METRIC_PREFIX}_stage_errors_total{{stage="{stage}"}} {errors.get(stage, 0)}' for stage in totals]
+        lines += [f"# HELP {name} Latencia de cada etapa del análisis por tipo de conector",
+                  f"# TYPE {name} histogram"]
+        for (stage, connector_type), counts, count, total in items:
+            labels = f'stage="{stage}",connector_type="{connector_type}"'
+            cumulative = 0
+            for bound, observed in zip(self.buckets + (None,), counts):
+                cumulative += observed
+                limit = "+Inf" if bound is None else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{limit}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {total / 1e9!r}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
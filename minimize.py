@@ -0,0 +1,431 @@
+"""
+Minimización de proposiciones
+=============================
+
+Obtiene una fórmula equivalente con menos operadores, como suma de productos:
+- Método exacto al estilo de Quine-McCluskey hasta EXACT_LIMIT variables:
+  implicantes primos calculados sobre columnas de bits con memoización de las
+  subfunciones, y cobertura mínima por ramificación y poda completa
+- Hasta PRIME_LIMIT variables, los mismos implicantes primos con una
+  cobertura voraz tras quitar esenciales y dominados: el resultado es bueno
+  pero puede no ser mínimo
+- Heurística al estilo de Espresso para más variables: cada cubo se
+  expande mientras siga dentro del conjunto verdadero y luego se eliminan los
+  cubos redundantes
+
+is_exact indica si el resultado para un número de variables es mínimo.
+
+Las comprobaciones trabajan con columnas de bits (ver
+formula.variable_column): un cubo es válido si su columna no tiene filas
+fuera de la columna de resultados, así que no se enumeran filas.
+"""
+
+import heapq  # Importa la cola de prioridad de la cobertura voraz
+from functools import lru_cache  # Importa la caché para memoizar los implicantes primos
+from typing import Iterable, List, Optional, Sequence, Tuple  # Importa tipos para anotaciones
+from formula import Formula, Atom, Not, Binary, atom_names, variable_column  # Importa los nodos del árbol de fórmulas y las columnas de bits
+
+# Número de variables hasta el que se usa Quine-McCluskey exacto
+EXACT_LIMIT = 7
+
+# Número de variables hasta el que se parte de los implicantes primos
+PRIME_LIMIT = 12
+
+# Un cubo es (valores, fijas): bits de las variables fijas y su valor; el bit de
+# la variable i es 1 << (count - 1 - i), igual que en los minitérminos
+Cube = Tuple[int, int]
+
+
+def column_from_table(table: Sequence[Sequence[str]]) -> Tuple[int, int]:
+    """
+    Extrae la columna de resultados de una tabla de generate_truth_table.
+
+    Args:
+        table (Sequence[Sequence[str]]): Tabla con los encabezados en la posición 0
+
+    Returns:
+        Tuple[int, int]: (columna de bits, número de variables)
+    """
+    column = 0
+    for row, cells in enumerate(table[1:]):
+        if cells[-1] == "V":
+            column |= 1 << row
+    return column, len(table[0]) - 1
+
+
+def _cube_rows(cube: Cube, columns: Sequence[int], mask: int) -> int:
+    """Columna de bits de las filas que cubre un cubo."""
+    values, fixed = cube
+    count = len(columns)
+    rows = mask
+    for i in range(count):
+        bit = 1 << (count - 1 - i)
+        if fixed & bit:
+            rows &= columns[i] if values & bit else columns[i] ^ mask
+    return rows
+
+
+@lru_cache(maxsize=256)
+def prime_implicants(column: int, count: int) -> Tuple[Cube, ...]:
+    """
+    Calcula los implicantes primos de una columna de resultados.
+
+    Divide la función por su primera variable (los cofactores son las dos
+    mitades de la columna) y memoiza cada subfunción, así que las
+    subfunciones repetidas se resuelven una sola vez:
+    primos(f) = primos(f0 ∧ f1) ∪ ¬x·primos(f0) ∪ x·primos(f1), quitando de
+    las dos últimas partes los cubos contenidos en f0 ∧ f1.
+
+    Args:
+        column (int): Columna de resultados (bit r = fila r)
+        count (int): Número de variables
+
+    Returns:
+        Tuple[Cube, ...]: Implicantes primos como (valores, fijas)
+    """
+    memo = {}  # (columna, variables) -> primos
+    variables = {}  # variables -> columnas de cada variable
+
+    def inside(cube: Cube, target: int, size: int) -> bool:
+        columns = variables.get(size)
+        if columns is None:
+            columns = variables[size] = [variable_column(i, size) for i in range(size)]
+        mask = (1 << (1 << size)) - 1
+        return not _cube_rows(cube, columns, mask) & ~target & mask
+
+    def primes(column: int, size: int) -> Tuple[Cube, ...]:
+        if column == 0:
+            return ()
+        if column == (1 << (1 << size)) - 1:  # Función constante verdadera: el cubo vacío
+            return ((0, 0),)
+        key = (column, size)
+        result = memo.get(key)
+        if result is not None:
+            return result
+        half = 1 << (size - 1)
+        high = column & ((1 << half) - 1)  # Filas con la primera variable verdadera
+        low = column >> half  # Filas con la primera variable falsa
+        both = high & low
+        bit = 1 << (size - 1)  # Bit de la primera variable en los cubos
+        result = list(primes(both, size - 1))  # Cubos que no dependen de la variable
+        for cube in primes(low, size - 1):
+            if not inside(cube, both, size - 1):
+                result.append((cube[0], cube[1] | bit))  # ¬x·cubo
+        for cube in primes(high, size - 1):
+            if not inside(cube, both, size - 1):
+                result.append((cube[0] | bit, cube[1] | bit))  # x·cubo
+        result = tuple(result)
+        memo[key] = result
+        return result
+
+    full = (1 << (1 << count)) - 1
+    return tuple(sorted(primes(column & full, count), key=lambda cube: (_cost(cube), cube)))
+
+
+def _cost(cube: Cube) -> int:
+    """Número de literales de un cubo."""
+    return cube[1].bit_count()
+
+
+def _min_cover(on: int, cubes: Sequence[Cube], rows: Sequence[int], complete: bool = True) -> List[int]:
+    """
+    Elige el menor conjunto de cubos que cubre la columna (primero menos cubos,
+    luego menos literales). En cada paso se toman los implicantes esenciales y
+    se descartan los cubos dominados por otro; lo que queda se resuelve por
+    ramificación y poda, así que la cobertura es mínima. Sin búsqueda completa
+    lo que queda se cubre de forma voraz.
+
+    Args:
+        on (int): Filas que deben cubrirse
+        cubes (Sequence[Cube]): Cubos candidatos
+        rows (Sequence[int]): Columna de bits de cada cubo
+        complete (bool): Si es False no se ramifica (resultado heurístico)
+
+    Returns:
+        List[int]: Índices de los cubos elegidos
+    """
+    costs = [_cost(cube) for cube in cubes]
+    selection, remaining, candidates = _reduce_cover(on, rows, costs, [], range(len(cubes)))
+    best = _greedy_cover(remaining, rows, candidates, list(selection))  # Cota inicial
+    best_score = [(len(best), sum(costs[i] for i in best)), best]
+
+    def search(remaining: int, selection: List[int], candidates: List[int]) -> None:
+        selection, remaining, candidates = _reduce_cover(remaining, rows, costs, selection, candidates)
+        cost = sum(costs[i] for i in selection)
+        if not remaining:
+            if (len(selection), cost) < best_score[0]:
+                best_score[:] = [(len(selection), cost), selection]
+            return
+        bound = _cover_bound(remaining, rows, costs, candidates)
+        if bound is None or (len(selection) + bound[0], cost + bound[1]) >= best_score[0]:  # No puede mejorar la mejor
+            return
+        row_bit = _branch_row(remaining, rows, candidates)
+        options = sorted((i for i in candidates if rows[i] & row_bit),
+                         key=lambda i: (-(rows[i] & remaining).bit_count(), costs[i]))
+        for index, option in enumerate(options):  # Alguno de estos cubos debe cubrir la fila
+            excluded = set(options[:index])  # Las coberturas con un cubo anterior ya se exploraron
+            search(remaining & ~rows[option], selection + [option],
+                   [i for i in candidates if i != option and i not in excluded])
+
+    if remaining and complete:
+        search(remaining, selection, candidates)
+    return best_score[1]
+
+
+def _reduce_cover(remaining: int, rows: Sequence[int], costs: Sequence[int], selection: List[int],
+                  candidates: Iterable[int]) -> Tuple[List[int], int, List[int]]:
+    """
+    Simplifica un problema de cobertura hasta que deja de cambiar: quita los
+    cubos que no cubren nada o que están dominados (otro cubo cubre sus filas
+    pendientes con igual o menor costo) y elige los cubos esenciales (los
+    únicos que cubren alguna fila pendiente).
+
+    Returns:
+        Tuple[List[int], int, List[int]]: (cubos elegidos, filas pendientes, candidatos)
+    """
+    selection = list(selection)
+    candidates = [i for i in candidates if rows[i] & remaining]
+    while remaining:
+        # Dominancia: se revisan primero los cubos que más cubren y más baratos
+        candidates.sort(key=lambda i: (-(rows[i] & remaining).bit_count(), costs[i], i))
+        kept = []
+        for i in candidates:
+            covered = rows[i] & remaining
+            if not any(not covered & ~rows[j] and costs[j] <= costs[i] for j in kept):
+                kept.append(i)
+        once = twice = 0  # Filas pendientes cubiertas por al menos uno y por al menos dos cubos
+        for i in kept:
+            twice |= once & rows[i]
+            once |= rows[i]
+        single = remaining & once & ~twice  # Filas que solo cubre un cubo
+        essential = [i for i in kept if rows[i] & single]
+        if not essential and len(kept) == len(candidates):
+            break
+        selection += essential
+        for i in essential:
+            remaining &= ~rows[i]
+        candidates = [i for i in kept if rows[i] & remaining]
+    return selection, remaining, candidates
+
+
+def _cover_bound(remaining: int, rows: Sequence[int], costs: Sequence[int],
+                 candidates: Sequence[int]) -> Optional[Tuple[int, int]]:
+    """
+    Cota inferior de lo que falta: filas que no comparten ningún cubo
+    candidato necesitan cubos distintos.
+
+    Returns:
+        Optional[Tuple[int, int]]: (cubos, literales) que hacen falta como
+        mínimo, o None si alguna fila ya no tiene cubos que la cubran
+    """
+    reach = {}  # Fila -> (filas que comparten algún cubo con ella, menor costo de sus cubos)
+    pending = remaining
+    while pending:
+        row_bit = pending & -pending
+        pending ^= row_bit
+        options = [i for i in candidates if rows[i] & row_bit]
+        if not options:
+            return None
+        union = 0
+        for i in options:
+            union |= rows[i]
+        reach[row_bit] = (union & remaining, min(costs[i] for i in options))
+    needed = needed_cost = 0
+    free = remaining  # Filas que no comparten cubo con las filas ya contadas
+    for row_bit in sorted(reach, key=lambda bit: reach[bit][0].bit_count()):  # Primero las que bloquean menos filas
+        if free & row_bit:
+            union, cost = reach[row_bit]
+            needed += 1
+            needed_cost += cost
+            free &= ~union
+    return needed, needed_cost
+
+
+def _branch_row(remaining: int, rows: Sequence[int], candidates: Sequence[int],
+                sample: int = 32) -> int:
+    """Entre las primeras filas pendientes, la que cubren menos cubos (la rama más estrecha)."""
+    best_bit, best_options = 0, None
+    pending = remaining
+    for _ in range(sample):
+        if not pending:
+            break
+        row_bit = pending & -pending
+        pending ^= row_bit
+        options = sum(1 for i in candidates if rows[i] & row_bit)
+        if best_options is None or options < best_options:
+            best_bit, best_options = row_bit, options
+    return best_bit
+
+
+def _greedy_cover(remaining: int, rows: Sequence[int], candidates: Sequence[int],
+                  selection: List[int]) -> List[int]:
+    """
+    Completa una cobertura eligiendo cada vez el cubo que cubre más filas
+    pendientes. Las ganancias solo pueden bajar, así que se recalculan de
+    forma perezosa desde una cola de prioridad.
+    """
+    heap = [(-(rows[i] & remaining).bit_count(), i) for i in candidates]
+    heapq.heapify(heap)
+    while remaining:
+        _, index = heapq.heappop(heap)
+        gain = (rows[index] & remaining).bit_count()
+        if heap and gain < -heap[0][0]:  # Ganancia desactualizada: vuelve a la cola
+            heapq.heappush(heap, (-gain, index))
+            continue
+        selection.append(index)
+        remaining &= ~rows[index]
+    return selection
+
+
+def _expand_cover(on: int, count: int, columns: Sequence[int], mask: int) -> List[Cube]:
+    """
+    Heurística al estilo de Espresso: expande cubos dentro del conjunto
+    verdadero y elimina los redundantes.
+
+    Args:
+        on (int): Columna de resultados
+        count (int): Número de variables
+        columns (Sequence[int]): Columna de cada variable
+        mask (int): Todas las filas
+
+    Returns:
+        List[Cube]: Cobertura irredundante de implicantes primos
+    """
+    top = (1 << count) - 1
+    off = ~on & mask  # Filas falsas
+    cover = []  # Cubos elegidos
+    covered = []  # Filas de cada cubo elegido
+    remaining = on
+    while remaining:
+        values = ((remaining & -remaining).bit_length() - 1) ^ top  # Minitérmino de la primera fila sin cubrir
+        fixed = list(range(count))  # Variables fijas del cubo
+        literals = [columns[i] if values >> (count - 1 - i) & 1 else columns[i] ^ mask for i in fixed]
+        while True:  # Expande liberando la variable que más filas pendientes agrega
+            prefix = [mask]  # prefix[j]: filas de los literales anteriores a j
+            for literal in literals:
+                prefix.append(prefix[-1] & literal)
+            suffix = mask  # Filas de los literales posteriores a j
+            best, best_gain = None, -1
+            for j in range(len(literals) - 1, -1, -1):
+                rows = prefix[j] & suffix
+                suffix &= literals[j]
+                if rows & off:  # Saldría del conjunto verdadero
+                    continue
+                gain = (rows & remaining).bit_count()
+                if gain > best_gain:
+                    best, best_gain = j, gain
+            if best is None:  # Ya es un implicante primo
+                break
+            del fixed[best], literals[best]
+        bits = sum(1 << (count - 1 - i) for i in fixed)
+        cover.append((values & bits, bits))
+        covered.append(prefix[-1])
+        remaining &= ~prefix[-1]
+
+    before = [0]  # before[k]: unión de los cubos anteriores a k
+    for rows in covered:
+        before.append(before[-1] | rows)
+    after = 0  # Unión de los cubos posteriores que se conservan
+    keep = [True] * len(cover)
+    for index in range(len(cover) - 1, -1, -1):  # Quita los cubos que cubren los demás
+        if (before[index] | after) & on == on:
+            keep[index] = False
+        else:
+            after |= covered[index]
+    return [cube for cube, kept in zip(cover, keep) if kept]
+
+
+def minimize_column(column: int, count: int, names: Optional[Sequence[str]] = None,
+                    exact_limit: int = EXACT_LIMIT, prime_limit: int = PRIME_LIMIT) -> Formula:
+    """
+    Obtiene una fórmula mínima en suma de productos para una columna de resultados.
+
+    Args:
+        column (int): Columna de resultados (bit r = fila r)
+        count (int): Número de variables
+        names (Optional[Sequence[str]]): Nombre de cada variable; por defecto p, q, r, ...
+        exact_limit (int): Variables hasta las que se usa Quine-McCluskey exacto
+        prime_limit (int): Variables hasta las que se parte de los implicantes
+            primos (con una cobertura voraz por encima de exact_limit)
+
+    Returns:
+        Formula: Fórmula equivalente (p ∨ ¬p si es una tautología, p ∧ ¬p si
+        es una contradicción)
+    """
+    names = list(names) if names is not None else atom_names(count)
+    atoms = [Atom(name, i) for i, name in enumerate(names)]
+    rows = 1 << count
+    mask = (1 << rows) - 1
+    column &= mask
+    if column == 0:  # Contradicción
+        return Binary("y", "CONJUNCIÓN", "∧", atoms[0], Not(atoms[0]))
+    if column == mask:  # Tautología
+        return Binary("o", "DISYUNCIÓN", "∨", atoms[0], Not(atoms[0]))
+
+    columns = [variable_column(i, count) for i in range(count)]
+    if count <= prime_limit:
+        primes = prime_implicants(column, count)
+        prime_rows = [_cube_rows(cube, columns, mask) for cube in primes]
+        cover = [primes[i] for i in _min_cover(column, primes, prime_rows, count <= exact_limit)]
+    else:
+        cover = _expand_cover(column, count, columns, mask)
+    return _to_formula(sorted(cover, key=lambda cube: (_cost(cube), -cube[1], -cube[0])), atoms)
+
+
+def is_exact(count: int, exact_limit: int = EXACT_LIMIT) -> bool:
+    """
+    Indica si minimize_column devuelve una fórmula mínima para ese número de variables.
+
+    Args:
+        count (int): Número de variables
+        exact_limit (int): Ver minimize_column
+
+    Returns:
+        bool: True si la cobertura es mínima; False si es heurística
+    """
+    return count <= exact_limit
+
+
+def _to_formula(cover: Sequence[Cube], atoms: Sequence[Atom]) -> Formula:
+    """Convierte una cobertura de cubos en una disyunción de conjunciones."""
+    count = len(atoms)
+    terms = []
+    for values, fixed in cover:
+        literals = []
+        for i, atom in enumerate(atoms):
+            bit = 1 << (count - 1 - i)
+            if fixed & bit:
+                literals.append(atom if values & bit else Not(atom))
+        terms.append(_join("y", "CONJUNCIÓN", "∧", literals))
+    return _join("o", "DISYUNCIÓN", "∨", terms)
+
+
+def _join(connector: str, connector_type: str, symbol: str, operands: Sequence[Formula]) -> Formula:
+    """Une operandos en una cadena de un mismo conector, agrupada por la izquierda."""
+    node = operands[0]
+    for operand in operands[1:]:
+        node = Binary(connector, connector_type, symbol, node, operand)
+    return node
+
+
+def operator_count(node: Formula) -> int:
+    """
+    Cuenta los operadores (conectores y negaciones) de una fórmula.
+
+    Args:
+        node (Formula): Raíz de la fórmula
+
+    Returns:
+        int: Número de operadores
+    """
+    total = 0
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, Not):
+            total += 1
+            stack.append(current.operand)
+        elif isinstance(current, Binary):
+            total += 1
+            stack += [current.left, current.right]
+    return total
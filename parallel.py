@@ -0,0 +1,152 @@
+"""
+Análisis paralelo de corpus
+===========================
+
+Este módulo reparte un flujo de proposiciones entre varios procesos:
+- La entrada se divide en bloques de tamaño configurable
+- Cada proceso reutiliza una única instancia de InterpreteLógico
+- Los resultados se devuelven en el mismo orden de la entrada
+- Solo se mantiene un número acotado de bloques en vuelo, así que un
+  consumidor lento frena la lectura en lugar de acumular resultados
+- Una proposición que falla produce un registro con 'error' y el resto del
+  corpus se sigue analizando; si un proceso muere, el grupo se recrea, los
+  bloques en vuelo se reenvían de uno en uno y solo el bloque que lo mató
+  recibe registros de error
+"""
+
+import os  # Importa os para conocer el número de núcleos
+from collections import deque  # Importa deque para la cola de bloques pendientes
+from concurrent.futures import ProcessPoolExecutor  # Importa el grupo de procesos
+from concurrent.futures.process import BrokenProcessPool  # Importa el error de un grupo con un proceso muerto
+from itertools import islice  # Importa islice para dividir la entrada en bloques
+from typing import Any, Callable, Dict, List, Iterable, Iterator, Optional  # Importa tipos de datos para anotaciones
+from interpreter import InterpreteLógico  # Importa la clase que maneja el análisis lógico
+from console import analysis_record, error_record  # Importa la construcción de registros del modo por lotes
+
+# Proposiciones que se envían a un proceso en cada tarea
+DEFAULT_CHUNK_SIZE = 512
+
+# Intérprete del proceso de trabajo (uno por proceso)
+_worker_interpreter = None
+
+def init_worker(cache_size: int = 0) -> None:
+    """
+    Crea el intérprete que reutilizará el proceso de trabajo. Sirve como
+    initializer de cualquier ProcessPoolExecutor (también el de server.py).
+    
+    Args:
+        cache_size (int): Tamaño de la caché LRU del intérprete (0 la desactiva)
+    """
+    global _worker_interpreter
+    _worker_interpreter = InterpreteLógico(cache_size=cache_size)
+
+def worker_interpreter() -> InterpreteLógico:
+    """
+    Devuelve el intérprete del proceso de trabajo creado por init_worker.
+    
+    Returns:
+        InterpreteLógico: Intérprete del proceso actual
+    """
+    return _worker_interpreter
+
+def _error_records(chunk: List[str], error: BaseException,
+                   serializer: Optional[Callable[[Dict], Any]]) -> List[Any]:
+    """Registros de error de un bloque completo, serializados si corresponde."""
+    records = [error_record(line, error) for line in chunk]
+    if serializer is not None:
+        return [serializer(record) for record in records]
+    return records
+
+def _analyze_chunk(lines: List[str], serializer: Optional[Callable[[Dict], Any]] = None,
+                   max_atoms: int = 0) -> List[Any]:
+    """
+    Analiza un bloque de proposiciones dentro de un proceso de trabajo.
+    
+    Args:
+        lines (List[str]): Proposiciones del bloque
+        serializer (Optional[Callable[[Dict], Any]]): Transformación aplicada a
+            cada registro dentro del proceso de trabajo
+        max_atoms (int): Proposiciones atómicas permitidas (0 = sin límite)
+        
+    Returns:
+        List[Any]: Registros en el mismo orden que las proposiciones
+    """
+    records = [analysis_record(_worker_interpreter, line, max_atoms) for line in lines]  # Analiza el bloque
+    if serializer is not None:  # Serializa en el proceso de trabajo para no cargar al principal
+        return [serializer(record) for record in records]
+    return records
+
+def analyze_parallel(lines: Iterable[str],
+                     workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     max_pending: Optional[int] = None,
+                     serializer: Optional[Callable[[Dict], Any]] = None,
+                     cache_size: int = 0, max_atoms: int = 0) -> Iterator[Any]:
+    """
+    Analiza proposiciones en paralelo conservando el orden de la entrada.
+    
+    Args:
+        lines (Iterable[str]): Proposiciones a analizar
+        workers (Optional[int]): Número de procesos (por defecto, uno por núcleo)
+        chunk_size (int): Proposiciones por tarea
+        max_pending (Optional[int]): Bloques en vuelo como máximo (por defecto,
+            el doble del número de procesos)
+        serializer (Optional[Callable[[Dict], Any]]): Función de nivel de módulo
+            que transforma cada registro dentro de los procesos (por ejemplo,
+            console.encode_record)
+        cache_size (int): Tamaño de la caché LRU del intérprete de cada proceso
+        max_atoms (int): Proposiciones atómicas permitidas por línea (0 = sin límite)
+        
+    Yields:
+        Any: Un registro (o su transformación) por proposición, en el orden de entrada
+    """
+    workers = workers or os.cpu_count() or 1  # Un proceso por núcleo si no se indica
+    max_pending = max_pending or 2 * workers  # Límite de bloques en vuelo
+    lines = iter(lines)
+    pending = deque()  # Bloques enviados, en orden de entrada
+    retry = deque()  # Bloques que hay que reenviar tras la muerte de un proceso, en orden
+    exhausted = False  # Indica si ya se leyó toda la entrada
+
+    def new_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(cache_size,))
+
+    pool = new_pool()
+    try:
+        while True:
+            limit = 1 if retry else max_pending  # Tras una caída se aísla cada bloque para encontrar al culpable
+            while len(pending) < limit:  # Rellena la cola hasta el límite
+                if retry:
+                    chunk = retry.popleft()
+                elif not exhausted:
+                    chunk = list(islice(lines, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                else:
+                    break
+                try:
+                    future = pool.submit(_analyze_chunk, chunk, serializer, max_atoms)
+                except BrokenProcessPool:  # Un proceso murió después de la última respuesta
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = new_pool()
+                    future = pool.submit(_analyze_chunk, chunk, serializer, max_atoms)
+                pending.append((chunk, future))
+            if not pending:  # No queda nada por leer ni por recibir
+                break
+            chunk, future = pending.popleft()  # Espera el bloque más antiguo para mantener el orden
+            try:
+                results = future.result()
+            except BrokenProcessPool as error:  # Murió un proceso: fallan todos los bloques en vuelo
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = new_pool()
+                if retry or not pending:  # El bloque estaba solo en vuelo: es el que mató al proceso
+                    results = _error_records(chunk, error, serializer)
+                else:  # Cualquiera pudo ser: se reenvían en orden, de uno en uno
+                    retry.extendleft(reversed([chunk] + [item[0] for item in pending]))
+                    pending.clear()
+                    continue
+            except Exception as error:  # El bloque falló entero
+                results = _error_records(chunk, error, serializer)
+            yield from results
+    finally:
+        pool.shutdown(cancel_futures=True)
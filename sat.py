@@ -0,0 +1,395 @@
+"""
+Satisfacibilidad sin tablas de verdad
+=====================================
+
+Este módulo decide propiedades de una fórmula sin recorrer sus 2^N filas:
+- Codificación de Tseitin del árbol de la fórmula a forma normal conjuntiva
+- Un resolvedor CDCL en Python puro (literales vigilados, aprendizaje de
+  cláusulas por primer punto de implicación único, actividad de variables
+  tipo VSIDS, guardado de fase y reinicios de Luby)
+
+Las variables se numeran desde 1 y un literal es +v o -v.
+"""
+
+import heapq  # Importa el montículo para elegir la variable más activa
+from typing import Dict, List, Optional, Tuple  # Importa tipos para anotaciones
+from formula import Formula, Atom, Not, postorder  # Importa los nodos del árbol de fórmulas
+
+# Conflictos por unidad de la secuencia de Luby entre reinicios
+RESTART_BASE = 100
+
+# Factor de decaimiento de la actividad de las variables
+ACTIVITY_DECAY = 0.95
+
+
+class CNFBuilder:
+    """
+    Construye la forma normal conjuntiva de una o varias fórmulas.
+
+    Las proposiciones atómicas se identifican por su texto, así que dos
+    fórmulas codificadas con el mismo constructor comparten sus variables.
+
+    Attributes:
+        clauses (List[List[int]]): Cláusulas generadas
+        atoms (Dict[str, int]): Variable de cada proposición atómica
+        num_vars (int): Número de variables usadas
+    """
+
+    def __init__(self):
+        """Inicializa un constructor vacío."""
+        self.clauses = []
+        self.atoms = {}
+        self.num_vars = 0
+
+    def new_var(self) -> int:
+        """Crea una variable nueva y devuelve su número."""
+        self.num_vars += 1
+        return self.num_vars
+
+    def encode(self, node: Formula) -> int:
+        """
+        Codifica una fórmula con variables auxiliares (Tseitin), sin recursión.
+        Una cadena de un mismo conector usa una sola variable auxiliar.
+
+        Args:
+            node (Formula): Raíz de la fórmula
+
+        Returns:
+            int: Literal equivalente a la fórmula
+        """
+        values = []  # Literales de los subárboles pendientes
+        for current, operands in postorder(node):
+            if isinstance(current, Atom):
+                if current.name not in self.atoms:  # Primera aparición del átomo
+                    self.atoms[current.name] = self.new_var()
+                values.append(self.atoms[current.name])
+            elif isinstance(current, Not):  # La negación no necesita variable auxiliar
+                values.append(-values.pop())
+            else:
+                count = len(operands)
+                literals = values[-count:]
+                del values[-count:]
+                values.append(self._gate(current.symbol, literals))
+        return values[0]
+
+    def _gate(self, symbol: str, literals: List[int]) -> int:
+        """
+        Crea la variable auxiliar de una cadena de un mismo conector.
+
+        Args:
+            symbol (str): Símbolo lógico de la cadena
+            literals (List[int]): Literal de cada operando, en orden
+
+        Returns:
+            int: Variable auxiliar g ↔ (l1 op l2 op ...)
+        """
+        if symbol == "→":  # p → q → r ≡ ¬p ∨ ¬q ∨ r
+            symbol, literals = "∨", [-lit for lit in literals[:-1]] + literals[-1:]
+        if symbol == "↔":  # Se codifica por parejas de izquierda a derecha
+            a = literals[0]
+            for b in literals[1:]:
+                g = self.new_var()
+                self.clauses += [[-g, -a, b], [-g, a, -b], [g, a, b], [g, -a, -b]]
+                a = g
+            return a
+        g = self.new_var()
+        if symbol == "∧":
+            self.clauses += [[-g, lit] for lit in literals]
+            self.clauses.append([g] + [-lit for lit in literals])
+        else:  # "∨"
+            self.clauses.append([-g] + literals)
+            self.clauses += [[g, -lit] for lit in literals]
+        return g
+
+
+class Solver:
+    """
+    Resolvedor CDCL de satisfacibilidad para fórmulas en forma normal conjuntiva.
+
+    Cada instancia resuelve un único problema: se agregan las cláusulas y
+    después se llama a solve().
+    """
+
+    def __init__(self, num_vars: int):
+        """
+        Inicializa el resolvedor.
+
+        Args:
+            num_vars (int): Número de variables (numeradas desde 1)
+        """
+        self.num_vars = num_vars
+        self.ok = True  # Se vuelve False si una cláusula vacía hace el problema insatisfacible
+        self.watches = [[] for _ in range(2 * num_vars + 1)]  # Cláusulas que vigilan cada literal (índice lit + n)
+        self.assign = [0] * (num_vars + 1)  # 1 verdadero, -1 falso, 0 sin asignar
+        self.level = [0] * (num_vars + 1)  # Nivel de decisión de cada variable
+        self.reason = [None] * (num_vars + 1)  # Cláusula que implicó cada variable
+        self.phase = [False] * (num_vars + 1)  # Último valor de cada variable
+        self.activity = [0.0] * (num_vars + 1)  # Actividad para elegir la siguiente decisión
+        self.var_inc = 1.0  # Incremento actual de actividad
+        self.heap = [(0.0, v) for v in range(1, num_vars + 1)]  # Candidatas a decisión (actividad negada)
+        self.trail = []  # Literales asignados en orden
+        self.trail_lim = []  # Inicio de cada nivel de decisión en trail
+        self.qhead = 0  # Siguiente literal de trail por propagar
+        self.conflicts = 0  # Conflictos encontrados
+
+    def _value(self, lit: int) -> int:
+        """Valor de un literal: 1, -1 o 0."""
+        value = self.assign[abs(lit)]
+        return value if lit > 0 else -value
+
+    def _enqueue(self, lit: int, reason: Optional[List[int]]) -> None:
+        """Asigna un literal como verdadero en el nivel actual."""
+        var = abs(lit)
+        self.assign[var] = 1 if lit > 0 else -1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def _watch(self, clause: List[int]) -> None:
+        """Vigila los dos primeros literales de una cláusula."""
+        self.watches[clause[0] + self.num_vars].append(clause)
+        self.watches[clause[1] + self.num_vars].append(clause)
+
+    def add_clause(self, literals: List[int]) -> None:
+        """
+        Agrega una cláusula (disyunción de literales).
+
+        Args:
+            literals (List[int]): Literales de la cláusula
+        """
+        clause = list(dict.fromkeys(literals))  # Quita repetidos conservando el orden
+        if any(-lit in clause for lit in clause):  # Tautología: siempre se cumple
+            return
+        if not clause:
+            self.ok = False
+        elif len(clause) == 1:
+            value = self._value(clause[0])
+            if value == -1:  # Contradice otra cláusula unitaria
+                self.ok = False
+            elif value == 0:
+                self._enqueue(clause[0], None)
+        else:
+            self._watch(clause)
+
+    def _propagate(self) -> Optional[List[int]]:
+        """
+        Propaga las cláusulas unitarias con literales vigilados.
+
+        Returns:
+            Optional[List[int]]: Cláusula en conflicto o None
+        """
+        n = self.num_vars
+        while self.qhead < len(self.trail):
+            false_lit = -self.trail[self.qhead]  # Literal que acaba de volverse falso
+            self.qhead += 1
+            watching = self.watches[false_lit + n]
+            kept = []  # Cláusulas que siguen vigilando el literal
+            self.watches[false_lit + n] = kept
+            for position, clause in enumerate(watching):
+                if clause[0] == false_lit:  # El literal falso queda en la posición 1
+                    clause[0], clause[1] = clause[1], clause[0]
+                if self._value(clause[0]) == 1:  # La cláusula ya se cumple
+                    kept.append(clause)
+                    continue
+                for k in range(2, len(clause)):  # Busca otro literal que vigilar
+                    if self._value(clause[k]) != -1:
+                        clause[1], clause[k] = clause[k], clause[1]
+                        self.watches[clause[1] + n].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if self._value(clause[0]) == -1:  # Todos los literales son falsos
+                        kept.extend(watching[position + 1:])
+                        self.qhead = len(self.trail)
+                        return clause
+                    self._enqueue(clause[0], clause)  # Cláusula unitaria
+        return None
+
+    def _bump(self, var: int) -> None:
+        """Aumenta la actividad de una variable que participó en un conflicto."""
+        self.activity[var] += self.var_inc
+        if self.activity[var] > 1e100:  # Reescala para no desbordar
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1) if not self.assign[v]]
+            heapq.heapify(self.heap)
+        elif not self.assign[var]:
+            heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def _analyze(self, conflict: List[int]) -> Tuple[List[int], int]:
+        """
+        Aprende una cláusula a partir de un conflicto (primer punto de implicación único).
+
+        Args:
+            conflict (List[int]): Cláusula en conflicto
+
+        Returns:
+            Tuple[List[int], int]: Cláusula aprendida y nivel al que retroceder
+        """
+        current = len(self.trail_lim)  # Nivel de decisión actual
+        seen = set()  # Variables ya visitadas
+        learnt = [0]  # La posición 0 se reserva para el literal afirmado
+        pending = 0  # Literales del nivel actual sin resolver
+        index = len(self.trail) - 1
+        clause, lit = conflict, None
+        while True:
+            for q in (clause if lit is None else clause[1:]):  # En una razón, clause[0] es el literal implicado
+                var = abs(q)
+                if var in seen or self.level[var] == 0:
+                    continue
+                seen.add(var)
+                self._bump(var)
+                if self.level[var] == current:
+                    pending += 1
+                else:
+                    learnt.append(q)
+            while abs(self.trail[index]) not in seen:  # Último literal visitado del rastro
+                index -= 1
+            lit = self.trail[index]
+            index -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            clause = self.reason[abs(lit)]
+        learnt[0] = -lit
+
+        if len(learnt) == 1:
+            return learnt, 0
+        best = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])  # Segundo literal a vigilar
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+
+    def _backtrack(self, level: int) -> None:
+        """Deshace las asignaciones posteriores al nivel indicado."""
+        if len(self.trail_lim) <= level:
+            return
+        start = self.trail_lim[level]
+        for lit in self.trail[start:]:
+            var = abs(lit)
+            self.phase[var] = lit > 0  # Guarda la fase para la próxima decisión
+            self.assign[var] = 0
+            self.reason[var] = None
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    def _decide(self) -> Optional[int]:
+        """Elige la variable sin asignar más activa, o None si no quedan."""
+        while self.heap:
+            _, var = heapq.heappop(self.heap)
+            if not self.assign[var]:
+                return var
+        return None
+
+    def solve(self) -> Optional[List[bool]]:
+        """
+        Busca una asignación que cumpla todas las cláusulas.
+
+        Returns:
+            Optional[List[bool]]: Valor de cada variable (índice 0 sin uso) o
+            None si el problema es insatisfacible
+        """
+        if not self.ok or self._propagate() is not None:
+            return None
+        restart = 1  # Posición en la secuencia de Luby
+        budget = RESTART_BASE * _luby(restart)  # Conflictos hasta el próximo reinicio
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                if not self.trail_lim:  # Conflicto sin decisiones: insatisfacible
+                    return None
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._watch(learnt)
+                    self._enqueue(learnt[0], learnt)
+                self.var_inc /= ACTIVITY_DECAY
+                budget -= 1
+                if budget == 0:  # Reinicio: conserva lo aprendido y la fase
+                    self._backtrack(0)
+                    restart += 1
+                    budget = RESTART_BASE * _luby(restart)
+                continue
+            var = self._decide()
+            if var is None:  # Todas las variables asignadas sin conflicto
+                return [False] + [value == 1 for value in self.assign[1:]]
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(var if self.phase[var] else -var, None)
+
+
+def _luby(i: int) -> int:
+    """
+    Término i (desde 1) de la secuencia de Luby: 1, 1, 2, 1, 1, 2, 4, ...
+
+    Args:
+        i (int): Posición en la secuencia
+
+    Returns:
+        int: Valor del término
+    """
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+def find_model(*literal_formulas: Tuple[Formula, bool]) -> Optional[Dict[str, bool]]:
+    """
+    Busca valores de los átomos que hagan verdaderas (o falsas) varias fórmulas.
+
+    Args:
+        *literal_formulas (Tuple[Formula, bool]): Pares (fórmula, valor buscado)
+
+    Returns:
+        Optional[Dict[str, bool]]: Valor de cada proposición atómica por su
+        texto, o None si no existe
+    """
+    builder = CNFBuilder()
+    roots = [(builder.encode(node), wanted) for node, wanted in literal_formulas]
+    return _solve(builder, [[root if wanted else -root] for root, wanted in roots])
+
+
+def find_difference(first: Formula, second: Formula) -> Optional[Dict[str, bool]]:
+    """
+    Busca valores de los átomos en los que dos fórmulas difieren.
+
+    Args:
+        first (Formula): Primera fórmula
+        second (Formula): Segunda fórmula
+
+    Returns:
+        Optional[Dict[str, bool]]: Contraejemplo por texto de átomo, o None si
+        las fórmulas son equivalentes
+    """
+    builder = CNFBuilder()
+    a, b = builder.encode(first), builder.encode(second)
+    return _solve(builder, [[a, b], [-a, -b]])  # Exactamente una de las dos es verdadera
+
+
+def _solve(builder: CNFBuilder, extra: List[List[int]]) -> Optional[Dict[str, bool]]:
+    """
+    Resuelve las cláusulas de un constructor junto con cláusulas adicionales.
+
+    Args:
+        builder (CNFBuilder): Constructor con las fórmulas codificadas
+        extra (List[List[int]]): Cláusulas adicionales (por ejemplo, la raíz)
+
+    Returns:
+        Optional[Dict[str, bool]]: Modelo por texto de átomo o None
+    """
+    solver = Solver(builder.num_vars)
+    for clause in builder.clauses + extra:
+        solver.add_clause(clause)
+    model = solver.solve()
+    if model is None:
+        return None
+    return {name: model[var] for name, var in builder.atoms.items()}
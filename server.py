@@ -0,0 +1,373 @@
+"""
+Servidor de análisis asíncrono
+==============================
+
+Servicio TCP local que recibe y devuelve JSON, una línea por mensaje:
+- Operaciones: "parse" (análisis), "table" (tabla de verdad) y "format"
+  (tabla de verdad formateada como texto)
+- Las peticiones que llegan juntas se agrupan en lotes y se envían a un grupo
+  de procesos, así que generar tablas nunca bloquea el bucle de eventos
+- Límite de peticiones simultáneas y tiempo máximo por petición
+- Los procesos reutilizan una única instancia de InterpreteLógico, como en
+  parallel.py, y se evita el arranque de Python en cada consulta
+
+Petición:  {"id": 1, "op": "table", "text": "Si llueve entonces me mojo"}
+Respuesta: {"id": 1, "ok": true, "result": [["p", "q", "p → q"], ...]}
+Error:     {"id": 1, "ok": false, "error": "..."}
+"""
+
+import argparse  # Importa el analizador de argumentos de la línea de comandos
+import asyncio  # Importa el bucle de eventos
+import json  # Importa la serialización a JSON
+import os  # Importa os para conocer el número de núcleos
+import sys  # Importa sys para el código de salida
+from concurrent.futures import ProcessPoolExecutor  # Importa el grupo de procesos
+from concurrent.futures.process import BrokenProcessPool  # Importa el error de un grupo con un proceso muerto
+from typing import Any, Dict, List, Optional, Tuple  # Importa tipos de datos para anotaciones
+import parallel  # Importa la inicialización de los procesos de trabajo
+from console import encode_record  # Importa el codificador JSON compacto
+
+# Operaciones que acepta el servidor
+OPERATIONS = ("parse", "table", "format")
+
+# Valores por defecto de la configuración
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_BATCH_SIZE = 64  # Peticiones por lote como máximo
+DEFAULT_BATCH_DELAY = 0.002  # Segundos que se espera para completar un lote
+DEFAULT_MAX_CONCURRENCY = 256  # Peticiones en curso como máximo
+DEFAULT_TIMEOUT = 10.0  # Segundos por petición
+DEFAULT_MAX_ATOMS = 16  # Proposiciones atómicas como máximo para "table" y "format"
+LINE_LIMIT = 1 << 20  # Longitud máxima de una línea de petición
+
+def _process_request(operation: str, text: str, max_atoms: int) -> Tuple[bool, Any]:
+    """
+    Ejecuta una operación dentro de un proceso de trabajo.
+
+    Args:
+        operation (str): "parse", "table" o "format"
+        text (str): Proposición a analizar
+        max_atoms (int): Proposiciones atómicas permitidas para generar tablas
+
+    Returns:
+        Tuple[bool, Any]: (éxito, resultado o mensaje de error)
+    """
+    interpreter = parallel.worker_interpreter()  # Intérprete del proceso
+    parsed = interpreter.parse_proposition(text)  # Analiza la proposición
+    if operation == "parse":
+        return True, {
+            'connector': parsed['connector'],  # Conector identificado
+            'connector_type': parsed['connector_type'],  # Tipo de conector
+            'symbol': parsed['symbol'],  # Símbolo lógico
+            'atoms': list(parsed['propositions']),  # Proposiciones atómicas
+            'negations': list(parsed['negations']),  # Negación de cada átomo
+            'variables': interpreter.variables(parsed)  # Átomos distintos
+        }
+    if len(interpreter.variables(parsed)) > max_atoms:  # Evita tablas de tamaño desmedido
+        return False, f"La proposición tiene más de {max_atoms} proposiciones atómicas"
+    table = interpreter.generate_truth_table(parsed)  # Genera la tabla de verdad
+    if isinstance(table, str):  # Mensaje de error del intérprete
+        return False, table
+    if operation == "format":
+        return True, interpreter.format_truth_table(table)
+    return True, [list(row) for row in table]
+
+def _process_batch(requests: List[Tuple[str, str]], max_atoms: int) -> List[Tuple[bool, Any]]:
+    """
+    Ejecuta un lote de operaciones dentro de un proceso de trabajo.
+
+    Args:
+        requests (List[Tuple[str, str]]): Pares (operación, proposición)
+        max_atoms (int): Proposiciones atómicas permitidas para generar tablas
+
+    Returns:
+        List[Tuple[bool, Any]]: Un resultado por petición, en el mismo orden
+    """
+    results = []
+    for operation, text in requests:
+        try:
+            results.append(_process_request(operation, text, max_atoms))
+        except Exception as error:  # Un fallo no debe afectar al resto del lote
+            results.append((False, f"{type(error).__name__}: {error}"))
+    return results
+
+class AnalysisServer:
+    """
+    Servidor asíncrono que agrupa las peticiones en lotes para un grupo de procesos.
+
+    Attributes:
+        host (str): Dirección de escucha
+        port (int): Puerto de escucha (0 elige uno libre)
+        workers (int): Número de procesos de trabajo
+        batch_size (int): Peticiones por lote como máximo
+        batch_delay (float): Segundos que se espera para completar un lote
+        max_concurrency (int): Peticiones en curso como máximo
+        timeout (float): Segundos máximos por petición
+        max_atoms (int): Proposiciones atómicas permitidas para generar tablas
+        cache_size (int): Tamaño de la caché LRU del intérprete de cada proceso
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 batch_delay: float = DEFAULT_BATCH_DELAY,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 timeout: float = DEFAULT_TIMEOUT, max_atoms: int = DEFAULT_MAX_ATOMS,
+                 cache_size: int = 0):
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1  # Un proceso por núcleo si no se indica
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_atoms = max_atoms
+        self.cache_size = cache_size
+        self._pool = None  # Grupo de procesos
+        self._server = None  # Servidor TCP de asyncio
+        self._queue = None  # Peticiones pendientes de agrupar
+        self._batcher = None  # Tarea que forma los lotes
+        self._limit = None  # Semáforo de peticiones en curso
+        self._in_flight = None  # Semáforo de lotes enviados a los procesos
+        self._batches = set()  # Lotes en curso
+        self._clients = set()  # Tareas que atienden las conexiones abiertas
+
+    async def start(self) -> None:
+        """Arranca el grupo de procesos, el agrupador de lotes y el servidor TCP."""
+        self._pool = self._new_pool()
+        self._queue = asyncio.Queue()
+        self._limit = asyncio.Semaphore(self.max_concurrency)
+        self._in_flight = asyncio.Semaphore(2 * self.workers)  # Mantiene ocupados los procesos sin acumular lotes
+        self._batcher = asyncio.create_task(self._batch_loop())
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port,
+                                                  limit=LINE_LIMIT)
+        self.port = self._server.sockets[0].getsockname()[1]  # Puerto real si se pidió 0
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """Crea el grupo de procesos de trabajo."""
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=parallel.init_worker,
+                                   initargs=(self.cache_size,))
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Recrea el grupo si un proceso murió (solo una vez por grupo roto)."""
+        if self._pool is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._new_pool()
+
+    async def close(self) -> None:
+        """Detiene el servidor y libera los procesos de trabajo."""
+        if self._server is not None:
+            self._server.close()  # Deja de aceptar conexiones
+            for client in list(self._clients):  # Cierra también las conexiones abiertas
+                client.cancel()
+            await asyncio.gather(*self._clients, return_exceptions=True)
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, *self._batches, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def serve_forever(self) -> None:
+        """Atiende conexiones hasta que se cancela la tarea."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def submit(self, operation: str, text: str) -> Any:
+        """
+        Encola una operación y espera su resultado.
+
+        Args:
+            operation (str): "parse", "table" o "format"
+            text (str): Proposición a analizar
+
+        Returns:
+            Any: Resultado de la operación
+
+        Raises:
+            ValueError: Si la operación no existe o el análisis falla
+            asyncio.TimeoutError: Si se supera el tiempo máximo por petición
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Operación desconocida: {operation}")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, text, future))
+        ok, result = await asyncio.wait_for(future, self.timeout)  # Cancela la espera si se agota el tiempo
+        if not ok:
+            raise ValueError(result)
+        return result
+
+    async def _batch_loop(self) -> None:
+        """Agrupa las peticiones que llegan juntas y envía cada lote a los procesos."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]  # Espera la primera petición del lote
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:  # Completa el lote hasta el límite o el plazo
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._in_flight.acquire()  # Frena el agrupador si los procesos van atrasados
+            batch = [item for item in batch if not item[2].done()]  # Descarta peticiones ya expiradas
+            if not batch:
+                self._in_flight.release()
+                continue
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        """
+        Ejecuta un lote en el grupo de procesos y entrega cada resultado.
+
+        Si todas las peticiones del lote expiran antes de que un proceso lo
+        tome, el lote se cancela y no llega a ejecutarse. Si un proceso muere,
+        el grupo se recrea y solo fallan las peticiones de los lotes que
+        estaban en él.
+
+        Args:
+            batch (List[Tuple[str, str, asyncio.Future]]): (operación, texto, futuro)
+        """
+        try:
+            requests = [(operation, text) for operation, text, _ in batch]
+            futures = [future for _, _, future in batch]
+            pool = self._pool
+            try:
+                work = pool.submit(_process_batch, requests, self.max_atoms)
+            except BrokenProcessPool:  # El grupo se rompió con un lote anterior: este no llegó a enviarse
+                self._replace_pool(pool)
+                pool = self._pool
+                work = pool.submit(_process_batch, requests, self.max_atoms)
+            abandoned = []  # No vacía si todas las peticiones expiraron
+
+            def abandon(_: asyncio.Future) -> None:
+                if not abandoned and all(future.done() for future in futures):
+                    abandoned.append(True)
+                    work.cancel()  # Solo tiene efecto si el lote sigue en la cola del grupo
+
+            for future in futures:
+                future.add_done_callback(abandon)
+            try:
+                results = await asyncio.wrap_future(work)
+            except asyncio.CancelledError:
+                if not abandoned:  # Cancelación de la propia tarea (close)
+                    raise
+                return
+            except Exception as error:  # Fallo del proceso de trabajo
+                if isinstance(error, BrokenProcessPool):  # Los lotes siguientes usan un grupo nuevo
+                    self._replace_pool(pool)
+                results = [(False, f"{type(error).__name__}: {error}")] * len(batch)
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():  # La petición pudo expirar mientras tanto
+                    future.set_result(result)
+        finally:
+            self._in_flight.release()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Atiende una conexión: una petición JSON por línea y una respuesta por línea.
+
+        Las respuestas se envían en cuanto están listas, así que pueden llegar
+        en otro orden; el campo "id" de la petición se devuelve para emparejarlas.
+        """
+        tasks = set()  # Peticiones en curso de esta conexión
+        client = asyncio.current_task()
+        self._clients.add(client)  # close() cancela las conexiones abiertas
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Línea más larga que el límite
+                    await self._send(writer, {'id': None, 'ok': False, 'error': "Petición demasiado larga"})
+                    break
+                if not line:  # El cliente cerró la conexión
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._answer(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks, return_exceptions=True)  # Termina lo pendiente antes de cerrar
+        except (ConnectionError, asyncio.CancelledError):  # Cliente desconectado o servidor cerrándose
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._clients.discard(client)
+            writer.close()
+
+    async def _answer(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        """
+        Resuelve una petición y escribe su respuesta.
+
+        Args:
+            line (bytes): Línea JSON recibida
+            writer (asyncio.StreamWriter): Flujo de la conexión
+        """
+        request_id = None
+        async with self._limit:  # Límite global de peticiones en curso
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("La petición debe ser un objeto JSON")
+                request_id = request.get('id')
+                text = request.get('text')
+                if not isinstance(text, str):
+                    raise ValueError("Falta el campo 'text'")
+                result = await self.submit(request.get('op', "parse"), text)
+                response = {'id': request_id, 'ok': True, 'result': result}
+            except asyncio.TimeoutError:
+                response = {'id': request_id, 'ok': False, 'error': "Tiempo de espera agotado"}
+            except ValueError as error:  # Incluye JSON inválido
+                response = {'id': request_id, 'ok': False, 'error': str(error)}
+            except Exception as error:  # Un fallo inesperado no debe dejar la petición sin respuesta
+                response = {'id': request_id, 'ok': False, 'error': f"{type(error).__name__}: {error}"}
+        try:
+            await self._send(writer, response)
+        except ConnectionError:  # El cliente cerró la conexión antes de la respuesta
+            pass
+
+    async def _send(self, writer: asyncio.StreamWriter, response: Dict) -> None:
+        """Escribe una respuesta como una línea JSON."""
+        writer.write((encode_record(response) + "\n").encode("utf-8"))
+        await writer.drain()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada del servidor.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos de la línea de comandos
+
+    Returns:
+        int: Código de salida
+    """
+    parser = argparse.ArgumentParser(description="Servidor de análisis de lógica proposicional")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="dirección de escucha")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="puerto de escucha")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="procesos de análisis (0 = uno por núcleo)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="peticiones por lote")
+    parser.add_argument("--batch-delay", type=float, default=DEFAULT_BATCH_DELAY, help="segundos de espera para completar un lote")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY, help="peticiones en curso como máximo")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="segundos máximos por petición")
+    parser.add_argument("--max-atoms", type=int, default=DEFAULT_MAX_ATOMS, help="proposiciones atómicas máximas para generar tablas")
+    parser.add_argument("--cache-size", type=int, default=0, help="entradas de la caché LRU de análisis (0 la desactiva)")
+    args = parser.parse_args(argv)
+
+    server = AnalysisServer(args.host, args.port, args.jobs or None, args.batch_size, args.batch_delay,
+                            args.max_concurrency, args.timeout, args.max_atoms, args.cache_size)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:  # Ctrl+C detiene el servidor
+        pass
+    return 0
+
+# Punto de entrada del servidor
+if __name__ == "__main__":  # Verifica si el script se está ejecutando directamente
+    sys.exit(main())
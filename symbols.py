@@ -0,0 +1,100 @@
+"""
+Tabla de símbolos de proposiciones atómicas
+===========================================
+
+Asigna un identificador entero a cada proposición atómica distinta:
+- El texto se normaliza (minúsculas, espacios simples, sin puntuación en los
+  extremos) antes de buscarlo, así que "Llueve." y "llueve" son el mismo átomo
+- Cada texto se guarda una sola vez (internado) aunque aparezca en millones
+  de proposiciones de un corpus
+- Los identificadores son estables mientras viva la tabla y la tabla puede
+  compartirse entre hilos
+"""
+
+import sys  # Importa sys para internar los textos
+from _thread import allocate_lock as Lock  # Importa el candado para agregar símbolos desde varios hilos
+from typing import Iterable, List  # Importa tipos para anotaciones
+
+# Caracteres que se quitan de los extremos de un átomo
+_EDGE_PUNCTUATION = " .;:!?¡¿\"'"
+
+
+def normalize_atom(text: str) -> str:
+    """
+    Normaliza el texto de una proposición atómica.
+
+    Args:
+        text (str): Texto del átomo (ya sin palabras de negación)
+
+    Returns:
+        str: Texto en minúsculas, con espacios simples y sin puntuación en los extremos
+    """
+    return " ".join(text.lower().split()).strip(_EDGE_PUNCTUATION)
+
+
+class SymbolTable:
+    """
+    Tabla que interna proposiciones atómicas y les asigna identificadores.
+
+    Attributes:
+        names (List[str]): Texto de cada identificador, en orden de creación
+    """
+
+    def __init__(self):
+        self.names = []  # Identificador -> texto
+        self._ids = {}  # Texto -> identificador
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Número de átomos distintos."""
+        return len(self.names)
+
+    def __contains__(self, text: str) -> bool:
+        """Indica si el átomo ya está en la tabla."""
+        return normalize_atom(text) in self._ids
+
+    def intern(self, text: str) -> int:
+        """
+        Devuelve el identificador de un átomo, creándolo si es nuevo.
+
+        Args:
+            text (str): Texto del átomo
+
+        Returns:
+            int: Identificador compartido por todos los textos equivalentes
+        """
+        key = normalize_atom(text)
+        symbol = self._ids.get(key)  # Lectura sin candado en el caso habitual
+        if symbol is None:
+            with self._lock:
+                symbol = self._ids.get(key)  # Otro hilo pudo agregarlo mientras tanto
+                if symbol is None:
+                    symbol = len(self.names)
+                    key = sys.intern(key)
+                    self.names.append(key)
+                    self._ids[key] = symbol
+        return symbol
+
+    def intern_all(self, texts: Iterable[str]) -> List[int]:
+        """
+        Interna varios átomos.
+
+        Args:
+            texts (Iterable[str]): Textos de los átomos
+
+        Returns:
+            List[int]: Identificador de cada texto, en el mismo orden
+        """
+        return [self.intern(text) for text in texts]
+
+    def name(self, symbol: int) -> str:
+        """
+        Devuelve el texto normalizado de un identificador.
+
+        Args:
+            symbol (int): Identificador
+
+        Returns:
+            str: Texto del átomo
+        """
+        return self.names[symbol]
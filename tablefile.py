@@ -0,0 +1,263 @@
+"""
+Formato binario compacto para tablas de verdad
+==============================================
+
+Guarda una tabla de verdad con un bit por fila en lugar de listas de "V"/"F":
+- Cabecera fija de 24 bytes y metadatos en JSON (átomos, variables, negaciones, símbolo)
+- Columna de resultados empaquetada: la fila r es el bit r % 8 del byte r // 8
+- Las columnas de las variables no se guardan: se deducen del número de fila
+
+El lector abre el archivo con mmap, así que acceder a filas o rangos y contar
+modelos no carga ni decodifica la tabla completa.
+
+Estructura del archivo (little endian):
+    magic "TVPK" | versión u16 | reservado u16 | átomos u32 | filas u64 |
+    longitud de metadatos u32 | metadatos JSON | relleno hasta múltiplo de 8 |
+    bits de resultados
+"""
+
+import json  # Importa JSON para los metadatos
+import mmap  # Importa mmap para leer sin copiar
+import struct  # Importa struct para la cabecera fija
+from typing import Dict, List, Optional  # Importa tipos para anotaciones
+from formula import result_blocks  # Importa la evaluación de resultados por bloques
+from interpreter import InterpreteLógico, column_to_cells, variable_cells  # Importa el intérprete y las celdas
+
+MAGIC = b"TVPK"  # Identificador del formato
+VERSION = 1  # Versión del formato
+_HEADER = struct.Struct("<4sHHIQI")  # magic, versión, reservado, átomos, filas, longitud de metadatos
+_CHUNK_BYTES = 1 << 20  # Bytes que se procesan de una vez al contar o comparar
+
+
+def write_truth_table(path: str, interpreter: InterpreteLógico, parsed_prop: Dict) -> int:
+    """
+    Exporta la tabla de verdad de una proposición al formato binario.
+
+    Args:
+        path (str): Archivo de salida
+        interpreter (InterpreteLógico): Intérprete que genera la tabla
+        parsed_prop (Dict): Proposición analizada
+
+    Returns:
+        int: Número de filas escritas
+
+    Raises:
+        ValueError: Si no se puede generar la tabla de verdad
+    """
+    if not parsed_prop['connector_type'] or len(parsed_prop['propositions']) < 2:
+        raise ValueError("No se pudo generar la tabla de verdad")
+    count = len(interpreter.variables(parsed_prop))  # Número de variables
+    metadata = json.dumps({
+        'atoms': list(parsed_prop['propositions']),  # Proposiciones atómicas
+        'negations': list(parsed_prop['negations']),  # Negación de cada átomo
+        'variables': interpreter.variables(parsed_prop),  # Átomos distintos (columnas de la tabla)
+        'connector_type': parsed_prop['connector_type'],  # Tipo del conector principal
+        'symbol': parsed_prop['symbol'],  # Símbolo del conector principal
+        'headers': interpreter.table_headers(parsed_prop)  # Encabezados de la tabla
+    }, ensure_ascii=False).encode("utf-8")
+    rows = 1 << count
+    padding = -(_HEADER.size + len(metadata)) % 8  # Alinea los bits a 8 bytes
+
+    with open(path, "wb") as output:
+        output.write(_HEADER.pack(MAGIC, VERSION, 0, count, rows, len(metadata)))
+        output.write(metadata)
+        output.write(b"\0" * padding)
+        for data in result_blocks(interpreter.compile(parsed_prop, bitwise=True), count):  # Bit r = fila r
+            output.write(data)  # Un bloque a la vez: nunca se guarda la columna completa
+    return rows
+
+
+class PackedTruthTable:
+    """
+    Lector de tablas de verdad binarias mapeado en memoria.
+
+    Attributes:
+        metadata (Dict): Átomos, negaciones, variables, tipo de conector, símbolo y encabezados
+        count (int): Número de variables
+        size (int): Número de filas
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre un archivo de tabla de verdad.
+
+        Args:
+            path (str): Archivo a abrir
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        self._file = open(path, "rb")
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)  # Falla con un archivo vacío
+            magic, version, _, count, rows, length = _HEADER.unpack_from(self._map, 0)
+            start = _HEADER.size
+            offset = start + length + (-(start + length) % 8)  # Inicio de los bits de resultados
+            if magic != MAGIC or version != VERSION or offset + (rows + 7) // 8 > len(self._map):
+                raise ValueError("Cabecera incompatible o archivo truncado")
+            self.metadata = json.loads(self._map[start:start + length].decode("utf-8"))
+        except Exception as error:
+            self.close()  # Nunca deja abiertos el archivo ni el mapeo
+            if isinstance(error, (ValueError, struct.error)):  # Incluye UTF-8 y JSON inválidos
+                raise ValueError("El archivo no es una tabla de verdad binaria compatible") from error
+            raise
+        self.count = count
+        self.size = rows
+        self._bits = memoryview(self._map)[offset:offset + (rows + 7) // 8]  # Vista sin copia
+
+    def __enter__(self) -> "PackedTruthTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Libera el mapeo en memoria y cierra el archivo."""
+        bits = getattr(self, "_bits", None)
+        if bits is not None:
+            bits.release()
+            self._bits = None
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        """Número de filas."""
+        return self.size
+
+    @property
+    def headers(self) -> List[str]:
+        """Encabezados de las columnas."""
+        return self.metadata['headers']
+
+    def result(self, k: int) -> bool:
+        """
+        Resultado de la fila k sin decodificar el resto.
+
+        Args:
+            k (int): Número de fila (desde 0)
+
+        Returns:
+            bool: Valor de la proposición en esa fila
+        """
+        if not 0 <= k < self.size:
+            raise IndexError("Fila fuera de la tabla de verdad")
+        return bool((self._bits[k >> 3] >> (k & 7)) & 1)
+
+    def row(self, k: int) -> List[str]:
+        """
+        Fila k con los valores de las variables y el resultado.
+
+        Args:
+            k (int): Número de fila (desde 0)
+
+        Returns:
+            List[str]: Celdas "V"/"F" de la fila
+        """
+        cells = ["F" if (k >> (self.count - 1 - i)) & 1 else "V" for i in range(self.count)]
+        cells.append("V" if self.result(k) else "F")
+        return cells
+
+    def result_bytes(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """
+        Bytes que contienen los resultados de un rango de filas, sin copiarlos.
+
+        El primer byte empieza en la fila start // 8 * 8, así que con rangos
+        alineados a 8 filas la vista contiene exactamente esas filas. La vista
+        debe liberarse (release) antes de cerrar la tabla.
+
+        Args:
+            start (int): Primera fila
+            stop (Optional[int]): Fila siguiente a la última (por defecto, el final)
+
+        Returns:
+            memoryview: Vista de solo lectura sobre el archivo
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        return self._bits[start >> 3:(stop + 7) >> 3]
+
+    def result_bits(self, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Resultados de un rango de filas como entero (bit 0 = fila start).
+
+        Args:
+            start (int): Primera fila
+            stop (Optional[int]): Fila siguiente a la última (por defecto, el final)
+
+        Returns:
+            int: Columna de bits del rango
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        if start >= stop:
+            return 0
+        value = int.from_bytes(self.result_bytes(start, stop), "little") >> (start & 7)
+        return value & ((1 << (stop - start)) - 1)
+
+    def rows(self, start: int, stop: int) -> List[List[str]]:
+        """
+        Decodifica un rango de filas.
+
+        Args:
+            start (int): Primera fila
+            stop (int): Fila siguiente a la última
+
+        Returns:
+            List[List[str]]: Filas del rango
+        """
+        start, stop = max(start, 0), min(stop, self.size)
+        if start >= stop:
+            return []
+        columns = [variable_cells(i, self.count, start, stop) for i in range(self.count)]
+        columns.append(column_to_cells(self.result_bits(start, stop), stop - start))
+        return [list(row) for row in zip(*columns)]
+
+    def count_models(self, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Cuenta las filas verdaderas contando bits, sin decodificar la tabla.
+
+        Args:
+            start (int): Primera fila
+            stop (Optional[int]): Fila siguiente a la última (por defecto, el final)
+
+        Returns:
+            int: Número de filas verdaderas del rango
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        total = 0
+        chunk_rows = _CHUNK_BYTES * 8
+        for chunk_start in range(start, stop, chunk_rows):
+            total += self.result_bits(chunk_start, min(stop, chunk_start + chunk_rows)).bit_count()
+        return total
+
+    def diff_count(self, other: "PackedTruthTable") -> int:
+        """
+        Cuenta las filas cuyo resultado difiere entre dos tablas del mismo tamaño.
+
+        Args:
+            other (PackedTruthTable): Tabla a comparar
+
+        Returns:
+            int: Número de filas distintas
+        """
+        if other.size != self.size:
+            raise ValueError("Las tablas tienen distinto número de filas")
+        total = 0
+        for offset in range(0, len(self._bits), _CHUNK_BYTES):
+            mine = int.from_bytes(self._bits[offset:offset + _CHUNK_BYTES], "little")
+            theirs = int.from_bytes(other._bits[offset:offset + _CHUNK_BYTES], "little")
+            total += (mine ^ theirs).bit_count()
+        return total
+
+
+def open_truth_table(path: str) -> PackedTruthTable:
+    """
+    Abre una tabla de verdad binaria.
+
+    Args:
+        path (str): Archivo a abrir
+
+    Returns:
+        PackedTruthTable: Lector mapeado en memoria
+    """
+    return PackedTruthTable(path)
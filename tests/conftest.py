@@ -0,0 +1,43 @@
+"""Configuración de pytest: los módulos del proyecto están en la raíz del repositorio."""
+
+import os  # Importa os para construir la ruta de la raíz
+import random  # Importa random para generar fórmulas de prueba
+import sys  # Importa sys para agregar la raíz a la ruta de importación
+
+import pytest  # Importa pytest para declarar los fixtures
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from formula import Atom, Binary, Formula, Not, compile_formula, variable_column  # Importa el árbol de fórmulas y su evaluación por columnas
+
+# Conectores de las fórmulas aleatorias: (palabra, tipo, símbolo)
+CONNECTORS = [
+    ("y", "CONJUNCIÓN", "∧"),
+    ("o", "DISYUNCIÓN", "∨"),
+    ("entonces", "CONDICIONAL", "→"),
+    ("es decir", "EXPLICATIVO", "↔"),
+]
+
+
+@pytest.fixture
+def random_formula():
+    """Fórmulas aleatorias: f(generador, átomos, profundidad) con átomos a0, a1, ..."""
+    def build(generator: random.Random, count: int, depth: int) -> Formula:
+        if depth == 0 or generator.random() < 0.2:
+            index = generator.randrange(count)
+            node = Atom(f"a{index}", index)  # El índice es la columna del átomo
+        else:
+            left, right = build(generator, count, depth - 1), build(generator, count, depth - 1)
+            node = Binary(*generator.choice(CONNECTORS), left, right)
+        return Not(node) if generator.random() < 0.3 else node
+    return build
+
+
+@pytest.fixture
+def truth_column():
+    """Columna de resultados de una fórmula: f(fórmula, átomos) con átomos a0, a1, ..."""
+    def evaluate(node: Formula, count: int) -> int:
+        mask = (1 << (1 << count)) - 1
+        columns = [variable_column(i, count) for i in range(count)]
+        return compile_formula(node, bitwise=True)(columns, mask) & mask
+    return evaluate
@@ -0,0 +1,82 @@
+"""Pruebas de los diagramas de decisión binarios contra las columnas de bits."""
+
+import random  # Importa random para generar las fórmulas
+from itertools import permutations  # Importa permutations para probar varios órdenes
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+from bdd import BDD, FALSE, TRUE  # Importa los diagramas
+from formula import Not  # Importa la negación de fórmulas
+from interpreter import InterpreteLógico  # Importa el intérprete
+
+ATOMS = 4  # Átomos de las fórmulas aleatorias
+NAMES = [f"a{i}" for i in range(ATOMS)]
+
+# Oraciones con cadenas, negaciones, conectores mezclados y átomos repetidos
+SENTENCES = [
+    "Si llueve entonces me mojo",
+    "Llueve y no hace frío",
+    "Estudio o trabajo o descanso",
+    "Si llueve entonces hace frío entonces me quedo en casa",
+    "Llueve es decir hay nubes es decir no hay sol",
+    "No llueve o llueve",
+    "Llueve y hace frío o llueve y no hace frío",
+    "Estudio porque quiero aprobar pero no tengo tiempo",
+    "Si estudio y no trabajo entonces apruebo o repito",
+]
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_truth_column(seed, random_formula, truth_column):
+    """La columna leída del diagrama coincide con la evaluación por columnas de bits."""
+    node = random_formula(random.Random(seed), ATOMS, 5)
+    expected = truth_column(node, ATOMS)
+    manager = BDD()
+    root = manager.from_formula(node)
+    assert manager.truth_column(root, NAMES) == expected
+    assert manager.sat_count(root, NAMES) == expected.bit_count()
+    assert set(manager.support(root)) <= set(NAMES)
+
+
+@pytest.mark.parametrize("order", list(permutations(NAMES))[::5])
+def test_order_does_not_change_the_function(order, random_formula, truth_column):
+    """Con cualquier orden de variables el diagrama representa la misma función."""
+    generator = random.Random(3)
+    for _ in range(10):
+        node = random_formula(generator, ATOMS, 4)
+        manager = BDD(order)
+        assert manager.truth_column(manager.from_formula(node), NAMES) == truth_column(node, ATOMS)
+
+
+def test_canonical_nodes(random_formula, truth_column):
+    """En un mismo administrador, fórmulas equivalentes son el mismo nodo y las demás no."""
+    generator = random.Random(11)
+    manager = BDD(NAMES)
+    nodes = {}  # Columna -> nodo
+    for _ in range(300):
+        node = random_formula(generator, ATOMS, 3)
+        root = manager.from_formula(node)
+        assert nodes.setdefault(truth_column(node, ATOMS), root) == root
+        assert manager.from_formula(Not(Not(node))) == root
+    assert len(set(nodes.values())) == len(nodes)
+    full = (1 << (1 << ATOMS)) - 1
+    assert nodes.get(0, FALSE) == FALSE and nodes.get(full, TRUE) == TRUE
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_interpreter_columns(sentence):
+    """bdd_truth_columns y model_count coinciden con truth_columns."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition(sentence)
+    packed = interpreter.truth_columns(parsed)
+    assert interpreter.bdd_truth_columns(parsed) == packed
+    assert interpreter.model_count(parsed) == packed['columns'][-1].bit_count()
+
+
+def test_group_equivalent():
+    """Las proposiciones con la misma tabla de verdad quedan en el mismo grupo."""
+    interpreter = InterpreteLógico()
+    parsed = [interpreter.parse_proposition(sentence) for sentence in
+              ["Llueve y hace frío o llueve y no hace frío", "Llueve", "Llueve o llueve",
+               "Si llueve entonces hace frío", "No llueve o hace frío"]]
+    assert interpreter.group_equivalent(parsed) == [[0, 1, 2], [3, 4]]
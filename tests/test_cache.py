@@ -0,0 +1,64 @@
+"""Pruebas de la caché LRU y de su uso en el intérprete."""
+
+import pytest  # Importa pytest para comprobar las excepciones
+
+from cache import LRUCache  # Importa la caché
+from interpreter import InterpreteLógico  # Importa el intérprete
+
+
+def test_eviction_order_and_info():
+    """Se expulsa la entrada usada hace más tiempo y info cuenta aciertos, fallos y expulsiones."""
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" pasa a ser la más reciente
+    cache.put("c", 3)  # Expulsa "b"
+    assert cache.get("b") is None and cache.get("b", "nada") == "nada"
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    cache.put("a", 10)  # Actualizar no expulsa
+    assert cache.info() == {'hits': 3, 'misses': 2, 'evictions': 1, 'size': 2, 'maxsize': 2, 'hit_rate': 0.6}
+    cache.clear()
+    assert len(cache) == 0 and cache.info()['hits'] == 0
+
+
+def test_invalid_size():
+    """Una caché sin espacio no tiene sentido."""
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_interpreter_results_are_shared_and_read_only():
+    """Los textos con la misma normalización comparten un análisis de solo lectura."""
+    interpreter = InterpreteLógico(cache_size=4)
+    parsed = interpreter.parse_proposition("No llueve y hace frío.")
+    assert interpreter.parse_proposition("no  llueve y HACE frío") is parsed
+    with pytest.raises(TypeError):
+        parsed['connector'] = "o"
+    assert isinstance(parsed['propositions'], tuple) and isinstance(parsed['negations'], tuple)
+
+    table = interpreter.generate_truth_table(parsed)
+    assert isinstance(table, tuple) and all(isinstance(row, tuple) for row in table)
+    assert table == tuple(tuple(row) for row in InterpreteLógico().generate_truth_table(parsed))
+    # La tabla depende solo de la estructura lógica, no del texto de los átomos
+    assert interpreter.generate_truth_table(interpreter.parse_proposition("No nieva y hace sol")) is table
+    info = interpreter.cache_info()
+    assert (info['parse']['hits'], info['parse']['misses']) == (1, 2)
+    assert (info['table']['hits'], info['table']['misses']) == (1, 1)
+
+
+def test_interpreter_eviction():
+    """Con más textos que entradas se expulsan los menos usados y se vuelven a analizar."""
+    interpreter = InterpreteLógico(cache_size=2)
+    for text in ["Llueve y hace frío", "Llueve o nieva", "Si llueve entonces me mojo", "Llueve y hace frío"]:
+        interpreter.parse_proposition(text)
+    assert interpreter.cache_info()['parse'] == {'hits': 0, 'misses': 4, 'evictions': 2, 'size': 2,
+                                                 'maxsize': 2, 'hit_rate': 0.0}
+
+
+def test_no_cache():
+    """Sin caché los resultados son mutables y no hay estadísticas."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition("Llueve y hace frío")
+    assert interpreter.parse_proposition("Llueve y hace frío") is not parsed
+    parsed['connector'] = "o"  # Cada llamada devuelve un diccionario nuevo
+    assert interpreter.cache_info() == {}
@@ -0,0 +1,92 @@
+"""Pruebas de la evaluación por columnas sobre archivos CSV."""
+
+import gzip  # Importa gzip para escribir archivos comprimidos
+import json  # Importa json para leer los conteos de la línea de comandos
+from itertools import product  # Importa product para recorrer todas las asignaciones
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+from columnar import count_results, evaluate_file, evaluate_rows, main, pack_column  # Importa la evaluación por columnas
+from interpreter import InterpreteLógico  # Importa el intérprete
+
+SENTENCE = "Si llueve y no hace frío entonces salgo"
+
+
+def _expected(sentence, rows):
+    """Resultados de la tabla de verdad, repetidos rows veces por asignación."""
+    interpreter = InterpreteLógico()
+    table = interpreter.generate_truth_table(interpreter.parse_proposition(sentence))
+    return [row[-1] == "V" for row in table[1:]] * rows
+
+
+def _write(path, header, repeat, compress=False):
+    """CSV con todas las asignaciones de tres átomos, en el orden de la tabla, repetidas."""
+    lines = [",".join(header)]
+    words = [("V", "F"), ("1", "0"), ("sí", "no")]  # Un formato distinto por columna
+    for _ in range(repeat):
+        for values in product([0, 1], repeat=3):
+            lines.append(",".join(words[i][value] for i, value in enumerate(values)))
+    text = "\n".join(lines) + "\n"
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8") as stream:
+            stream.write(text)
+    else:
+        path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _flatten(chunks):
+    """Une los bloques en una lista de resultados por fila."""
+    return [bool(result >> k & 1) for result, size in chunks for k in range(size)]
+
+
+def test_pack_column():
+    """Cada valor es un bit, la fila 0 el menos significativo; los demás textos son errores."""
+    assert pack_column(["V", " f ", "1", "Sí", "no", "TRUE", "falso"]) == 0b0101101
+    assert pack_column([]) == 0
+    with pytest.raises(ValueError):
+        pack_column(["V", "quizá"])
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 3, 8, 100])
+@pytest.mark.parametrize("compress", [False, True])
+def test_evaluate_file(tmp_path, chunk_rows, compress):
+    """Los resultados por bloques coinciden con la tabla de verdad, también en .gz."""
+    path = _write(tmp_path / ("datos.csv.gz" if compress else "datos.csv"),
+                  ["Llueve", "hace frío", "salgo"], repeat=3, compress=compress)
+    parsed = InterpreteLógico().parse_proposition(SENTENCE)
+    chunks = list(evaluate_file(str(path), parsed, chunk_rows=chunk_rows))
+    assert [size for _, size in chunks][:-1] == [chunk_rows] * (len(chunks) - 1)
+    expected = _expected(SENTENCE, 3)
+    assert _flatten(chunks) == expected
+    assert count_results(chunks) == {'rows': 24, 'true': sum(expected), 'false': 24 - sum(expected)}
+
+
+def test_column_mapping_and_errors():
+    """--column asocia átomos a columnas con otro nombre; las columnas ausentes y las filas cortas son errores."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition("Llueve o nieva")
+    rows = [["lluvia", "Nieva"], ["1", "0"], ["0", "0"]]
+    assert _flatten(evaluate_rows(rows, parsed, interpreter, {"LLUEVE": "Lluvia"})) == [True, False]
+    with pytest.raises(ValueError, match="llueve"):
+        list(evaluate_rows(rows, parsed, interpreter))
+    with pytest.raises(ValueError):
+        list(evaluate_rows([["llueve", "nieva"], ["1"]], parsed, interpreter))
+    assert list(evaluate_rows([], parsed, interpreter)) == []
+
+
+def test_main(tmp_path, capsys):
+    """La línea de comandos escribe un resultado por fila o los conteos, y avisa de los errores."""
+    path = _write(tmp_path / "datos.tsv", ["lluvia", "frío", "salgo"], repeat=2)
+    path.write_text(path.read_text(encoding="utf-8").replace(",", "\t"), encoding="utf-8")
+    options = [SENTENCE, str(path), "--delimiter", "\t", "--column", "llueve=lluvia",
+               "--column", "hace frío=frío", "--chunk-rows", "5"]
+    output = tmp_path / "resultados.txt"
+    assert main(options + ["-o", str(output)]) == 0
+    expected = _expected(SENTENCE, 2)
+    assert output.read_text(encoding="utf-8").split() == ["V" if value else "F" for value in expected]
+
+    assert main(options + ["--count"]) == 0
+    assert json.loads(capsys.readouterr().out) == {'rows': 16, 'true': sum(expected), 'false': 16 - sum(expected)}
+    assert main([SENTENCE, str(path), "--delimiter", "\t"]) == 1
+    assert "Falta la columna" in capsys.readouterr().err
@@ -0,0 +1,54 @@
+"""Pruebas del modo por lotes de la consola."""
+
+import io  # Importa io para capturar la salida
+import json  # Importa json para leer los registros
+
+import console  # Importa el modo por lotes
+from interpreter import InterpreteLógico  # Importa el intérprete
+
+
+class FailingInterpreter(InterpreteLógico):
+    """Intérprete que falla con las proposiciones que contienen "falla"."""
+
+    def parse_proposition(self, text):
+        if "falla" in text:
+            raise RecursionError("maximum recursion depth exceeded")
+        return super().parse_proposition(text)
+
+
+def test_batch_keeps_going_after_error(tmp_path):
+    """Un registro que falla se informa y no detiene el lote."""
+    path = tmp_path / "corpus.txt"
+    path.write_text("Si llueve entonces me mojo\nesto falla y aquello\nNo hace sol y hace frío\n", encoding="utf-8")
+    records = list(console.analyze_lines(console.read_propositions([str(path)]), FailingInterpreter()))
+    assert [sorted(record) for record in records][1] == ['error', 'proposition']
+    assert records[1] == {'proposition': "esto falla y aquello", 'error': "maximum recursion depth exceeded"}
+    assert records[0]['connector'] == "entonces" and records[2]['connector'] == "y"
+
+    output = io.StringIO()
+    assert console.write_jsonl(records, output) == 3
+    assert len([json.loads(line) for line in output.getvalue().splitlines()]) == 3
+
+
+def test_batch_max_atoms(tmp_path):
+    """Las líneas con demasiados átomos producen un registro de error sin generar la tabla."""
+    path = tmp_path / "corpus.txt"
+    wide = " y ".join(f"x{i}" for i in range(20))
+    path.write_text(f"Si llueve entonces me mojo\n{wide}\nNo hace sol y hace frío\n", encoding="utf-8")
+    for jobs in (1, 2):
+        output = io.StringIO()
+        assert console.run_batch([str(path)], output, jobs=jobs, max_atoms=16) == 3
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert records[1] == {'proposition': wide, 'error': "La proposición tiene más de 16 proposiciones atómicas"}
+        assert records[0]['truth_table'] and records[2]['truth_table']
+
+
+def test_max_atoms_option(tmp_path):
+    """--max-atoms cambia el límite de la línea de comandos."""
+    path = tmp_path / "corpus.txt"
+    path.write_text("Llueve y hace frío y nieva\n", encoding="utf-8")
+    output = tmp_path / "salida.jsonl"
+    assert console.main([str(path), "--max-atoms", "2", "-o", str(output)]) == 0
+    assert json.loads(output.read_text(encoding="utf-8"))['error'].startswith("La proposición tiene más de 2")
+    assert console.main([str(path), "--max-atoms", "0", "-o", str(output)]) == 0
+    assert len(json.loads(output.read_text(encoding="utf-8"))['truth_table']) == 9
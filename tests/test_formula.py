@@ -0,0 +1,87 @@
+"""Pruebas del árbol de fórmulas con cadenas largas de un mismo conector."""
+
+from itertools import product  # Importa product para recorrer todas las asignaciones
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+import formula  # Importa el módulo para cambiar el tamaño de bloque en las pruebas
+from bdd import BDD  # Importa los diagramas de decisión binarios
+from formula import compile_formula, render, signature  # Importa las funciones del árbol
+from interpreter import InterpreteLógico  # Importa el intérprete
+import sat  # Importa el resolvedor de satisfacibilidad
+
+# Operandos de las cadenas: más que el límite de paréntesis anidados de CPython
+# (200) y que la profundidad de recursión por defecto (1000)
+CHAIN_LENGTH = 1200
+
+
+def _iff_chain(values):
+    """Cadena de ↔ agrupada por la izquierda."""
+    result = values[0]
+    for value in values[1:]:
+        result = result == value
+    return result
+
+
+# Semántica de referencia de cada conector, agrupando como el analizador
+FOLDS = {
+    " y ": all,
+    " o ": any,
+    " entonces ": lambda values: not all(values[:-1]) or values[-1],
+    " es decir ": _iff_chain,
+}
+
+
+@pytest.mark.parametrize("word", list(FOLDS))
+def test_long_chain(word, truth_column):
+    """Una cadena con miles de operandos se analiza, evalúa y escribe sin errores."""
+    interpreter = InterpreteLógico()
+    operands = ["a", "b", "no c"] * (CHAIN_LENGTH // 3)
+    parsed = interpreter.parse_proposition(word.join(operands))
+    formula = parsed['formula']
+    assert parsed['variables'] == ["a", "b", "c"]
+
+    negated = [operand.startswith("no ") for operand in operands]
+    index = {"a": 0, "b": 1, "c": 2}
+    positions = [index[operand.split()[-1]] for operand in operands]
+    expected = [FOLDS[word]([row[i] != neg for i, neg in zip(positions, negated)])
+                for row in product([True, False], repeat=3)]
+
+    table = interpreter.generate_truth_table(parsed)
+    assert [row[-1] == "V" for row in table[1:]] == expected
+    scalar = compile_formula(formula)
+    assert [scalar(row) for row in product([True, False], repeat=3)] == expected
+    assert truth_column(formula, 3) == sum(1 << row for row, value in enumerate(expected) if value)
+    assert render(formula).count("(") == 0  # La cadena se escribe sin paréntesis
+    assert isinstance(signature(formula), tuple)
+
+    assert interpreter.is_satisfiable(parsed) == any(expected)
+    assert interpreter.is_tautology(parsed) == all(expected)
+    assert interpreter.model_count(parsed) == sum(expected)
+    assert sat.find_difference(formula, formula) is None
+    manager = BDD()
+    assert manager.from_formula(formula) == manager.from_formula(interpreter.parse_formula(word.join(operands)))
+
+
+def test_repeated_single_atom():
+    """Una cadena de un solo átomo repetido tiene una tabla de dos filas."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition(" y ".join(["a"] * 250))
+    table = interpreter.generate_truth_table(parsed)
+    assert [row[-1] for row in table[1:]] == ["V", "F"]
+    assert interpreter.compile(parsed, bitwise=True)([0b01], 0b11) == 0b01
+
+
+@pytest.mark.parametrize("atoms", [1, 2, 3, 5, 7])
+def test_lazy_table_by_blocks(atoms, monkeypatch):
+    """La tabla perezosa, evaluada por bloques, coincide con la tabla completa."""
+    monkeypatch.setattr(formula, "RESULT_BLOCK_BITS", 3)  # Bloques de 8 filas
+    interpreter = InterpreteLógico()
+    names = [f"x{i}" for i in range(atoms)]
+    text = f"{names[0]} o no {names[-1]}"
+    for index, name in enumerate(names[1:-1]):
+        text = f"si {text}, entonces no {name}" if index % 2 else f"{text} y {name}"
+    parsed = interpreter.parse_proposition(text)
+    view = interpreter.lazy_truth_table(parsed)
+    assert view.count == atoms
+    assert list(view) == interpreter.generate_truth_table(parsed)
@@ -0,0 +1,94 @@
+"""Pruebas del analizador léxico, del análisis de proposiciones y de lo que se carga al importar el intérprete."""
+
+import json  # Importa json para leer la salida del proceso
+import os  # Importa os para construir la ruta de la raíz
+import subprocess  # Importa subprocess para importar el intérprete en un proceso limpio
+import sys  # Importa sys para usar el mismo intérprete de Python
+from itertools import product  # Importa product para recorrer todas las asignaciones
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+from formula import Atom, Not  # Importa los nodos del árbol
+from interpreter import InterpreteLógico  # Importa el intérprete
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Raíz del repositorio
+
+
+def test_import_is_lazy():
+    """Importar el intérprete no carga threading ni los módulos opcionales ni compila el analizador."""
+    code = ("import json, sys, interpreter; "
+            "print(json.dumps([sorted(sys.modules), interpreter.compile_lexer.cache_info().currsize]))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    modules, compiled = json.loads(output)
+    assert not {"threading", "bisect", "cache", "sat", "bdd", "minimize"} & set(modules)
+    assert compiled == 0
+
+
+def test_tokenize_positions_with_case_changes():
+    """Las posiciones de los tokens son las del texto original aunque cambie al pasar a minúsculas."""
+    interpreter = InterpreteLógico()
+    for text in ["Llueve O BIEN nieva", "İstanbul está lejos y NO llueve"]:
+        tokens = interpreter.tokenize(text)
+        assert [text[token.start:token.end].lower() for token in tokens] == [token.word for token in tokens]
+    assert [token.word for token in interpreter.tokenize("İstanbul está lejos y NO llueve")] == ["y", "no"]
+
+
+@pytest.mark.parametrize("text, words", [
+    ("Todo pasó ayer", []),  # "o" dentro de "todo" e "y" dentro de "ayer" no son conectores
+    ("Todo salió bien y ayer llovió", ["y"]),
+    ("Sayonara o todo", ["o"]),
+    ("O bien llueve o bien nieva", ["o bien", "o bien"]),  # Gana la palabra clave más larga
+    ("Ni siquiera llueve y ayer nevó", ["ni siquiera", "y"]),
+])
+def test_tokenize_whole_words(text, words):
+    """Los conectores y las negaciones solo se reconocen como palabras completas."""
+    tokens = InterpreteLógico().tokenize(text)
+    assert [token.word for token in tokens] == words
+    assert [text[token.start:token.end].lower() for token in tokens] == words
+
+
+def test_parse_does_not_split_inside_words():
+    """parse_proposition no divide la proposición dentro de "todo" ni de "ayer"."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition("Todo pasó ayer")
+    assert parsed['connector'] is None and parsed['propositions'] == ["todo pasó ayer"]
+    parsed = interpreter.parse_proposition("Todo salió bien y ayer llovió")
+    assert parsed['connector_type'] == "CONJUNCIÓN"
+    assert parsed['propositions'] == ["todo salió bien", "ayer llovió"]
+
+
+def _shape(node):
+    """Árbol como tuplas anidadas: átomo -> nombre, ¬ -> ("¬", operando), binario -> (símbolo, izq., der.)."""
+    if isinstance(node, Atom):
+        return node.name
+    if isinstance(node, Not):
+        return "¬", _shape(node.operand)
+    return node.symbol, _shape(node.left), _shape(node.right)
+
+
+def test_nested_sentence():
+    """La oración de la petición da el árbol esperado y su columna de resultados es la calculada a mano."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition("si llueve y hace frío, entonces no salimos o leemos")
+    assert _shape(parsed['formula']) == ("→", ("∧", "llueve", "hace frío"), ("∨", ("¬", "salimos"), "leemos"))
+    assert parsed['variables'] == ["llueve", "hace frío", "salimos", "leemos"]
+
+    expected = [not (rains and cold) or not going_out or reading
+                for rains, cold, going_out, reading in product([True, False], repeat=4)]
+    table = interpreter.generate_truth_table(parsed)
+    assert [row[-1] == "V" for row in table[1:]] == expected
+
+
+@pytest.mark.parametrize("sentence, shape", [
+    # ↔ se agrupa después que →, → después que ∨, ∨ después que ∧ y ∧ después que la negación
+    ("llueve es decir hace frío entonces nieva o graniza y no truena",
+     ("↔", "llueve", ("→", "hace frío", ("∨", "nieva", ("∧", "graniza", ("¬", "truena")))))),
+    ("llueve y no truena o nieva entonces hace frío es decir graniza",
+     ("↔", ("→", ("∨", ("∧", "llueve", ("¬", "truena")), "nieva"), "hace frío"), "graniza")),
+    # → se agrupa por la derecha y ∧ por la izquierda
+    ("llueve entonces hace frío entonces nieva", ("→", "llueve", ("→", "hace frío", "nieva"))),
+    ("llueve y hace frío y nieva", ("∧", ("∧", "llueve", "hace frío"), "nieva")),
+])
+def test_precedence(sentence, shape):
+    """El árbol respeta la precedencia ↔ < → < ∨ < ∧ < ¬ sin importar el orden de los conectores."""
+    assert _shape(InterpreteLógico().parse_proposition(sentence)['formula']) == shape
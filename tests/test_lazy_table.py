@@ -0,0 +1,61 @@
+"""Pruebas de la tabla de verdad perezosa y de su formato por bloques."""
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+import formula  # Importa el módulo para cambiar el tamaño de bloque en las pruebas
+import interpreter as interpreter_module  # Importa el módulo para cambiar el tamaño de página en las pruebas
+from interpreter import InterpreteLógico, TruthTableView  # Importa el intérprete y la vista perezosa
+
+SENTENCES = [
+    "Si llueve entonces me mojo",
+    "No llueve y hace frío o nieva",
+    "Estudio o trabajo es decir no descanso y duermo o leo",
+]
+
+
+@pytest.fixture
+def small_pages(monkeypatch):
+    """Páginas y bloques de 3 filas para recorrer varias páginas con pocas variables."""
+    monkeypatch.setattr(interpreter_module, "TABLE_PAGE_SIZE", 3)
+    monkeypatch.setattr(formula, "RESULT_BLOCK_BITS", 3)
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_view_matches_table(sentence, small_pages):
+    """Filas, rangos, rebanadas e iteración por páginas coinciden con generate_truth_table."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition(sentence)
+    table = interpreter.generate_truth_table(parsed)
+    view = interpreter.lazy_truth_table(parsed)
+    assert isinstance(view, TruthTableView)
+    assert len(view) == len(table) and list(view) == table
+    assert [view[k] for k in range(len(table))] == table
+    assert view[-1] == table[-1] and view[-len(table)] == table[0]
+    assert view[:] == table and view[2:5] == table[2:5] and view[1::2] == table[1::2]
+    assert view.rows(-4, 2) == table[1:3] and view.rows(len(view), len(view) + 5) == []
+    with pytest.raises(IndexError):
+        view.row(view.size)
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_chunked_format(sentence, small_pages):
+    """Los bloques de iter_format_truth_table unidos dan el mismo texto para la lista y para la vista."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition(sentence)
+    text = interpreter.format_truth_table(interpreter.generate_truth_table(parsed))
+    view = interpreter.lazy_truth_table(parsed)
+    chunks = list(interpreter.iter_format_truth_table(view, chunk_rows=2))
+    assert len(chunks) == 2 + (view.size + 1) // 2  # Encabezado, bloques de 2 filas y separador final
+    assert "".join(chunks) == text == interpreter.format_truth_table(view)
+
+
+def test_cancel_and_invalid(small_pages):
+    """Con cancelled el cálculo se abandona y una proposición sin conector devuelve el mensaje de error."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition(SENTENCES[-1])  # 5 variables: 4 bloques de 8 filas
+    checks = []
+    assert interpreter.lazy_truth_table(parsed, cancelled=lambda: checks.append(1) or len(checks) == 2) is None
+    assert len(checks) == 2  # Se abandona en cuanto cancelled devuelve True
+    message = interpreter.lazy_truth_table(interpreter.parse_proposition("Llueve"))
+    assert message == "No se pudo generar la tabla de verdad"
+    assert interpreter.format_truth_table(message) == message
@@ -0,0 +1,106 @@
+"""Pruebas del hilo de análisis en vivo de la interfaz, sin Tk."""
+
+import queue  # Importa las colas que sustituyen a las del módulo
+import threading  # Importa los hilos para ejecutar el analizador
+import time  # Importa time para esperar al hilo
+
+import pytest  # Importa pytest para declarar los fixtures
+
+import formula  # Importa el módulo para cambiar el tamaño de bloque en las pruebas
+import live  # Importa el hilo de análisis
+from interpreter import InterpreteLógico, TruthTableView  # Importa el intérprete y la vista perezosa
+
+TIMEOUT = 5  # Segundos como máximo esperando un resultado
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    """Colas y generación nuevas; devuelve una función que arranca el hilo, que se detiene al terminar."""
+    monkeypatch.setattr(live, "requests_queue", queue.Queue())
+    monkeypatch.setattr(live, "results_queue", queue.Queue())
+    monkeypatch.setattr(live, "generation", 0)
+    threads = []
+
+    def start():
+        thread = threading.Thread(target=live.analysis_worker, daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    yield start
+    for thread in threads:
+        live.requests_queue.put(None)  # Petición de fin
+        thread.join(TIMEOUT)
+        assert not thread.is_alive()
+
+
+def _ask(proposition, interactive=False):
+    """Envía una petición con la generación actual y espera su resultado."""
+    live.requests_queue.put((live.generation, proposition, interactive))
+    return live.results_queue.get(timeout=TIMEOUT)
+
+
+def test_only_latest_request(worker):
+    """Las peticiones que esperan juntas se reducen a la más reciente."""
+    for text in ["Llueve y hace frío", "Llueve o nieva", "Si llueve entonces me mojo"]:
+        live.requests_queue.put((0, text, False))
+    worker()
+    generation, proposition, parsed, table, interactive = live.results_queue.get(timeout=TIMEOUT)
+    assert (generation, proposition, interactive) == (0, "Si llueve entonces me mojo", False)
+    assert parsed['connector_type'] == "CONDICIONAL" and isinstance(table, TruthTableView)
+    assert _ask("Llueve o nieva")[1] == "Llueve o nieva"  # Nada más quedó en la cola de resultados
+
+
+def test_stale_generation_is_dropped(worker):
+    """Una petición de una generación anterior no se analiza."""
+    live.requests_queue.put((0, "Llueve y hace frío", False))
+    live.generation = 1  # El texto cambió mientras la petición esperaba
+    worker()
+    while not live.requests_queue.empty():  # Espera a que el hilo tome la petición antigua
+        time.sleep(0.001)
+    assert _ask("Llueve o nieva")[:2] == (1, "Llueve o nieva")
+
+
+def test_same_structure_reuses_table(worker):
+    """Si solo cambia el texto de los átomos se devuelve la misma tabla."""
+    worker()
+    first = _ask("Llueve y hace frío")[3]
+    assert _ask("Nieva y hace sol")[3] is first
+    other = _ask("Llueve o nieva")[3]
+    assert other is not first and list(other) == InterpreteLógico().generate_truth_table(
+        InterpreteLógico().parse_proposition("Llueve o nieva"))
+
+
+def test_new_keystroke_abandons_table(worker, monkeypatch):
+    """Si la generación cambia mientras se calcula la tabla, no se devuelve nada."""
+    monkeypatch.setattr(formula, "RESULT_BLOCK_BITS", 1)  # Varios bloques: cancelled se consulta
+
+    typed = threading.Event()  # La pulsación simulada ya ocurrió
+
+    class Typing(InterpreteLógico):
+        """Intérprete que simula una pulsación durante el primer cálculo de una tabla."""
+
+        def lazy_truth_table(self, parsed_prop, cancelled=None):
+            if not typed.is_set():
+                live.generation += 1
+                typed.set()
+            return super().lazy_truth_table(parsed_prop, cancelled)
+
+    monkeypatch.setattr(live, "live_interpreter", Typing())
+    worker()
+    live.requests_queue.put((live.generation, "Llueve y hace frío o nieva", False))
+    assert typed.wait(TIMEOUT)
+    assert _ask("Llueve o nieva")[:2] == (1, "Llueve o nieva")  # El primer análisis no produjo resultado
+    assert live.results_queue.empty()
+
+
+def test_limits_and_errors(worker):
+    """Las tablas demasiado grandes se sustituyen por un mensaje y los errores no detienen el hilo."""
+    worker()
+    many = " y ".join(f"a{i}" for i in range(live.MAX_LIVE_ATOMS + 1))
+    assert _ask(many)[3] == live.too_many_atoms(live.MAX_LIVE_ATOMS + 1, False)
+    too_many = " y ".join(f"a{i}" for i in range(live.MAX_ATOMS + 1))
+    assert _ask(too_many, interactive=True)[3] == live.too_many_atoms(live.MAX_ATOMS + 1, True)
+    _, _, parsed, table, _ = _ask(None)
+    assert parsed is None and table.startswith("Error:")
+    _, _, parsed, table, _ = _ask("Llueve")
+    assert parsed['connector'] is None and table is None
@@ -0,0 +1,41 @@
+"""Pruebas de la instrumentación por etapas del intérprete."""
+
+import pytest  # Importa pytest para comprobar las excepciones
+
+from interpreter import InterpreteLógico  # Importa el intérprete
+from metrics import Metrics  # Importa el registro de métricas
+
+
+def test_valid_calls_are_counted_by_connector():
+    """Una proposición válida se cuenta en cada etapa con su tipo de conector y sin errores."""
+    metrics = Metrics()
+    interpreter = InterpreteLógico(metrics=metrics)
+    interpreter.generate_truth_table(interpreter.parse_proposition("Si llueve entonces me mojo"))
+    snapshot = metrics.snapshot()
+    assert snapshot['parse']['count'] == snapshot['table']['count'] == 1
+    assert snapshot['parse']['errors'] == snapshot['table']['errors'] == 0
+    assert set(snapshot['table']['by_connector']) == {"CONDICIONAL"}
+
+
+def test_invalid_formula_is_counted_as_error():
+    """Una llamada que lanza una excepción se cuenta, sin conector, y el gancho recibe su "stop"."""
+    events = []
+    metrics = Metrics(hook=lambda stage, event, connector_type, elapsed: events.append((stage, event, connector_type)))
+    interpreter = InterpreteLógico(metrics=metrics)
+    with pytest.raises(TypeError):
+        interpreter.generate_truth_table("No se pudo analizar")
+    with pytest.raises(AttributeError):
+        interpreter.parse_proposition(None)
+
+    snapshot = metrics.snapshot()
+    assert snapshot['table'] == {'count': 1, 'errors': 1, 'seconds': snapshot['table']['seconds'],
+                                 'by_connector': {"": {'count': 1, 'seconds': snapshot['table']['seconds']}}}
+    assert snapshot['parse']['count'] == snapshot['parse']['errors'] == 1
+    assert events == [("table", "start", None), ("table", "stop", None),
+                      ("parse", "start", None), ("parse", "stop", None)]
+    exported = metrics.to_prometheus()
+    assert 'interprete_stage_errors_total{stage="table"} 1' in exported
+    assert 'interprete_stage_seconds_count{stage="table",connector_type=""} 1' in exported
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
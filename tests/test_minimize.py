@@ -0,0 +1,90 @@
+"""Pruebas de la minimización: equivalencia y cobertura mínima por fuerza bruta."""
+
+import random  # Importa random para generar funciones de prueba
+from itertools import combinations  # Importa combinations para recorrer las coberturas
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+from formula import Binary, chain_operands, leaves  # Importa las funciones del árbol
+from interpreter import InterpreteLógico  # Importa el intérprete
+from minimize import minimize_column, prime_implicants  # Importa la minimización
+
+
+def _score(node):
+    """(productos, literales) de una suma de productos."""
+    terms = chain_operands(node) if isinstance(node, Binary) and node.symbol == "∨" else [node]
+    return len(terms), len(leaves(node))
+
+
+def _brute_force_score(column, count):
+    """Menor (productos, literales) entre todas las coberturas con implicantes primos."""
+    primes = prime_implicants(column, count)
+    rows = []
+    for values, fixed in primes:  # Filas de cada primo, fila por fila
+        covered = 0
+        for row in range(1 << count):
+            minterm = row ^ ((1 << count) - 1)  # La fila 0 es todo verdadero
+            if minterm & fixed == values:
+                covered |= 1 << row
+        rows.append(covered)
+    for size in range(1, len(primes) + 1):
+        literals = [sum(primes[i][1].bit_count() for i in chosen)
+                    for chosen in combinations(range(len(primes)), size)
+                    if _union(rows, chosen) == column]
+        if literals:
+            return size, min(literals)
+    raise AssertionError("Los implicantes primos no cubren la función")
+
+
+def _union(rows, chosen):
+    """Unión de las filas de los cubos elegidos."""
+    covered = 0
+    for i in chosen:
+        covered |= rows[i]
+    return covered
+
+
+def _functions():
+    """Todas las funciones de 3 variables y una muestra fija de 4 variables."""
+    generator = random.Random(17)
+    cases = [(column, 3) for column in range(1, 255)]
+    cases += [(generator.getrandbits(16), 4) for _ in range(80)]
+    return [(column, count) for column, count in cases if 0 < column < (1 << (1 << count)) - 1]
+
+
+@pytest.mark.parametrize("column, count", _functions())
+def test_minimum_cover(column, count, truth_column):
+    """La fórmula es equivalente y tiene tan pocos productos y literales como la mejor cobertura."""
+    minimized = minimize_column(column, count)
+    assert truth_column(minimized, count) == column
+    assert _score(minimized) == _brute_force_score(column, count)
+
+
+@pytest.mark.parametrize("exact_limit, prime_limit", [(7, 12), (0, 12), (0, 0)])
+def test_equivalent_in_every_tier(exact_limit, prime_limit, truth_column):
+    """La búsqueda completa, la limitada y la expansión dan fórmulas equivalentes."""
+    generator = random.Random(5)
+    for count in (5, 6, 7):
+        for density in (0.3, 0.5, 0.8):
+            column = sum(1 << row for row in range(1 << count) if generator.random() < density)
+            minimized = minimize_column(column, count, exact_limit=exact_limit, prime_limit=prime_limit)
+            assert truth_column(minimized, count) == column
+
+
+def test_heuristic_result_is_labelled():
+    """format_minimized indica cuándo el resultado puede no ser mínimo."""
+    interpreter = InterpreteLógico()
+    small = [["p", "q", "p ∧ q"], ["V", "V", "V"], ["V", "F", "F"], ["F", "V", "F"], ["F", "F", "F"]]
+    assert "heurístico" not in interpreter.format_minimized(small)
+    parsed = interpreter.parse_proposition(" y ".join(f"a{i}" for i in range(9)))
+    assert "heurístico" in interpreter.format_minimized(parsed)
+
+
+def test_invalid_table_raises_value_error():
+    """El mensaje de error de generate_truth_table no se minimiza."""
+    interpreter = InterpreteLógico()
+    table = interpreter.generate_truth_table(interpreter.parse_proposition("Llueve"))
+    assert isinstance(table, str)
+    with pytest.raises(ValueError, match="No se pudo generar"):
+        interpreter.minimize(table)
+    assert interpreter.format_minimized(table) == table
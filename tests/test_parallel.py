@@ -0,0 +1,30 @@
+"""Pruebas del análisis paralelo cuando muere un proceso de trabajo."""
+
+import os  # Importa os para terminar el proceso de trabajo
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+import parallel  # Importa el análisis paralelo
+
+# Proposición que termina el proceso que la analiza
+FATAL = "esto mata al proceso"
+
+
+def _dying_record(interpreter, text, max_atoms=0):
+    """Como console.analysis_record, pero termina el proceso con FATAL."""
+    if text == FATAL:
+        os._exit(1)
+    return {'proposition': text}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3])
+def test_worker_death_keeps_one_record_per_line(monkeypatch, chunk_size):
+    """Si un proceso muere, hay un registro por línea, en orden, y solo fallan las de su bloque."""
+    monkeypatch.setattr(parallel, "analysis_record", _dying_record)  # Los procesos se crean con fork
+    lines = [f"p{i} y q{i}" for i in range(20)]
+    lines[7] = FATAL
+    records = list(parallel.analyze_parallel(lines, workers=2, chunk_size=chunk_size, max_pending=4))
+    assert [record['proposition'] for record in records] == lines
+    failed = [i for i, record in enumerate(records) if 'error' in record]
+    start = 7 // chunk_size * chunk_size  # Bloque de la línea fatal
+    assert failed == list(range(start, start + chunk_size))
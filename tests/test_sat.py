@@ -0,0 +1,81 @@
+"""Pruebas del resolvedor de satisfacibilidad contra la fuerza bruta."""
+
+import random  # Importa random para generar los problemas
+from itertools import product  # Importa product para recorrer todas las asignaciones
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+from formula import compile_formula, variables_of  # Importa la evaluación de fórmulas
+from sat import Solver, find_difference, find_model  # Importa el resolvedor
+
+ATOMS = 5  # Átomos de las fórmulas aleatorias
+
+
+def _holds(node, model):
+    """Evalúa la fórmula con un modelo por texto de átomo (los ausentes no influyen)."""
+    values = [model.get(f"a{i}", False) for i in range(ATOMS)]
+    return compile_formula(node)(values)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_find_model(seed, random_formula, truth_column):
+    """find_model responde como la tabla de verdad y sus modelos cumplen la fórmula."""
+    generator = random.Random(seed)
+    node = random_formula(generator, ATOMS, 5)
+    column = truth_column(node, ATOMS)
+    satisfiable = {True: column != 0, False: column != (1 << (1 << ATOMS)) - 1}
+    for wanted in (True, False):
+        model = find_model((node, wanted))
+        assert (model is not None) == satisfiable[wanted]
+        if model is not None:
+            assert set(model) == set(variables_of(node))
+            assert _holds(node, model) == wanted
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_find_difference(seed, random_formula, truth_column):
+    """find_difference solo devuelve asignaciones en las que las fórmulas difieren."""
+    generator = random.Random(seed)
+    first, second = random_formula(generator, ATOMS, 3), random_formula(generator, ATOMS, 3)
+    for other in (first, second):
+        difference = find_difference(first, other)
+        assert (difference is None) == (truth_column(first, ATOMS) == truth_column(other, ATOMS))
+        if difference is not None:
+            assert _holds(first, difference) != _holds(other, difference)
+
+
+def _brute_force(clauses, num_vars):
+    """True si alguna asignación cumple todas las cláusulas."""
+    return any(all(any((lit > 0) == values[abs(lit) - 1] for lit in clause) for clause in clauses)
+               for values in product([True, False], repeat=num_vars))
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_3cnf(seed):
+    """En 3-CNF aleatorias cerca del umbral el resultado coincide con la fuerza bruta."""
+    generator = random.Random(seed)
+    num_vars = 12
+    clauses = [[generator.choice((1, -1)) * v for v in generator.sample(range(1, num_vars + 1), 3)]
+               for _ in range(51)]
+    solver = Solver(num_vars)
+    for clause in clauses:
+        solver.add_clause(clause)
+    model = solver.solve()
+    assert (model is not None) == _brute_force(clauses, num_vars)
+    if model is not None:
+        assert all(any(model[abs(lit)] == (lit > 0) for lit in clause) for clause in clauses)
+
+
+def test_pigeonhole_is_unsatisfiable():
+    """Siete palomas no caben en seis huecos: exige muchos conflictos y aprendizaje."""
+    pigeons, holes = 7, 6
+    var = lambda p, h: p * holes + h + 1
+    solver = Solver(pigeons * holes)
+    for p in range(pigeons):  # Cada paloma está en algún hueco
+        solver.add_clause([var(p, h) for h in range(holes)])
+    for h in range(holes):  # Dos palomas no comparten hueco
+        for p in range(pigeons):
+            for q in range(p + 1, pigeons):
+                solver.add_clause([-var(p, h), -var(q, h)])
+    assert solver.solve() is None
+    assert solver.conflicts > 0
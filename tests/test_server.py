@@ -0,0 +1,108 @@
+"""Pruebas del servidor de análisis asíncrono."""
+
+import asyncio  # Importa el bucle de eventos
+import json  # Importa json para las peticiones y respuestas
+import os  # Importa os para terminar un proceso de trabajo
+
+import server  # Importa el servidor
+
+# Proposición que termina el proceso que la analiza
+FATAL = "esto mata al proceso"
+
+
+class RecordingServer(server.AnalysisServer):
+    """Servidor que anota el tamaño de cada lote y las peticiones simultáneas."""
+
+    def __init__(self, **options):
+        super().__init__(port=0, workers=1, **options)
+        self.batch_sizes = []  # Peticiones de cada lote enviado
+        self.active = 0  # Peticiones en submit ahora mismo
+        self.peak = 0  # Máximo de peticiones simultáneas en submit
+
+    async def _run_batch(self, batch):
+        self.batch_sizes.append(len(batch))
+        await super()._run_batch(batch)
+
+    async def submit(self, operation, text):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            return await super().submit(operation, text)
+        finally:
+            self.active -= 1
+
+
+async def _exchange(analysis, requests):
+    """Envía peticiones por una conexión y devuelve las respuestas por id."""
+    reader, writer = await asyncio.open_connection(analysis.host, analysis.port)
+    writer.write("".join(json.dumps(request) + "\n" for request in requests).encode("utf-8"))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    writer.close()
+    return {response['id']: response for response in responses}
+
+
+def _run(scenario, **options):
+    """Arranca un servidor, ejecuta el escenario y cierra el servidor."""
+    async def main():
+        analysis = RecordingServer(**options)
+        await analysis.start()
+        try:
+            return analysis, await scenario(analysis)
+        finally:
+            await analysis.close()
+    return asyncio.run(main())
+
+
+def test_requests_are_batched():
+    """Las peticiones que llegan juntas se resuelven en pocos lotes y cada una recibe su respuesta."""
+    requests = [{'id': i, 'op': "table", 'text': f"p{i} y q{i}"} for i in range(40)]
+    requests.append({'id': "malo", 'op': "nada", 'text': "p"})
+    analysis, responses = _run(lambda analysis: _exchange(analysis, requests), batch_delay=0.05)
+    assert all(responses[i]['ok'] and len(responses[i]['result']) == 5 for i in range(40))
+    assert responses["malo"] == {'id': "malo", 'ok': False, 'error': "Operación desconocida: nada"}
+    assert sum(analysis.batch_sizes) == 40 and len(analysis.batch_sizes) < 40
+
+
+def test_concurrency_limit():
+    """Nunca hay más peticiones en curso que max_concurrency."""
+    requests = [{'id': i, 'op': "parse", 'text': f"p{i} o q{i}"} for i in range(30)]
+    analysis, responses = _run(lambda analysis: _exchange(analysis, requests), max_concurrency=3)
+    assert all(response['ok'] for response in responses.values())
+    assert analysis.peak == 3
+
+
+def test_close_cancels_open_connections():
+    """close() termina aunque haya conexiones abiertas y peticiones esperando."""
+    async def scenario(analysis):
+        reader, writer = await asyncio.open_connection(analysis.host, analysis.port)
+        idle = await asyncio.open_connection(analysis.host, analysis.port)
+        writer.write(b'{"id": 1, "op": "parse", "text": "p y q"}\n')
+        await writer.drain()
+        assert json.loads(await reader.readline())['ok']
+        await asyncio.wait_for(analysis.close(), 5)
+        assert not analysis._clients
+        assert await asyncio.wait_for(idle[0].read(), 5) == b""  # El servidor cerró la conexión
+
+    _run(scenario)
+
+
+def _dying_request(operation, text, max_atoms):
+    """Como server._process_request, pero termina el proceso con FATAL."""
+    if text == FATAL:
+        os._exit(1)
+    return True, text
+
+
+def test_broken_pool_is_replaced(monkeypatch):
+    """Si un proceso muere, falla su petición y las siguientes usan un grupo nuevo."""
+    monkeypatch.setattr(server, "_process_request", _dying_request)  # Los procesos se crean con fork
+
+    async def scenario(analysis):
+        fatal = await _exchange(analysis, [{'id': 1, 'text': FATAL}])
+        after = await _exchange(analysis, [{'id': 2, 'text': "p y q"}])
+        return fatal[1], after[2]
+
+    _, (fatal, after) = _run(scenario)
+    assert not fatal['ok'] and fatal['error'].startswith("BrokenProcessPool")
+    assert after == {'id': 2, 'ok': True, 'result': "p y q"}
@@ -0,0 +1,62 @@
+"""Pruebas de la tabla de símbolos y de las variables compartidas por átomos repetidos."""
+
+import threading  # Importa los hilos para internar en paralelo
+
+import pytest  # Importa pytest para comprobar las excepciones
+
+from interpreter import InterpreteLógico  # Importa el intérprete
+from symbols import SymbolTable, normalize_atom  # Importa la tabla de símbolos
+
+
+def test_equivalent_texts_share_one_id():
+    """Los textos que solo difieren en mayúsculas, espacios o puntuación son el mismo átomo."""
+    table = SymbolTable()
+    assert table.intern_all(["Llueve.", "  llueve", "¿LLUEVE?", "hace  frío", "Hace frío!"]) == [0, 0, 0, 1, 1]
+    assert table.names == ["llueve", "hace frío"] and len(table) == 2
+    assert "LLUEVE " in table and "nieva" not in table
+    assert table.name(1) == normalize_atom("Hace  Frío.") == "hace frío"
+
+
+def test_concurrent_interning():
+    """Desde varios hilos cada texto recibe un único identificador."""
+    table = SymbolTable()
+    texts = [f"átomo {i % 50}" for i in range(2000)]
+    results = [None] * 8
+
+    def work(slot):
+        results[slot] = table.intern_all(texts)
+
+    threads = [threading.Thread(target=work, args=(slot,)) for slot in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(table) == 50 and all(result == results[0] for result in results)
+    assert [table.name(symbol) for symbol in results[0]] == texts
+
+
+def test_repeated_atoms_are_one_variable():
+    """La proposición "No llueve o llueve" tiene una variable y su tabla dos filas."""
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition("No llueve o llueve")
+    assert parsed['variables'] == ["llueve"] and parsed['negations'] == [True, False]
+    assert interpreter.generate_truth_table(parsed) == [["p", "¬p ∨ p"], ["V", "V"], ["F", "V"]]
+
+
+def test_shared_table_across_interpreters():
+    """Una tabla compartida da los mismos identificadores en todo el corpus, sin contar las negaciones."""
+    table = SymbolTable()
+    first, second = InterpreteLógico(symbols=table), InterpreteLógico(symbols=table)
+    assert first.variable_ids(first.parse_proposition("No llueve o llueve")) == [0]
+    assert second.variable_ids(second.parse_proposition("Hace frío y LLUEVE.")) == [1, 0]
+    assert first.intern_atom("No hace frío") == (1, True)
+    assert table.names == ["llueve", "hace frío"]
+
+
+def test_without_table():
+    """Sin tabla de símbolos no se interna nada."""
+    interpreter = InterpreteLógico()
+    with pytest.raises(ValueError):
+        interpreter.variable_ids(interpreter.parse_proposition("Llueve y hace frío"))
+    with pytest.raises(ValueError):
+        interpreter.intern_atom("Llueve")
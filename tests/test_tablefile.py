@@ -0,0 +1,71 @@
+"""Pruebas del formato binario de tablas de verdad."""
+
+import pytest  # Importa pytest para parametrizar las pruebas
+
+import formula  # Importa el módulo para cambiar el tamaño de bloque en las pruebas
+from interpreter import InterpreteLógico  # Importa el intérprete
+from tablefile import open_truth_table, write_truth_table  # Importa la escritura y la lectura
+
+
+@pytest.mark.parametrize("sentence", [
+    "Si llueve entonces me mojo",
+    "Llueve y no hace frío o nieva",
+    "Estudio o trabajo es decir no descanso y duermo o leo",
+])
+def test_round_trip(tmp_path, monkeypatch, sentence):
+    """La tabla leída del archivo es la de generate_truth_table, fila a fila y por rangos."""
+    monkeypatch.setattr(formula, "RESULT_BLOCK_BITS", 3)  # Varios bloques aun con pocas variables
+    interpreter = InterpreteLógico()
+    parsed = interpreter.parse_proposition(sentence)
+    table = interpreter.generate_truth_table(parsed)
+    path = tmp_path / "tabla.tv"
+    assert write_truth_table(str(path), interpreter, parsed) == len(table) - 1
+
+    with open_truth_table(str(path)) as packed:
+        assert packed.headers == table[0]
+        assert len(packed) == len(table) - 1
+        assert [packed.row(k) for k in range(len(packed))] == table[1:]
+        assert packed.rows(1, len(packed) - 1) == table[2:-1]
+        assert packed.count_models() == sum(row[-1] == "V" for row in table[1:])
+        assert packed.count_models(1, 3) == sum(row[-1] == "V" for row in table[2:4])
+        assert packed.diff_count(packed) == 0
+
+
+def test_diff_count(tmp_path):
+    """diff_count cuenta las filas en las que difieren dos tablas del mismo tamaño."""
+    interpreter = InterpreteLógico()
+    first, second = tmp_path / "y.tv", tmp_path / "o.tv"
+    write_truth_table(str(first), interpreter, interpreter.parse_proposition("Llueve y hace frío"))
+    write_truth_table(str(second), interpreter, interpreter.parse_proposition("Llueve o hace frío"))
+    with open_truth_table(str(first)) as conjunction, open_truth_table(str(second)) as disjunction:
+        assert conjunction.diff_count(disjunction) == 2
+
+
+def _valid_file(tmp_path):
+    """Contenido de un archivo de tabla válido."""
+    interpreter = InterpreteLógico()
+    path = tmp_path / "valida.tv"
+    write_truth_table(str(path), interpreter, interpreter.parse_proposition("Si llueve entonces me mojo"))
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: b"XXXX" + data[4:],  # Identificador incorrecto
+    lambda data: data[:-1],  # Faltan los bits de resultados
+    lambda data: data[:30],  # Metadatos cortados
+    lambda data: data[:10],  # Cabecera incompleta
+    lambda data: b"",  # Archivo vacío
+])
+def test_invalid_file_raises_value_error(tmp_path, damage):
+    """Un archivo incompatible, truncado o vacío produce ValueError."""
+    path = tmp_path / "dañada.tv"
+    path.write_bytes(damage(_valid_file(tmp_path)))
+    with pytest.raises(ValueError):
+        open_truth_table(str(path))
+
+
+def test_invalid_proposition_raises_value_error(tmp_path):
+    """Una proposición sin conector no se puede exportar."""
+    interpreter = InterpreteLógico()
+    with pytest.raises(ValueError):
+        write_truth_table(str(tmp_path / "nada.tv"), interpreter, interpreter.parse_proposition("Llueve"))
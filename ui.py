@@ -1,6 +1,54 @@
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from interpreter import InterpreteLógico
+import live
+from live import requests_queue, results_queue
+
+PAGE_SIZE = 25  # Filas de la tabla de verdad que se insertan en la vista a la vez
+LIVE_DELAY = 250  # Milisegundos sin escribir antes de analizar en vivo
+POLL_INTERVAL = 30  # Milisegundos entre revisiones de los resultados del hilo de análisis
+current_table = None  # Tabla de verdad perezosa que se está mostrando
+first_row = 0  # Primera fila visible de la tabla de verdad
+
+pending_job = None  # Análisis en vivo programado con root.after
+
+def poll_results():
+    """Mostrar en el hilo de Tk los resultados vigentes del hilo de análisis."""
+    try:
+        while True:
+            request_generation, proposition, parsed, truth_table, interactive = results_queue.get_nowait()
+            if request_generation == live.generation:  # Descartar resultados de textos anteriores
+                display_result(proposition, parsed, truth_table, interactive)
+    except queue.Empty:
+        pass
+    root.after(POLL_INTERVAL, poll_results)  # Volver a revisar más tarde
+
+def request_analysis(proposition, interactive):
+    """Enviar una proposición al hilo de análisis."""
+    global pending_job
+    pending_job = None
+    requests_queue.put((live.generation, proposition, interactive))
+
+def cancel_pending():
+    """Invalidar las peticiones anteriores y cancelar el análisis programado."""
+    global pending_job
+    live.generation += 1  # Las respuestas en curso quedan obsoletas
+    if pending_job is not None:
+        root.after_cancel(pending_job)
+        pending_job = None
+
+def on_edit(*_):
+    """Programar el análisis en vivo cuando el usuario deja de escribir."""
+    global pending_job
+    cancel_pending()
+    if not live_var.get():  # Análisis en vivo desactivado
+        return
+    proposition = entry.get().strip()
+    if not proposition:
+        reset_display()
+        return
+    pending_job = root.after(LIVE_DELAY, request_analysis, proposition, False)
 
 def analyze_proposition():
     """Función para analizar la proposición ingresada y mostrar resultados."""
@@ -9,9 +57,15 @@ def analyze_proposition():
         messagebox.showwarning("Atención", "Por favor, ingrese una proposición y presione 'Analizar'.\nEjemplo: 'Si llueve, entonces llevaremos paraguas.'")
         reset_display()  # Restablecer la interfaz si no hay entrada
         return
-
-    interpreter = InterpreteLógico()  # Crear una instancia del intérprete lógico
-    parsed = interpreter.parse_proposition(proposition)  # Analizar la proposición ingresada
+    cancel_pending()  # El botón sustituye cualquier análisis en vivo pendiente
+    request_analysis(proposition, True)  # Analizar fuera del hilo de la interfaz
+
+def display_result(proposition, parsed, truth_table, interactive):
+    """Mostrar el análisis de una proposición (se ejecuta en el hilo de Tk)."""
+    if parsed is None:  # Error en el hilo de análisis
+        reset_display()
+        show_truth_table(truth_table)
+        return
 
     if parsed['connector']:  # Verificar si se encontró un conector lógico
         prop_original_label.config(text="Proposición original:")  # Configurar la etiqueta de la proposición original
@@ -34,21 +88,59 @@ def analyze_proposition():
         ])
         proposiciones_result_label.config(text=proposiciones_result)  # Mostrar las proposiciones identificadas
 
-        truth_table = interpreter.generate_truth_table(parsed)  # Generar la tabla de verdad
-        table.delete(*table.get_children())  # Limpiar la tabla antes de insertar nuevos datos
-        if isinstance(truth_table, str):  # Verificar si la tabla de verdad es una cadena
-            table.insert("", tk.END, values=(truth_table,))  # Insertar el mensaje de error en la tabla
-        else:
-            table["columns"] = truth_table[0]  # Configurar las columnas de la tabla
-            for col in truth_table[0]:  # Iterar sobre las columnas para configurarlas
-                table.heading(col, text=col)  # Configurar el encabezado de la columna
-                table.column(col, width=100, anchor=tk.CENTER)  # Configurar el ancho y alineación de la columna
-
-            for row in truth_table[1:]:  # Iterar sobre las filas de la tabla de verdad
-                table.insert("", tk.END, values=row)  # Insertar cada fila en la tabla
+        if truth_table is not current_table:  # Con la misma estructura lógica la tabla ya está en pantalla
+            show_truth_table(truth_table)  # Mostrar la primera página de la tabla de verdad perezosa
     else:
         reset_display()  # Restablecer la interfaz si no se encontró un conector lógico
-        messagebox.showinfo("Resultado", "No se encontró ningún conector lógico en la proposición.")  # Mostrar mensaje de error
+        if interactive:  # Mientras se escribe no se muestran ventanas emergentes
+            messagebox.showinfo("Resultado", "No se encontró ningún conector lógico en la proposición.")  # Mostrar mensaje de error
+
+def show_truth_table(truth_table):
+    """Configurar las columnas de la tabla y mostrar la primera página de filas."""
+    global current_table
+    table.delete(*table.get_children())  # Limpiar la tabla antes de insertar nuevos datos
+    if isinstance(truth_table, str):  # Verificar si la tabla de verdad es una cadena
+        current_table = None
+        table.insert("", tk.END, values=(truth_table,))  # Insertar el mensaje de error en la tabla
+        scrollbar.set(0, 1)  # No hay nada que desplazar
+        return
+
+    current_table = truth_table
+    table["columns"] = list(range(len(truth_table.headers)))  # Configurar las columnas por posición (los encabezados pueden repetirse)
+    for col, header in enumerate(truth_table.headers):  # Iterar sobre las columnas para configurarlas
+        table.heading(col, text=header)  # Configurar el encabezado de la columna
+        table.column(col, width=100, anchor=tk.CENTER)  # Configurar el ancho y alineación de la columna
+    show_rows(0)  # Mostrar la primera página
+
+def show_rows(start):
+    """Insertar solo la página de filas visible a partir de la fila indicada."""
+    global first_row
+    if current_table is None:
+        return
+    total = current_table.size  # Número de filas de la tabla
+    first_row = max(0, min(start, total - PAGE_SIZE))  # Mantener la página dentro de la tabla
+    table.delete(*table.get_children())  # Quitar la página anterior
+    for row in current_table.rows(first_row, first_row + PAGE_SIZE):  # Calcular solo las filas visibles
+        table.insert("", tk.END, values=row)
+    scrollbar.set(first_row / total, min(total, first_row + PAGE_SIZE) / total)  # Actualizar la barra
+
+def on_scroll(action, amount, unit=None):
+    """Responder a la barra de desplazamiento con la tabla virtual."""
+    if current_table is None:
+        return
+    if action == "moveto":  # Arrastre de la barra
+        show_rows(int(float(amount) * current_table.size))
+    elif action == "scroll":  # Flechas o clic en la barra
+        step = int(amount) * (PAGE_SIZE if unit == "pages" else 1)
+        show_rows(first_row + step)
+
+def on_mousewheel(event):
+    """Desplazar la tabla virtual con la rueda del ratón."""
+    if event.num == 4 or event.delta > 0:  # Rueda hacia arriba (Linux usa los botones 4 y 5)
+        show_rows(first_row - 3)
+    else:
+        show_rows(first_row + 3)
+    return "break"  # Evitar el desplazamiento propio de la tabla
 
 def reset_display():
     """Restablecer la interfaz a su estado inicial."""
@@ -67,7 +159,10 @@ def reset_display():
     proposiciones_label.config(text="")  # Limpiar la etiqueta de proposiciones
     proposiciones_result_label.config(text="")  # Limpiar el resultado de las proposiciones
 
+    global current_table
+    current_table = None  # Olvidar la tabla anterior
     table.delete(*table.get_children())  # Limpiar la tabla de verdad
+    scrollbar.set(0, 1)  # Reiniciar la barra de desplazamiento
 
 # Crear la ventana principal
 root = tk.Tk()
@@ -95,8 +190,14 @@ right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10)  # Empaqueta
 tk.Label(left_frame, text="Ingrese una proposición:", font=font_label).pack(pady=5)  # Crear etiqueta de entrada
 
 # Cuadro de entrada
-entry = tk.Entry(left_frame, width=50, font=font_label)  # Crear cuadro de entrada
+entry_var = tk.StringVar()  # Texto del cuadro de entrada (avisa también al pegar texto)
+entry = tk.Entry(left_frame, width=50, font=font_label, textvariable=entry_var)  # Crear cuadro de entrada
 entry.pack(pady=5)  # Empaquetar el cuadro de entrada
+entry_var.trace_add("write", on_edit)  # Analizar en vivo al escribir
+
+# Casilla de análisis en vivo
+live_var = tk.BooleanVar(value=True)  # Análisis en vivo activado por defecto
+tk.Checkbutton(left_frame, text="Análisis en vivo", variable=live_var, font=font_label, command=on_edit).pack()
 
 # Botón de análisis
 tk.Button(left_frame, text="Analizar", command=analyze_proposition, font=font_button, bg="blue", fg="white").pack(pady=10)  # Crear botón de análisis
@@ -127,9 +228,17 @@ proposiciones_label.pack(pady=2)  # Empaquetar etiqueta de proposiciones
 proposiciones_result_label = tk.Label(left_frame, text="", font=font_label, anchor="w", justify="left", wraplength=350)  # Crear etiqueta para el resultado de las proposiciones
 proposiciones_result_label.pack(pady=2)  # Empaquetar resultado de las proposiciones
 
-# Tabla para mostrar la tabla de verdad
-table = ttk.Treeview(right_frame, show="headings")  # Crear tabla para la tabla de verdad
+# Tabla virtual para mostrar la tabla de verdad: solo contiene la página visible
+scrollbar = ttk.Scrollbar(right_frame, orient=tk.VERTICAL, command=on_scroll)  # Crear barra de desplazamiento
+scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)  # Empaquetar barra
+table = ttk.Treeview(right_frame, show="headings", height=PAGE_SIZE)  # Crear tabla para la tabla de verdad
 table.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)  # Empaquetar tabla
+for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):  # Rueda del ratón en Windows, macOS y Linux
+    table.bind(sequence, on_mousewheel)
+
+# Hilo de análisis y revisión periódica de sus resultados
+threading.Thread(target=live.analysis_worker, daemon=True).start()
+root.after(POLL_INTERVAL, poll_results)
 
 # Iniciar el bucle principal
 root.mainloop()  # Iniciar el bucle de la interfaz gráfica
\ No newline at end of file